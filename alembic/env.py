@@ -7,6 +7,7 @@ from alembic import context
 from app.core.database import Base
 from app.config import get_settings
 from app.models.article import Article  # Ensure models are imported
+from app.models.tag import ArticleTag, TermFrequency
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,41 @@
+"""add_content_fingerprint
+
+Revision ID: b6d4e9f1a2c7
+Revises: f3b7d2e8a614
+Create Date: 2026-10-19 18:42:10.530217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d4e9f1a2c7'
+down_revision: Union[str, Sequence[str], None] = 'f3b7d2e8a614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    inspect_obj = sa.inspect(conn)
+    existing_columns = [c['name'] for c in inspect_obj.get_columns('articles')]
+
+    if 'content_fingerprint' not in existing_columns:
+        op.add_column('articles', sa.Column('content_fingerprint', sa.String(length=64), nullable=True))
+        # Same digest as ArticleService.content_fingerprint, so unchanged
+        # articles are not rewritten the next time they are fetched
+        op.execute("""
+            UPDATE articles SET content_fingerprint = encode(sha256(convert_to(concat_ws(chr(31),
+                coalesce(title, ''), coalesce(description, ''), coalesce(content, ''),
+                coalesce(author, ''), coalesce(image_url, '')
+            ), 'UTF8')), 'hex')
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('articles', 'content_fingerprint')
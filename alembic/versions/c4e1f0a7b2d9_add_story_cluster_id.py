@@ -0,0 +1,35 @@
+"""add_story_cluster_id
+
+Revision ID: c4e1f0a7b2d9
+Revises: a030ea163f4d
+Create Date: 2026-10-19 09:12:41.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1f0a7b2d9'
+down_revision: Union[str, Sequence[str], None] = 'a030ea163f4d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    inspect_obj = sa.inspect(conn)
+    existing_columns = [c['name'] for c in inspect_obj.get_columns('articles')]
+
+    if 'story_cluster_id' not in existing_columns:
+        op.add_column('articles', sa.Column('story_cluster_id', sa.Integer(), nullable=True))
+        op.create_index(op.f('ix_articles_story_cluster_id'), 'articles', ['story_cluster_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_articles_story_cluster_id'), table_name='articles')
+    op.drop_column('articles', 'story_cluster_id')
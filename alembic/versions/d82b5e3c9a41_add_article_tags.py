@@ -0,0 +1,52 @@
+"""add_article_tags
+
+Revision ID: d82b5e3c9a41
+Revises: c4e1f0a7b2d9
+Create Date: 2026-10-19 11:40:02.518930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd82b5e3c9a41'
+down_revision: Union[str, Sequence[str], None] = 'c4e1f0a7b2d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    inspect_obj = sa.inspect(conn)
+    existing_tables = inspect_obj.get_table_names()
+
+    if 'article_tags' not in existing_tables:
+        op.create_table(
+            'article_tags',
+            sa.Column('tag', sa.String(length=100), nullable=False),
+            sa.Column('article_id', sa.Integer(), nullable=False),
+            sa.Column('kind', sa.String(length=20), nullable=False),
+            sa.Column('score', sa.Float(), nullable=False),
+            sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('tag', 'article_id'),
+        )
+        op.create_index('idx_article_tags_article', 'article_tags', ['article_id'], unique=False)
+
+    if 'term_frequencies' not in existing_tables:
+        op.create_table(
+            'term_frequencies',
+            sa.Column('term', sa.String(length=100), nullable=False),
+            sa.Column('doc_count', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('term'),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('term_frequencies')
+    op.drop_index('idx_article_tags_article', table_name='article_tags')
+    op.drop_table('article_tags')
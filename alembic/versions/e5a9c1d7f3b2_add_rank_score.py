@@ -0,0 +1,41 @@
+"""add_rank_score
+
+Revision ID: e5a9c1d7f3b2
+Revises: d82b5e3c9a41
+Create Date: 2026-10-19 14:05:37.112846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c1d7f3b2'
+down_revision: Union[str, Sequence[str], None] = 'd82b5e3c9a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    inspect_obj = sa.inspect(conn)
+    existing_columns = [c['name'] for c in inspect_obj.get_columns('articles')]
+    existing_indexes = [i['name'] for i in inspect_obj.get_indexes('articles')]
+
+    if 'rank_score' not in existing_columns:
+        op.add_column('articles', sa.Column('rank_score', sa.Float(), nullable=True))
+    if 'idx_rank_score' not in existing_indexes:
+        op.create_index(
+            'idx_rank_score', 'articles',
+            [sa.text('rank_score DESC NULLS LAST'), sa.text('id DESC')],
+            unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_rank_score', table_name='articles')
+    op.drop_column('articles', 'rank_score')
@@ -0,0 +1,37 @@
+"""add_article_changes_index
+
+Revision ID: f3b7d2e8a614
+Revises: e5a9c1d7f3b2
+Create Date: 2026-10-19 15:22:10.406318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7d2e8a614'
+down_revision: Union[str, Sequence[str], None] = 'e5a9c1d7f3b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    inspect_obj = sa.inspect(conn)
+    existing_indexes = [i['name'] for i in inspect_obj.get_indexes('articles')]
+
+    if 'idx_article_changes' not in existing_indexes:
+        op.create_index(
+            'idx_article_changes', 'articles',
+            [sa.text('coalesce(updated_at, created_at)'), 'id'],
+            unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_article_changes', table_name='articles')
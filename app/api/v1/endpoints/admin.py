@@ -0,0 +1,37 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from app.config import get_settings
+from app.core.cache import CacheManager, get_cache
+from app.core import slow_queries
+from app.schemas.admin import SlowQueries
+
+router = APIRouter()
+settings = get_settings()
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)):
+    # Hidden entirely unless an admin token is configured
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+@router.get("/admin/slow-queries", response_model=SlowQueries, dependencies=[Depends(require_admin)])
+async def list_slow_queries(
+    limit: int = Query(20, ge=1, le=200),
+    order: str = Query("total", pattern="^(total|max|count)$"),
+    cache: CacheManager = Depends(get_cache)
+):
+    """
+    Slowest captured query shapes with their sampled EXPLAIN plans.
+    Empty unless capture is enabled with SLOW_QUERY_THRESHOLD_MS.
+    """
+    shapes = await slow_queries.slowest_shapes(cache.redis, limit=limit, order=order)
+    return SlowQueries(threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS, shapes=shapes)
+
+@router.delete("/admin/slow-queries", status_code=204, dependencies=[Depends(require_admin)])
+async def reset_slow_queries(cache: CacheManager = Depends(get_cache)):
+    """Forget all captured shapes"""
+    await slow_queries.reset(cache.redis)
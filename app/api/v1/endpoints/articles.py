@@ -1,16 +1,34 @@
 from fastapi import APIRouter, Depends, Query, HTTPException, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, timezone
-from math import ceil
 
-from app.core.database import get_db
+from app.core.database import AsyncSessionLocal, get_read_db
 from app.core.cache import CacheManager, get_cache
-from app.services.article_service import ArticleService
-from app.schemas.article import ArticleResponse, PaginatedArticles
-from app.tasks.fetch_articles import fetch_all_sources
+from app.core.logger import get_logger
+from app.core.rate_limit import claim_sync, release_sync
+from app.services.article_service import ArticleService, EPOCH, decode_change_token, encode_change_token
+from app.services.search_cache import build_search_page, search_cache_key, store_search_page
+from app.schemas.article import ArticleChanges, ArticleResponse, PaginatedArticles
+from app.config import get_settings
 
 router = APIRouter()
+settings = get_settings()
+logger = get_logger(__name__)
+
+_similarity_index = None
+
+
+def get_similarity_index():
+    """
+    One memory-mapped view per worker process, reopened when ingestion
+    appends. Created on first use so numpy stays out of API startup.
+    """
+    global _similarity_index
+    if _similarity_index is None:
+        from app.services.similarity_index import SimilarityIndex
+        _similarity_index = SimilarityIndex()
+    return _similarity_index
 
 @router.get("/articles", response_model=PaginatedArticles)
 async def search_articles(
@@ -19,75 +37,142 @@ async def search_articles(
     category: Optional[str] = Query(None, description="Filter by category"),
     from_date: Optional[datetime] = Query(None, description="Start date"),
     to_date: Optional[datetime] = Query(None, description="End date"),
+    tag: Optional[str] = Query(None, description="Filter by extracted keyword or entity"),
+    collapse: bool = Query(False, description="Show one article per near-duplicate story"),
+    sort: str = Query("published", pattern="^(published|ranked)$", description="'published' (newest first) or 'ranked'"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db()),
     cache: CacheManager = Depends(get_cache)
 ):
     """
     Search and filter articles with caching.
     """
-    # Create stable cache key
-    cache_params = f"{query}:{source}:{category}:{from_date}:{to_date}:{page}:{page_size}"
-    import hashlib
-    hash_val = hashlib.md5(cache_params.encode()).hexdigest()
-    cache_key = f"articles:search:{hash_val}"
-    
-    # Try cache
-    cached = await cache.get(cache_key)
-    if cached:
-        return PaginatedArticles(**cached)
-    
-    service = ArticleService(db)
-    skip = (page - 1) * page_size
-    
-    articles, total = await service.search_articles(
+    params = dict(
         query=query,
         source=source,
         category=category,
         from_date=from_date,
         to_date=to_date,
-        skip=skip,
-        limit=page_size
-    )
-    
-    response_data = PaginatedArticles(
-        articles=[ArticleResponse.from_orm(a) for a in articles],
-        total=total,
+        tag=tag,
+        collapse=collapse,
+        sort=sort,
         page=page,
         page_size=page_size,
-        total_pages=ceil(total / page_size) if total > 0 else 0
     )
+    cache_key = search_cache_key(**params)
+    
+    # Try cache
+    cached = await cache.get(cache_key)
+    if cached:
+        return PaginatedArticles(**cached)
     
-    # Set cache (limit to 5 mins for search results)
-    await cache.set(cache_key, response_data.model_dump(mode="json"), ttl=300)
+    response_data = await build_search_page(db, **params)
+    
+    await store_search_page(cache, cache_key, response_data)
     
     return response_data
 
 @router.post("/sync", status_code=202)
-async def trigger_sync():
+async def trigger_sync(cache: CacheManager = Depends(get_cache)):
     """
     Trigger a manual news synchronization in the background.
+    Only one manual sync is queued at a time.
     """
-    # Trigger the Celery task
-    fetch_all_sources.delay()
+    if not await claim_sync(cache.redis):
+        return {"message": "Synchronization already pending", "status": "pending"}
+    
+    # Sent by name: the API never imports the task module, the sources or httpx
+    from app.tasks import celery_app
+    try:
+        celery_app.send_task("fetch_all_sources")
+    except Exception as e:
+        # Nothing was queued: let the next request claim the sync again
+        await release_sync(cache.redis)
+        logger.error("Could not queue manual sync: %s", e)
+        raise HTTPException(status_code=503, detail="Task queue unavailable, try again later")
     return {"message": "Synchronization triggered", "status": "pending"}
 
+@router.get("/articles/changes", response_model=ArticleChanges)
+async def article_changes(
+    since: Optional[str] = Query(None, description="Token from a previous response; omit for a full sync"),
+    limit: int = Query(100, ge=1, le=settings.CHANGES_MAX_LIMIT),
+    # A replica may serve the feed only while its lag fits well inside the
+    # safety window, or rows committed meanwhile would fall behind the cursor
+    db: AsyncSession = Depends(get_read_db(max_lag=settings.CHANGES_SAFETY_LAG_SECONDS / 2))
+):
+    """
+    Articles created or updated since `since`, oldest change first.
+    Keep calling with `next_token` while `has_more` is true.
+    """
+    if since:
+        try:
+            changed_at, last_id = decode_change_token(since)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        changed_at, last_id = EPOCH, 0
+    
+    rows = await ArticleService(db).changes_since(
+        changed_at, last_id, limit=limit + 1, safety_lag_seconds=settings.CHANGES_SAFETY_LAG_SECONDS
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if rows:
+        article, changed_at = rows[-1]
+        last_id = article.id
+    
+    return ArticleChanges(
+        articles=[ArticleResponse.from_orm(article) for article, _ in rows],
+        next_token=encode_change_token(changed_at, last_id),
+        has_more=has_more
+    )
+
 @router.get("/articles/{article_id}", response_model=ArticleResponse)
 async def get_article(
     article_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db())
 ):
     """Get a single article by ID"""
     from sqlalchemy import select
     from app.models.article import Article
     
-    result = await db.execute(
-        select(Article).where(Article.id == article_id)
-    )
-    article = result.scalar_one_or_none()
+    query = select(Article).where(Article.id == article_id)
+    article = (await db.execute(query)).scalar_one_or_none()
+    
+    if not article and db.info.get("replica"):
+        # Ids announced on the live feed can be ahead of the replica
+        async with AsyncSessionLocal() as primary:
+            article = (await primary.execute(query)).scalar_one_or_none()
     
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
     return ArticleResponse.from_orm(article)
+
+
+@router.get("/articles/{article_id}/related", response_model=List[ArticleResponse])
+async def related_articles(
+    article_id: int,
+    limit: int = Query(5, ge=1, le=20),
+    db: AsyncSession = Depends(get_read_db())
+):
+    """
+    Most similar articles, from the precomputed vector index.
+    Only the returned ids are loaded from the database.
+    """
+    from sqlalchemy import select
+    from app.models.article import Article
+    
+    related_ids = await get_similarity_index().related_async(article_id, limit)
+    if related_ids is None:
+        exists = await db.scalar(select(Article.id).where(Article.id == article_id))
+        if not exists:
+            raise HTTPException(status_code=404, detail="Article not found")
+        return []
+    if not related_ids:
+        return []
+    
+    result = await db.execute(select(Article).where(Article.id.in_(related_ids)))
+    by_id = {a.id: a for a in result.scalars().all()}
+    return [ArticleResponse.from_orm(by_id[i]) for i in related_ids if i in by_id]
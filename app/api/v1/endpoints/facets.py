@@ -0,0 +1,22 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.cache import CacheManager, get_cache
+from app.schemas.facets import FacetCounts
+from app.services.facet_service import FacetService
+
+router = APIRouter()
+
+@router.get("/facets", response_model=FacetCounts)
+async def facet_counts(
+    days: int = Query(30, ge=1, le=365, description="Number of recent days in date counts"),
+    day: Optional[date] = Query(None, description="Source/category counts of a single day"),
+    cache: CacheManager = Depends(get_cache)
+):
+    """
+    Article counts per source, category and day for rendering filters.
+    Served from counters maintained at ingest time, not COUNT queries.
+    """
+    return FacetCounts(**await FacetService(cache.redis).get(days=days, day=day))
@@ -0,0 +1,93 @@
+import asyncio
+import json
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.config import get_settings
+from app.services.live_feed import LiveFeedHub
+
+router = APIRouter()
+settings = get_settings()
+
+# One Redis subscription per worker process, shared by all live clients
+hub = LiveFeedHub()
+
+
+async def _events(sources: List[str], categories: List[str]):
+    """
+    SSE frames for one client, with comment heartbeats to keep proxies from
+    timing out. The client is only subscribed once the response starts
+    streaming, so a client that leaves before that never holds a slot.
+    """
+    subscription = hub.subscribe(sources, categories)
+    if subscription is None:
+        # Filled up since the endpoint checked; the client reconnects after `retry`
+        yield f"retry: {settings.LIVE_FEED_HEARTBEAT_SECONDS * 1000}\n\n"
+        return
+    try:
+        yield f"retry: {settings.LIVE_FEED_HEARTBEAT_SECONDS * 1000}\n\n"
+        while True:
+            try:
+                article = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=settings.LIVE_FEED_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"id: {article['id']}\nevent: article\ndata: {json.dumps(article)}\n\n"
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get("/live")
+async def live_feed(
+    source: Optional[List[str]] = Query(None, description="Only these sources (repeatable)"),
+    category: Optional[List[str]] = Query(None, description="Only these categories (repeatable)")
+):
+    """
+    Server-Sent Events stream of newly ingested articles.
+    Each event is the article summary published by the ingestion task.
+    """
+    if hub.client_count >= settings.LIVE_FEED_MAX_CLIENTS:
+        raise HTTPException(status_code=503, detail="Too many live clients, poll /articles instead")
+    return StreamingResponse(
+        _events(source or [], category or []),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/live/ws")
+async def live_feed_ws(
+    websocket: WebSocket,
+    source: Optional[List[str]] = Query(None),
+    category: Optional[List[str]] = Query(None)
+):
+    """WebSocket variant of /live; sends one JSON article per message"""
+    subscription = hub.subscribe(source or [], category or [])
+    if subscription is None:
+        await websocket.close(code=1013)  # Try again later
+        return
+    await websocket.accept()
+
+    async def detect_disconnect():
+        # Clients never send anything; receive() returns once they disconnect
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    disconnected = asyncio.create_task(detect_disconnect())
+    try:
+        while not disconnected.done():
+            getter = asyncio.create_task(subscription.queue.get())
+            done, _ = await asyncio.wait({getter, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                break
+            await websocket.send_json(getter.result())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+        hub.unsubscribe(subscription)
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.core.cache import CacheManager, get_cache
+from app.schemas.suggest import Suggestions
+from app.services.suggest_service import SuggestService
+
+router = APIRouter()
+
+@router.get("/suggest", response_model=Suggestions)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Partially typed query"),
+    limit: int = Query(8, ge=1, le=20),
+    cache: CacheManager = Depends(get_cache)
+):
+    """
+    Keyword and story title completions as the user types.
+    Served from the Redis prefix index; never runs a database search.
+    """
+    return Suggestions(**await SuggestService(cache.redis).suggest(q, limit))
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.config import get_settings
+from app.core.cache import CacheManager, get_cache
+from app.schemas.trending import TrendingKeywords, TrendingStories
+from app.services.trending_service import TrendingService
+
+router = APIRouter()
+settings = get_settings()
+
+@router.get("/trending", response_model=TrendingStories)
+async def trending_stories(
+    limit: int = Query(10, ge=1, le=50),
+    cache: CacheManager = Depends(get_cache)
+):
+    """
+    Story clusters ranked by recent velocity (articles and distinct sources).
+    Precomputed during ingestion, so this never queries the database.
+    """
+    stories = await TrendingService(cache.redis).top(limit)
+    return TrendingStories(window_hours=settings.TRENDING_WINDOW_HOURS, stories=stories)
+
+@router.get("/trending/keywords", response_model=TrendingKeywords)
+async def trending_keywords(
+    limit: int = Query(20, ge=1, le=100),
+    cache: CacheManager = Depends(get_cache)
+):
+    """
+    Extracted keywords and entities ranked by recent velocity.
+    """
+    keywords = await TrendingService(cache.redis).top_keywords(limit)
+    return TrendingKeywords(window_hours=settings.TRENDING_WINDOW_HOURS, keywords=keywords)
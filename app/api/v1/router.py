@@ -1,8 +1,14 @@
-from fastapi import APIRouter
-from app.api.v1.endpoints import articles
+from fastapi import APIRouter, Depends
+from app.api.v1.endpoints import admin, articles, facets, live, suggest, trending
+from app.core.rate_limit import rate_limit
 
-api_router = APIRouter()
+api_router = APIRouter(dependencies=[Depends(rate_limit)])
 api_router.include_router(articles.router, tags=["articles"])
+api_router.include_router(trending.router, tags=["trending"])
+api_router.include_router(facets.router, tags=["facets"])
+api_router.include_router(live.router, tags=["live"])
+api_router.include_router(suggest.router, tags=["suggest"])
+api_router.include_router(admin.router, tags=["admin"])
 
 @api_router.get("/health", tags=["health"])
 async def health_check():
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
+from typing import Dict, List, Optional
 
 class Settings(BaseSettings):
     # App
@@ -11,6 +12,18 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 10
+    # Bootstrap the schema on API startup when the articles table is missing.
+    # Deployments that run `alembic upgrade head` first can turn this off.
+    DB_BOOTSTRAP_SCHEMA: bool = True
+    # Read replicas (JSON list of URLs) serving the read-only endpoints
+    DATABASE_REPLICA_URLS: List[str] = []
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: int = 10
+    DB_REPLICA_CHECK_TIMEOUT_SECONDS: float = 2.0
+    DB_REPLICA_MAX_LAG_SECONDS: float = 30.0  # Lagging replicas are skipped until they catch up
+    # Statement caches. Set both asyncpg caches to 0 behind PgBouncer in transaction mode.
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500  # Prepared statements kept per connection
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg's internal statement cache
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy compiled-SQL cache per engine
     
     # Redis
     REDIS_URL: str
@@ -25,6 +38,106 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: str
     CELERY_RESULT_BACKEND: str
     FETCH_INTERVAL_MINUTES: int = 120
+    METRICS_WORKER_PORT: int = 9540  # Prometheus exporter in Celery workers; 0 disables
+    
+    # Upstream circuit breaker
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 3
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS: int = 300
+    CIRCUIT_BREAKER_MAX_COOLDOWN_SECONDS: int = 3600
+    CIRCUIT_BREAKER_MAX_RETRY_AFTER_SECONDS: int = 90000  # Ceiling for upstream Retry-After (daily quotas)
+    
+    # Intelligence layer
+    READ_TIME_POOL_WORKERS: int = 2  # 0 disables the process pool
+    READ_TIME_POOL_MIN_CHARS: int = 500_000
+    KEYWORDS_PER_ARTICLE: int = 8
+    
+    # Related articles (memory-mapped vector index shared by API workers)
+    SIMILARITY_INDEX_DIR: str = "data/similarity"  # Must be shared by the API and the ingesting processes
+    SIMILARITY_DIM: int = 256
+    SIMILARITY_SEARCH_WINDOW: int = 100_000  # Most recent articles searched per query (~15ms)
+    
+    # Trending
+    TRENDING_WINDOW_HOURS: int = 6
+    TRENDING_HOURLY_DECAY: float = 0.8
+    TRENDING_SOURCE_WEIGHT: float = 2.0  # Extra score per distinct source covering a story
+    TRENDING_REFRESH_MINUTES: int = 10  # Decay the ranking even when no articles arrive
+    
+    # Ranked feed (sort=ranked), materialized in articles.rank_score
+    RANK_HALF_LIFE_HOURS: float = 12.0
+    RANK_WINDOW_HOURS: int = 72  # Older articles are scored 0
+    RANK_CLUSTER_WEIGHT: float = 0.5  # Boost per ln(articles covering the same story)
+    RANK_READ_TIME_WEIGHT: float = 0.3  # Boost for a 10+ minute read
+    RANK_SOURCE_WEIGHTS: Dict[str, float] = {"NYTimes": 1.2, "Guardian": 1.1, "NewsAPI": 0.9}
+    RANK_REFRESH_MINUTES: int = 15
+    
+    # Post-ingestion cache warm-up of hot /articles feeds
+    CACHE_WARMUP_PAGES: int = 2  # First pages of each feed; 0 disables warm-up
+    CACHE_WARMUP_PAGE_SIZE: int = 12  # Page size the frontend requests
+    CACHE_WARMUP_CONCURRENCY: int = 2
+    CACHE_WARMUP_CATEGORIES: List[str] = ["Technology", "Business", "Science", "Sports", "Politics"]
+    CACHE_WARMUP_SOURCES: List[str] = ["NewsAPI", "Guardian", "NYTimes"]
+    
+    # Live feed (SSE / WebSocket), per API worker process
+    LIVE_FEED_MAX_CLIENTS: int = 5000
+    LIVE_FEED_QUEUE_SIZE: int = 100  # Undelivered articles kept per slow client
+    LIVE_FEED_HEARTBEAT_SECONDS: int = 15
+    
+    # Autocomplete prefix index (/suggest)
+    SUGGEST_MAX_PREFIX: int = 12  # Longer queries are matched on their first 12 chars
+    SUGGEST_MAX_PER_PREFIX: int = 50
+    SUGGEST_CLUSTER_BOOST: float = 6.0  # Each extra article on a story counts as 6h fresher
+    SUGGEST_TITLE_DAYS: int = 7
+    
+    # Delta sync (/articles/changes)
+    CHANGES_MAX_LIMIT: int = 500
+    CHANGES_SAFETY_LAG_SECONDS: int = 30  # Longer than any ingest transaction
+    
+    # Slow query capture (API engine); off by default, e.g. 200 to opt in
+    SLOW_QUERY_THRESHOLD_MS: float = 0.0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.2
+    # ANALYZE re-executes the sampled statement on the primary, doubling the
+    # cost of an already slow query; plain EXPLAIN only plans it
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False
+    SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS: int = 600  # At most one EXPLAIN per shape
+    SLOW_QUERY_EXPLAIN_TIMEOUT_MS: int = 10_000
+    SLOW_QUERY_MAX_SHAPES: int = 200
+    
+    # Admin endpoints (X-Admin-Token header); empty disables them
+    ADMIN_TOKEN: str = ""
+    
+    # Logging (queue-based, see app.core.logger)
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = True
+    LOG_LEVELS: Dict[str, str] = {}  # e.g. {"app.services.article_service": "DEBUG"}
+    LOG_SAMPLING: Dict[str, float] = {}  # Fraction of sub-WARNING records kept per logger
+    
+    # Rate limiting and load shedding
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_PER_MINUTE: int = 300  # Per client and route
+    RATE_LIMIT_BURST: int = 60
+    RATE_LIMIT_ROUTES: Dict[str, List[float]] = {  # Route template -> [per minute, burst]
+        "/api/v1/articles": [120, 40],
+        "/api/v1/sync": [2, 2],
+    }
+    RATE_LIMIT_TRUST_FORWARDED: bool = False  # Key clients by X-Forwarded-For behind a proxy
+    LOAD_SHED_POOL_WAIT_MS: int = 250  # Average pool checkout wait that starts shedding; 0 disables
+    LOAD_SHED_WINDOW_SECONDS: int = 5
+    LOAD_SHED_RETRY_AFTER_SECONDS: int = 2
+    SYNC_PENDING_TTL_SECONDS: int = 1800  # Upper bound on a manual sync claim if no worker picks it up
+    
+    # Write-behind ingestion: fetchers queue records on a Redis Stream and
+    # `python -m app.my_script ingest-writer` processes write them in batches
+    INGEST_WRITE_BEHIND: bool = False
+    INGEST_BATCH_SIZE: int = 200
+    INGEST_BATCH_MAX_WAIT_MS: int = 2000
+    INGEST_CLAIM_IDLE_SECONDS: int = 300  # Entries of a stalled writer are taken over after this
+    INGEST_MAX_BACKLOG: int = 20000  # Fetchers pause while this many records are queued
+    INGEST_WRITER_METRICS_PORT: int = 9541  # Prometheus exporter of the writer process; 0 disables
+    
+    # Raw upstream responses archived as gzip files for `python -m app.my_script replay`
+    UPSTREAM_ARCHIVE_DIR: Optional[str] = None  # Unset disables archiving
+    UPSTREAM_ARCHIVE_COMPRESSLEVEL: int = 6
+    ARCHIVE_REPLAY_BATCH_SIZE: int = 5000  # Records per COPY + merge transaction; tagged INGEST_BATCH_SIZE at a time
     
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
@@ -48,6 +161,11 @@ class Settings(BaseSettings):
             
         return v
 
+    @field_validator("DATABASE_REPLICA_URLS")
+    @classmethod
+    def validate_replica_urls(cls, v: List[str]) -> List[str]:
+        return [cls.validate_db_url(url) for url in v]
+
     @field_validator("REDIS_URL", "CELERY_BROKER_URL", "CELERY_RESULT_BACKEND")
     @classmethod
     def validate_redis_url(cls, v: str) -> str:
@@ -2,28 +2,39 @@ import redis.asyncio as redis
 from typing import Optional
 import json
 from app.config import get_settings
+from app.core.logger import get_logger
+from app.core.metrics import cache_tier, observe_cache
 
 settings = get_settings()
+logger = get_logger(__name__)
+
+def create_redis_client(max_connections: int = 10) -> redis.Redis:
+    return redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        max_connections=max_connections
+    )
 
 class CacheManager:
     _redis_client: Optional[redis.Redis] = None
 
-    def __init__(self):
-        if CacheManager._redis_client is None:
-            CacheManager._redis_client = redis.from_url(
-                settings.REDIS_URL, 
-                decode_responses=True,
-                max_connections=10
-            )
-        self.redis = CacheManager._redis_client
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        # Background tasks pass their own client; the API shares one per process
+        if redis_client is None:
+            if CacheManager._redis_client is None:
+                CacheManager._redis_client = create_redis_client()
+            redis_client = CacheManager._redis_client
+        self.redis = redis_client
     
     async def get(self, key: str) -> Optional[dict]:
         """Get cached value"""
         try:
             value = await self.redis.get(key)
+            observe_cache(cache_tier(key), bool(value))
             return json.loads(value) if value else None
         except Exception as e:
-            print(f"Cache Get Error: {e}")
+            logger.error("Cache Get Error: %s", e)
+            observe_cache(cache_tier(key), False)
             return None
     
     async def set(self, key: str, value: dict, ttl: int = None):
@@ -31,16 +42,16 @@ class CacheManager:
         try:
             ttl = ttl or settings.CACHE_TTL
             await self.redis.setex(key, ttl, json.dumps(value))
-            print(f"DEBUG: Cached key {key} for {ttl}s")
+            logger.debug("Cached key %s for %ss", key, ttl)
         except Exception as e:
-            print(f"Cache Set Error: {e}")
+            logger.error("Cache Set Error: %s", e)
     
     async def delete(self, key: str):
         """Delete cached value"""
         try:
             await self.redis.delete(key)
         except Exception as e:
-            print(f"Cache Delete Error: {e}")
+            logger.error("Cache Delete Error: %s", e)
 
 # Dependency
 async def get_cache() -> CacheManager:
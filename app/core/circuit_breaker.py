@@ -0,0 +1,136 @@
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+import redis.asyncio as redis
+
+from app.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+def retry_after_from_headers(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Extract a back-off delay (seconds) from upstream rate-limit headers.
+    Understands `Retry-After` (delta-seconds or HTTP-date) and the common
+    `X-RateLimit-Reset` variants (epoch timestamp or delta-seconds).
+    """
+    now = time.time()
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - now)
+        except (TypeError, ValueError):
+            pass
+
+    reset = headers.get("x-ratelimit-reset")
+    if reset:
+        try:
+            value = float(reset)
+        except ValueError:
+            return None
+        # Large values are absolute epoch timestamps, small ones are deltas
+        return max(0.0, value - now) if value > 1_000_000_000 else value
+
+    return None
+
+
+class CircuitBreaker:
+    """
+    Per-source circuit breaker backed by Redis so concurrent workers agree.
+
+    The circuit opens immediately when an upstream tells us to back off
+    (HTTP 429 / Retry-After) and after `failure_threshold` consecutive
+    failures otherwise. Without an explicit hint the cooldown doubles on
+    every trip, capped at `max_cooldown`. An upstream's Retry-After is
+    honoured up to `max_retry_after`, which is long enough for daily quotas.
+    """
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        failure_threshold: int = None,
+        cooldown: int = None,
+        max_cooldown: int = None,
+        max_retry_after: int = None,
+    ):
+        self.redis = redis_client
+        self.failure_threshold = (
+            settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD if failure_threshold is None else failure_threshold
+        )
+        self.cooldown = settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS if cooldown is None else cooldown
+        self.max_cooldown = settings.CIRCUIT_BREAKER_MAX_COOLDOWN_SECONDS if max_cooldown is None else max_cooldown
+        self.max_retry_after = (
+            settings.CIRCUIT_BREAKER_MAX_RETRY_AFTER_SECONDS if max_retry_after is None else max_retry_after
+        )
+
+    @staticmethod
+    def _key(source: str, suffix: str) -> str:
+        return f"circuit:{source}:{suffix}"
+
+    async def open_for(self, source: str) -> float:
+        """Seconds until the circuit for `source` closes again (0 when closed)"""
+        try:
+            ttl = await self.redis.pttl(self._key(source, "open"))
+            return ttl / 1000 if ttl and ttl > 0 else 0.0
+        except Exception as e:
+            # Fail closed: a Redis outage must not stop ingestion
+            logger.error("Circuit Breaker Error: %s", e)
+            return 0.0
+
+    async def is_open(self, source: str) -> bool:
+        return await self.open_for(source) > 0
+
+    async def record_success(self, source: str):
+        try:
+            await self.redis.delete(self._key(source, "failures"), self._key(source, "trips"))
+        except Exception as e:
+            logger.error("Circuit Breaker Error: %s", e)
+
+    async def record_failure(
+        self,
+        source: str,
+        rate_limited: bool = False,
+        retry_after: Optional[float] = None
+    ) -> bool:
+        """
+        Register a failed upstream call. Returns True if the circuit is now open.
+        Rate limiting trips the circuit straight away, for `retry_after`
+        seconds when the upstream told us how long to wait.
+        """
+        try:
+            if not rate_limited:
+                failures_key = self._key(source, "failures")
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    pipe.incr(failures_key)
+                    pipe.expire(failures_key, self.max_cooldown)
+                    failures, _ = await pipe.execute()
+                if failures < self.failure_threshold:
+                    return False
+
+            trips_key = self._key(source, "trips")
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incr(trips_key)
+                pipe.expire(trips_key, self.max_cooldown * 2)
+                trips, _ = await pipe.execute()
+
+            if retry_after is not None:
+                delay = min(max(retry_after, 1.0), self.max_retry_after)
+            else:
+                delay = min(self.cooldown * (2 ** (trips - 1)), self.max_cooldown)
+
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(self._key(source, "open"), int(time.time() + delay), px=int(delay * 1000))
+                pipe.delete(self._key(source, "failures"))
+                await pipe.execute()
+            logger.warning("Circuit opened for %s for %.0fs", source, delay)
+            return True
+        except Exception as e:
+            logger.error("Circuit Breaker Error: %s", e)
+            return False
@@ -1,25 +1,65 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from typing import Dict, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.config import get_settings
+from app.core.load_shedding import SheddingQueuePool
+from app.core.metrics import TimedAsyncAdaptedQueuePool, instrument_engine
+from app.core.replicas import ReplicaRouter
+from app.core.slow_queries import capture_slow_queries
 
 settings = get_settings()
 
-def create_db_engine(url: str, echo: bool = False, pool_size: int = 5, max_overflow: int = 10):
-    return create_async_engine(
+def create_db_engine(
+    url: str, echo: bool = False, pool_size: int = 5, max_overflow: int = 10, shed_load: bool = False
+):
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args = {
+            # SQLAlchemy's per-connection cache of asyncpg prepared statements
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            # asyncpg's own cache, used for its type introspection queries
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    engine = create_async_engine(
         url,
         echo=echo,
+        # API engines reject checkouts while saturated; background tasks wait
+        poolclass=SheddingQueuePool if shed_load else TimedAsyncAdaptedQueuePool,
         pool_size=pool_size,
         max_overflow=max_overflow,
         pool_pre_ping=True,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args=connect_args,
     )
+    return instrument_engine(engine)
 
 # Global engine for FastAPI
 engine = create_db_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    shed_load=True
 )
+capture_slow_queries(engine)
+
+# Read replicas for read-only endpoints; empty routes every read to the primary
+replica_engines = [
+    create_db_engine(
+        url,
+        echo=settings.DEBUG,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        shed_load=True
+    )
+    for url in settings.DATABASE_REPLICA_URLS
+]
+for replica_engine in replica_engines:
+    capture_slow_queries(replica_engine)
+replica_router = ReplicaRouter(engine, replica_engines)
 
 # Session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -28,6 +68,21 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Sessions of read-only routes: nothing is flushed or committed
+ReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
+_read_only_engines: Dict[AsyncEngine, AsyncEngine] = {}
+
+def read_only(db_engine: AsyncEngine) -> AsyncEngine:
+    """View of `db_engine` whose transactions are BEGIN READ ONLY (same pool)"""
+    if db_engine not in _read_only_engines:
+        _read_only_engines[db_engine] = db_engine.execution_options(postgresql_readonly=True)
+    return _read_only_engines[db_engine]
+
 class Base(DeclarativeBase):
     pass
 
@@ -42,3 +97,28 @@ async def get_db():
             raise
         finally:
             await session.close()
+
+
+def get_read_db(max_lag: Optional[float] = None):
+    """
+    Dependency factory for read-only routes: `Depends(get_read_db())`.
+    Sessions are bound to a replica chosen by `replica_router`, or to the
+    primary when no replica is healthy and within `max_lag` seconds
+    (DB_REPLICA_MAX_LAG_SECONDS by default; 0 always reads the primary).
+    
+    Transactions are read-only and never committed: closing the session
+    returns the connection, whose pool reset ends the transaction.
+    `session.info["replica"]` tells routes where they read from.
+    """
+    async def dependency():
+        chosen = replica_router.engine_for_read(max_lag)
+        session = ReadSessionLocal(bind=read_only(chosen), info={"replica": chosen is not engine})
+        try:
+            yield session
+        except (OperationalError, InterfaceError, OSError):
+            if chosen is not engine:
+                replica_router.mark_down(chosen)
+            raise
+        finally:
+            await session.close()
+    return dependency
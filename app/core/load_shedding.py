@@ -0,0 +1,53 @@
+import time
+
+from app.config import get_settings
+from app.core.metrics import SHED_REQUESTS, TimedAsyncAdaptedQueuePool
+
+settings = get_settings()
+
+EWMA_WEIGHT = 0.2  # Weight of the newest checkout wait
+
+
+class PoolOverloaded(Exception):
+    """Raised instead of queueing for a connection while the pool is saturated"""
+
+
+class SheddingQueuePool(TimedAsyncAdaptedQueuePool):
+    """
+    API connection pool that refuses new checkouts while it is saturated.
+
+    It keeps an exponentially weighted average of recent checkout waits.
+    When every connection (overflow included) is in use and that average
+    passed LOAD_SHED_POOL_WAIT_MS within the last LOAD_SHED_WINDOW_SECONDS,
+    a checkout raises PoolOverloaded (503) at once instead of joining the
+    queue. Requests answered from Redis never check out a connection, so
+    they keep being served. Once the window passes without a slow
+    checkout, requests are let through again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_average = 0.0
+        self._waited_at = 0.0
+
+    def overloaded(self) -> bool:
+        threshold = settings.LOAD_SHED_POOL_WAIT_MS / 1000
+        return (
+            threshold > 0
+            and self.wait_average > threshold
+            and time.monotonic() - self._waited_at < settings.LOAD_SHED_WINDOW_SECONDS
+            and self.checkedin() == 0
+            and 0 <= self._max_overflow <= self.overflow()
+        )
+
+    def _do_get(self):
+        if self.overloaded():
+            SHED_REQUESTS.labels("pool").inc()
+            raise PoolOverloaded(f"Connection pool saturated (average wait {self.wait_average * 1000:.0f}ms)")
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            now = time.perf_counter()
+            self.wait_average += EWMA_WEIGHT * ((now - started) - self.wait_average)
+            self._waited_at = time.monotonic()
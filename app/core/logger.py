@@ -1,20 +1,165 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import random
 import sys
-from typing import Dict, Any
-
-def setup_logging():
-    """Configure structured logging for the application"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RESERVED = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Process-wide logging switches turned off while our pipeline runs
+_LOG_GLOBALS = {"_srcfile": None, "logThreads": False, "logProcesses": False, "logMultiprocessing": False}
+_saved_globals: Dict[str, object] = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; `extra=` fields become top-level keys"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SampledLogger(logging.Logger):
+    """
+    Logger that keeps only a fraction of its sub-WARNING records, per
+    LOG_SAMPLING prefix (longest prefix wins). The decision is taken in
+    isEnabledFor, before a LogRecord is built or guarded debug data is
+    computed. Warnings and errors are never sampled out.
+    """
+
+    def isEnabledFor(self, level: int) -> bool:
+        if not super().isEnabledFor(level):
+            return False
+        if level >= logging.WARNING or not _sampling:
+            return True
+        rate = _sample_rate(self.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+_sampling: Dict[str, float] = {}
+_rate_cache: Dict[str, float] = {}
+
+
+def _sample_rate(name: str) -> float:
+    rate = _rate_cache.get(name)
+    if rate is None:
+        rate = 1.0
+        for prefix, prefix_rate in sorted(_sampling.items(), key=lambda item: -len(item[0])):
+            if name == prefix or name.startswith(prefix + "."):
+                rate = prefix_rate
+                break
+        _rate_cache[name] = rate
+    return rate
+
+
+# Must run before app modules create their loggers
+logging.setLoggerClass(SampledLogger)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records without formatting them; the listener thread does the
+    JSON encoding and the blocking write. Only the message is resolved here
+    so mutable arguments cannot change before the record is written.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def setup_logging(
+    level: Optional[str] = None,
+    levels: Optional[Dict[str, str]] = None,
+    sampling: Optional[Dict[str, float]] = None,
+    json_format: Optional[bool] = None,
+    stream=None
+):
+    """
+    Configure structured logging for the application.
+
+    Every logger writes to an in-memory queue; a single background
+    QueueListener thread formats and writes the records, so logging never
+    blocks the event loop on stdout. Safe to call more than once.
+    Turns off caller/thread/process lookups for every LogRecord in the
+    process until `stop_logging` restores them.
+    """
+    global _listener
+    from app.config import get_settings
+    settings = get_settings()
+
+    level = level or settings.LOG_LEVEL
+    levels = settings.LOG_LEVELS if levels is None else levels
+    sampling = settings.LOG_SAMPLING if sampling is None else sampling
+    json_format = settings.LOG_JSON if json_format is None else json_format
+
+    stop_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(
+        JsonFormatter() if json_format
+        else logging.Formatter('%(asctime)s | %(levelname)-8s | %(name)s | %(message)s')
     )
-    
-    # Set levels for noisy libraries
+
+    _sampling.clear()
+    _sampling.update(sampling)
+    _rate_cache.clear()
+
+    # Caller, thread and process lookups are most of a LogRecord's cost
+    # and none of them are written out
+    _saved_globals.update({name: getattr(logging, name) for name in _LOG_GLOBALS})
+    for name, value in _LOG_GLOBALS.items():
+        setattr(logging, name, value)
+
+    log_queue = queue.SimpleQueue()
+    handler = NonBlockingQueueHandler(log_queue)
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(level)
+
+    # Set levels for noisy libraries, then per-logger overrides
     logging.getLogger("uvicorn.access").setLevel(logging.INFO)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    for name, logger_level in levels.items():
+        logging.getLogger(name).setLevel(logger_level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+@atexit.register
+def stop_logging():
+    """Drain the queue, stop the listener thread and restore logging's globals (also runs at exit)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    for name, value in _saved_globals.items():
+        setattr(logging, name, value)
+    _saved_globals.clear()
+
 
 def get_logger(name: str):
     return logging.getLogger(name)
@@ -0,0 +1,182 @@
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    start_http_server,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Buckets tuned for sub-second API work; upstream calls get their own
+FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+UPSTREAM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time to response start per route",
+    ["method", "route", "status"],
+    buckets=FAST_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups per tier and result",
+    ["tier", "result"],
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time",
+    ["statement"],
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    buckets=FAST_BUCKETS,
+)
+UPSTREAM_LATENCY = Histogram(
+    "upstream_request_duration_seconds",
+    "News API request time including body download",
+    ["source"],
+    buckets=UPSTREAM_BUCKETS,
+)
+UPSTREAM_RESPONSES = Counter(
+    "upstream_responses_total",
+    "News API responses per status code",
+    ["source", "status"],
+)
+UPSTREAM_UNCHANGED = Counter(
+    "upstream_unchanged_total",
+    "News API responses skipped as unchanged (304 or same body fingerprint)",
+    ["source"],
+)
+SHED_REQUESTS = Counter(
+    "shed_requests_total",
+    "Requests rejected by rate limiting or pool load shedding",
+    ["reason"],
+)
+INGESTED_ARTICLES = Counter(
+    "ingested_articles_total",
+    "Fetched articles per source, inserted, updated in place or skipped as duplicates",
+    ["source", "outcome"],
+)
+
+INGEST_BACKLOG = Gauge(
+    "ingest_stream_backlog",
+    "Records queued for the database writers (last observed)",
+    multiprocess_mode="max",
+)
+INGEST_BACKPRESSURE_SECONDS = Counter(
+    "ingest_backpressure_seconds_total",
+    "Time fetchers spent waiting for the ingest backlog to drain",
+)
+INGEST_BATCH_SIZE = Histogram(
+    "ingest_batch_size",
+    "Records per database writer batch",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+INGEST_BATCH_DURATION = Histogram(
+    "ingest_batch_duration_seconds",
+    "Time to write and commit one writer batch",
+    buckets=UPSTREAM_BUCKETS,
+)
+
+
+def cache_tier(key: str) -> str:
+    """Bounded label from a cache key: 'articles:search:<md5>' -> 'articles:search'"""
+    return ":".join(key.split(":", 2)[:2])
+
+
+def observe_cache(tier: str, hit: bool):
+    CACHE_REQUESTS.labels(tier, "hit" if hit else "miss").inc()
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Default async pool that also records how long checkouts wait"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def instrument_engine(engine):
+    """Time every statement through engine events (sync engine underneath asyncio)"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        verb = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else "unknown"
+        DB_QUERY_DURATION.labels(verb).observe(time.perf_counter() - context._query_started)
+
+    return engine
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording time to response start per route
+    template. Streaming responses (SSE) are measured to their first byte,
+    not for the lifetime of the connection.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started = time.perf_counter()
+        recorded = False
+
+        def observe(status):
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"], route.path if route else "unmatched", str(status)
+            ).observe(time.perf_counter() - started)
+
+        async def send_wrapper(message):
+            nonlocal recorded
+            if message["type"] == "http.response.start" and not recorded:
+                recorded = True
+                observe(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            if not recorded:
+                observe(500)
+            raise
+
+
+def _registry():
+    # Gunicorn/prefork setups share metrics through PROMETHEUS_MULTIPROC_DIR
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    from prometheus_client import REGISTRY
+    return REGISTRY
+
+
+def render_metrics():
+    """(body, content type) of the Prometheus text exposition"""
+    return generate_latest(_registry()), CONTENT_TYPE_LATEST
+
+
+def start_exporter(port: int):
+    """Serve /metrics from a background thread (Celery workers)"""
+    start_http_server(port, registry=_registry())
@@ -0,0 +1,110 @@
+from math import ceil
+from typing import Tuple
+
+import redis.asyncio as redis
+from fastapi import HTTPException
+from starlette.requests import HTTPConnection
+
+from app.config import get_settings
+from app.core.cache import CacheManager
+from app.core.logger import get_logger
+from app.core.metrics import SHED_REQUESTS
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+SYNC_PENDING_KEY = "sync:pending"
+
+# Token bucket refilled continuously at ARGV[1] tokens/s up to ARGV[2].
+# Runs atomically in Redis with Redis' clock, so every API worker shares
+# one bucket per key. Returns {allowed, seconds until enough tokens}.
+TOKEN_BUCKET = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {allowed, tostring(wait)}
+"""
+
+
+class RateLimiter:
+    """Per-key token buckets in Redis"""
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self._script = redis_client.register_script(TOKEN_BUCKET)
+
+    async def allow(self, key: str, per_minute: float, burst: int) -> Tuple[bool, float]:
+        """(allowed, retry after seconds) for one request against `key`'s bucket"""
+        allowed, wait = await self._script(keys=[key], args=[per_minute / 60, burst])
+        return bool(int(allowed)), float(wait)
+
+
+def client_id(connection: HTTPConnection) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = connection.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",", 1)[0].strip()
+    return connection.client.host if connection.client else "unknown"
+
+
+async def rate_limit(connection: HTTPConnection):
+    """
+    Router dependency: one token bucket per client and route template.
+    RATE_LIMIT_ROUTES overrides [per minute, burst] for specific routes.
+    Fails open when Redis is unavailable.
+    """
+    if connection.scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED:
+        return
+    route = connection.scope.get("route")
+    path = route.path if route else connection.url.path
+    per_minute, burst = settings.RATE_LIMIT_ROUTES.get(
+        path, (settings.RATE_LIMIT_PER_MINUTE, settings.RATE_LIMIT_BURST)
+    )
+    if per_minute <= 0:
+        return
+
+    try:
+        limiter = RateLimiter(CacheManager().redis)
+        allowed, retry_after = await limiter.allow(f"ratelimit:{path}:{client_id(connection)}", per_minute, int(burst))
+    except Exception as e:
+        logger.warning("Rate limiter unavailable: %s", e)
+        return
+    if not allowed:
+        SHED_REQUESTS.labels("rate_limit").inc()
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(max(1, ceil(retry_after)))}
+        )
+
+
+async def claim_sync(redis_client: redis.Redis) -> bool:
+    """True if no manual sync is pending yet; the fetch task releases the claim when it starts"""
+    try:
+        return bool(await redis_client.set(SYNC_PENDING_KEY, 1, nx=True, ex=settings.SYNC_PENDING_TTL_SECONDS))
+    except Exception as e:
+        logger.warning("Sync dedupe unavailable: %s", e)
+        return True
+
+
+async def release_sync(redis_client: redis.Redis):
+    """Drop the pending-sync claim, e.g. when the task could not be queued"""
+    try:
+        await redis_client.delete(SYNC_PENDING_KEY)
+    except Exception as e:
+        logger.warning("Could not release the sync claim: %s", e)
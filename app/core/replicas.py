@@ -0,0 +1,97 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Seconds the replica is behind; 0 when it has replayed everything it received
+# (an idle primary must not make a caught-up replica look stale) and NULL on a primary
+LAG_QUERY = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+
+@dataclass(eq=False)
+class Replica:
+    engine: AsyncEngine
+    healthy: bool = True
+    lag_seconds: float = 0.0
+    checked_at: float = 0.0
+
+    @property
+    def name(self) -> str:
+        url = self.engine.url
+        return f"{url.host}:{url.port or 5432}"
+
+
+class ReplicaRouter:
+    """
+    Picks the engine for read-only sessions: round robin over healthy
+    replicas, falling back to the primary when none qualifies.
+
+    Health is probed in the background at most every
+    DB_REPLICA_CHECK_INTERVAL_SECONDS, so routing never waits on a probe.
+    A replica is skipped while a probe fails, after a connection error
+    reported through `mark_down`, or while it lags by more than the
+    caller's `max_lag` (DB_REPLICA_MAX_LAG_SECONDS by default).
+    """
+
+    def __init__(self, primary: AsyncEngine, replicas: List[AsyncEngine]):
+        self.primary = primary
+        self.replicas = [Replica(engine) for engine in replicas]
+        self._next = 0
+        self._check: Optional[asyncio.Task] = None
+
+    def engine_for_read(self, max_lag: Optional[float] = None) -> AsyncEngine:
+        if not self.replicas:
+            return self.primary
+        self._schedule_check()
+        max_lag = settings.DB_REPLICA_MAX_LAG_SECONDS if max_lag is None else max_lag
+        candidates = [r for r in self.replicas if r.healthy and r.lag_seconds <= max_lag]
+        if not candidates:
+            return self.primary
+        self._next += 1
+        return candidates[self._next % len(candidates)].engine
+
+    def mark_down(self, engine: AsyncEngine):
+        """Stop routing to `engine` until the next successful probe"""
+        for replica in self.replicas:
+            if replica.engine is engine and replica.healthy:
+                replica.healthy = False
+                logger.warning("Replica %s marked down", replica.name)
+
+    def _schedule_check(self):
+        due = time.monotonic() - settings.DB_REPLICA_CHECK_INTERVAL_SECONDS
+        if (self._check is None or self._check.done()) and any(r.checked_at <= due for r in self.replicas):
+            self._check = asyncio.get_running_loop().create_task(self.check())
+
+    async def check(self):
+        await asyncio.gather(*(self._probe(replica) for replica in self.replicas))
+
+    async def _probe(self, replica: Replica):
+        try:
+            async with replica.engine.connect() as conn:
+                lag = await asyncio.wait_for(
+                    conn.scalar(LAG_QUERY), settings.DB_REPLICA_CHECK_TIMEOUT_SECONDS
+                )
+            replica.lag_seconds = float(lag or 0)
+            if not replica.healthy:
+                logger.info("Replica %s is back (lag %.1fs)", replica.name, replica.lag_seconds)
+            replica.healthy = True
+        except Exception as e:
+            if replica.healthy:
+                logger.warning("Replica %s failed its health check: %s", replica.name, e)
+            replica.healthy = False
+        finally:
+            replica.checked_at = time.monotonic()
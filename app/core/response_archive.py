@@ -0,0 +1,133 @@
+import gzip
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+SUFFIX = ".json.gz"
+READ_CHUNK = 64 * 1024
+
+
+class ArchiveWriter:
+    """
+    One archived response being written. Bytes go to a `.part` file that is
+    renamed into place by `commit()`, so readers never see a partial body.
+    Disk errors are logged and stop archiving this response; they never
+    fail the fetch.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any], compresslevel: int):
+        self.path = path
+        self._part = path.with_name(path.name + ".part")
+        self._file = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self._part, "wb", compresslevel=compresslevel)
+            self._file.write(json.dumps(header).encode() + b"\n")
+        except OSError as e:
+            self._fail(e)
+
+    def write(self, chunk: bytes):
+        if self._file is None:
+            return
+        try:
+            self._file.write(chunk)
+        except OSError as e:
+            self._fail(e)
+
+    def commit(self) -> Optional[Path]:
+        if self._file is None:
+            return None
+        try:
+            self._file.close()
+            os.replace(self._part, self.path)
+        except OSError as e:
+            self._fail(e)
+            return None
+        self._file = None
+        return self.path
+
+    def discard(self):
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._file = None
+        self._part.unlink(missing_ok=True)
+
+    def _fail(self, error: OSError):
+        logger.error("Response Archive Error: %s", error)
+        self.discard()
+
+
+class ResponseArchive:
+    """
+    Raw upstream response bodies on local disk, for replaying into the
+    database without calling the upstream APIs (`my_script.py replay`).
+
+    Layout: <directory>/<source>/<YYYY-MM-DD>/<HHMMSS.ffffff>-<request key>.json.gz
+    Each file is gzip: one JSON header line (source, endpoint, params
+    without credentials, category, fetched_at), then the body as received.
+    Responses found unchanged since the previous poll are not kept.
+    """
+
+    def __init__(self, directory: str, compresslevel: int = 6):
+        self.directory = Path(directory)
+        self.compresslevel = compresslevel
+
+    def open(
+        self,
+        source: str,
+        request_key: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        category: Optional[str] = None
+    ) -> ArchiveWriter:
+        fetched_at = datetime.now(timezone.utc)
+        path = (
+            self.directory / source / fetched_at.strftime("%Y-%m-%d")
+            / f"{fetched_at.strftime('%H%M%S.%f')}-{request_key[:16]}{SUFFIX}"
+        )
+        header = {
+            "source": source,
+            "endpoint": endpoint,
+            "params": {k: str(v) for k, v in params.items()},
+            "category": category,
+            "fetched_at": fetched_at.isoformat(),
+        }
+        return ArchiveWriter(path, header, self.compresslevel)
+
+
+def archive_files(paths: List[str]) -> List[Path]:
+    """Archive files under `paths` (files or directories), oldest first per source and day"""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.extend(path.rglob(f"*{SUFFIX}"))
+        elif path.name.endswith(SUFFIX):
+            found.append(path)
+    return sorted(set(found))
+
+
+def read_archive(path: Path) -> Tuple[Dict[str, Any], Iterator[bytes]]:
+    """(header, body chunks) of one archive file; the file closes once the chunks are consumed"""
+    archive = gzip.open(path, "rb")
+    try:
+        header = json.loads(archive.readline())
+    except Exception:
+        archive.close()
+        raise
+
+    def chunks():
+        with archive:
+            while chunk := archive.read(READ_CHUNK):
+                yield chunk
+
+    return header, chunks()
@@ -0,0 +1,126 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import redis.asyncio as redis
+
+from app.core.logger import get_logger
+from app.core.metrics import UPSTREAM_UNCHANGED, observe_cache
+
+logger = get_logger(__name__)
+
+
+class UpstreamResponseCache:
+    """
+    Remembers a fingerprint (and HTTP validators) of the last body returned
+    for each upstream request so unchanged polls can skip transform and ingest.
+
+    Fingerprints are staged in memory and only written to Redis by `commit()`,
+    after the articles from that response were stored. A failed ingest
+    therefore never causes the same payload to be skipped next time.
+    """
+
+    TTL = 60 * 60 * 24 * 3  # Forget requests we have not polled for 3 days
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self._pending: Dict[str, Dict[str, str]] = {}
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def request_key(endpoint: str, params: Dict[str, Any]) -> str:
+        """Stable identity of an upstream request (endpoint + sorted params)"""
+        payload = json.dumps([endpoint, sorted((k, str(v)) for k, v in params.items())])
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _key(source: str, request_key: str) -> str:
+        return f"upstream:fp:{source}:{request_key}"
+
+    async def conditional_headers(self, source: str, request_key: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for upstreams that sent validators"""
+        try:
+            etag, last_modified = await self.redis.hmget(
+                self._key(source, request_key), "etag", "last_modified"
+            )
+        except Exception as e:
+            logger.error("Response Cache Error: %s", e)
+            return {}
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    async def is_unchanged(
+        self,
+        source: str,
+        request_key: str,
+        response: httpx.Response,
+        fingerprint: Optional[str] = None
+    ) -> bool:
+        """
+        True if the upstream answered 304 or returned the same body as the
+        previous committed poll. Otherwise stages the new fingerprint.
+        """
+        counts = self.counts.setdefault(source, {"requests": 0, "unchanged": 0})
+        counts["requests"] += 1
+
+        unchanged = response.status_code == 304
+        if not unchanged:
+            fingerprint = fingerprint or hashlib.sha256(response.content).hexdigest()
+            try:
+                previous = await self.redis.hget(self._key(source, request_key), "fingerprint")
+            except Exception as e:
+                logger.error("Response Cache Error: %s", e)
+                previous = None
+            unchanged = previous == fingerprint
+
+            if not unchanged:
+                self._pending[self._key(source, request_key)] = {
+                    "fingerprint": fingerprint,
+                    "etag": response.headers.get("etag", ""),
+                    "last_modified": response.headers.get("last-modified", ""),
+                }
+
+        if unchanged:
+            counts["unchanged"] += 1
+            UPSTREAM_UNCHANGED.labels(source).inc()
+        observe_cache("upstream", unchanged)
+        await self._record(source, unchanged)
+        return unchanged
+
+    async def _record(self, source: str, unchanged: bool):
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hincrby(f"upstream:stats:{source}", "requests", 1)
+                if unchanged:
+                    pipe.hincrby(f"upstream:stats:{source}", "unchanged", 1)
+                await pipe.execute()
+        except Exception as e:
+            logger.error("Response Cache Error: %s", e)
+
+    async def commit(self):
+        """Persist fingerprints staged since the last commit"""
+        if not self._pending:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, mapping in self._pending.items():
+                    pipe.hset(key, mapping=mapping)
+                    pipe.expire(key, self.TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.error("Response Cache Error: %s", e)
+        self._pending.clear()
+
+    def discard(self):
+        """Drop staged fingerprints (ingest failed, fetch again next time)"""
+        self._pending.clear()
+
+    def skip_rate(self, source: str) -> Tuple[int, int]:
+        """(unchanged, requests) observed by this instance for `source`"""
+        counts = self.counts.get(source, {"requests": 0, "unchanged": 0})
+        return counts["unchanged"], counts["requests"]
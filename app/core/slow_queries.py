@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import math
+import random
+import re
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import redis.asyncio as redis
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+SHAPES_KEY = "slowq:by_total"
+TTL = 7 * 24 * 3600
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """SQLAlchemy statements are already parameterized; only whitespace varies"""
+    return _WHITESPACE_RE.sub(" ", statement).strip()
+
+
+def _value_shape(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        # Magnitude only: deep OFFSETs plan differently from shallow ones
+        return f"int~1e{int(math.log10(abs(value)))}" if value else "int:0"
+    if isinstance(value, str):
+        if value.startswith("%") and value.endswith("%") and len(value) > 1:
+            return "like:%..%"
+        return "str"
+    if isinstance(value, (datetime, date)):
+        return "datetime"
+    if isinstance(value, (list, tuple)):
+        return f"array[{len(value)}]"
+    return type(value).__name__
+
+
+def params_shape(parameters: Any) -> str:
+    """Types (not values) of the bind parameters, e.g. 'like:%..%, int~1e2'"""
+    if isinstance(parameters, dict):
+        return ", ".join(f"{k}={_value_shape(v)}" for k, v in parameters.items())
+    if isinstance(parameters, (list, tuple)):
+        return ", ".join(_value_shape(v) for v in parameters)
+    return ""
+
+
+class SlowQueryLog:
+    """
+    Records statements slower than SLOW_QUERY_THRESHOLD_MS per query shape
+    (normalized SQL plus parameter shape) in Redis, and samples an `EXPLAIN`
+    plan for slow SELECT shapes, at most once per shape every
+    SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS. With SLOW_QUERY_EXPLAIN_ANALYZE the
+    plan is `EXPLAIN (ANALYZE, BUFFERS)`, which runs the statement again.
+
+    The engine event only measures time; Redis writes and EXPLAIN runs are
+    scheduled on the event loop so the slow request is not slowed further.
+    """
+
+    def __init__(self, engine, redis_factory: Callable[[], redis.Redis]):
+        self.engine = engine
+        self._redis_factory = redis_factory
+        self._tasks = set()
+
+    @property
+    def redis(self) -> redis.Redis:
+        return self._redis_factory()
+
+    def install(self):
+        sync_engine = getattr(self.engine, "sync_engine", self.engine)
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _start(conn, cursor, statement, parameters, context, executemany):
+            context._slow_query_started = time.perf_counter()
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _stop(conn, cursor, statement, parameters, context, executemany):
+            elapsed_ms = (time.perf_counter() - context._slow_query_started) * 1000
+            if elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS and not executemany:
+                self._schedule(statement, parameters, elapsed_ms)
+
+        return self
+
+    def _schedule(self, statement: str, parameters: Any, elapsed_ms: float):
+        if statement.lstrip()[:7].upper() == "EXPLAIN":
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.record(statement, parameters, elapsed_ms))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def record(self, statement: str, parameters: Any, elapsed_ms: float):
+        shape = statement_shape(statement)
+        shape_params = params_shape(parameters)
+        fingerprint = hashlib.md5(f"{shape}|{shape_params}".encode()).hexdigest()[:16]
+        key = f"slowq:shape:{fingerprint}"
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={"statement": shape, "params": shape_params, "last_seen": time.time()})
+                pipe.hincrby(key, "count", 1)
+                pipe.hincrbyfloat(key, "total_ms", elapsed_ms)
+                pipe.hget(key, "max_ms")
+                pipe.expire(key, TTL)
+                pipe.zincrby(SHAPES_KEY, elapsed_ms, fingerprint)
+                pipe.zremrangebyrank(SHAPES_KEY, 0, -(settings.SLOW_QUERY_MAX_SHAPES + 1))
+                pipe.expire(SHAPES_KEY, TTL)
+                results = await pipe.execute()
+            if elapsed_ms > float(results[3] or 0):
+                await self.redis.hset(key, "max_ms", round(elapsed_ms, 3))
+
+            wants_plan = (
+                shape.upper().startswith("SELECT")
+                and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+                and await self.redis.set(
+                    f"slowq:explain_lock:{fingerprint}", 1,
+                    nx=True, ex=settings.SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS
+                )
+            )
+            if wants_plan:
+                plan = await self.explain(statement, parameters)
+                await self.redis.hset(key, mapping={"explain": plan, "explained_at": time.time()})
+        except Exception as e:
+            logger.error("Slow Query Log Error: %s", e)
+
+    async def explain(self, statement: str, parameters: Any) -> str:
+        """Plan a SELECT (or re-run it under EXPLAIN ANALYZE) on its own connection, then roll back"""
+        async with self.engine.connect() as conn:
+            await conn.exec_driver_sql(
+                f"SET LOCAL statement_timeout = {int(settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS)}"
+            )
+            options = "(ANALYZE, BUFFERS) " if settings.SLOW_QUERY_EXPLAIN_ANALYZE else ""
+            result = await conn.exec_driver_sql(f"EXPLAIN {options}{statement}", parameters or ())
+            plan = "\n".join(row[0] for row in result.all())
+            await conn.rollback()
+        return plan
+
+
+async def slowest_shapes(redis_client: redis.Redis, limit: int = 20, order: str = "total") -> List[Dict[str, Any]]:
+    """Captured query shapes, by total time spent ('total'), worst single run ('max') or 'count'"""
+    fingerprints = await redis_client.zrevrange(SHAPES_KEY, 0, -1)
+    if not fingerprints:
+        return []
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for fingerprint in fingerprints:
+            pipe.hgetall(f"slowq:shape:{fingerprint}")
+        rows = await pipe.execute()
+
+    shapes = []
+    for fingerprint, row in zip(fingerprints, rows):
+        if not row:
+            continue
+        count = int(row.get("count", 0))
+        total_ms = float(row.get("total_ms", 0))
+        shapes.append({
+            "fingerprint": fingerprint,
+            "statement": row.get("statement"),
+            "params": row.get("params"),
+            "count": count,
+            "total_ms": round(total_ms, 3),
+            "mean_ms": round(total_ms / count, 3) if count else 0.0,
+            "max_ms": float(row.get("max_ms", 0)),
+            "last_seen": datetime.fromtimestamp(float(row["last_seen"]), timezone.utc) if row.get("last_seen") else None,
+            "explain": row.get("explain"),
+        })
+    sort_key = {"total": "total_ms", "max": "max_ms", "count": "count"}[order]
+    return sorted(shapes, key=lambda shape: -shape[sort_key])[:limit]
+
+
+async def reset(redis_client: redis.Redis):
+    keys = [key async for key in redis_client.scan_iter(match="slowq:*", count=1000)]
+    if keys:
+        await redis_client.unlink(*keys)
+
+
+def capture_slow_queries(engine) -> Optional[SlowQueryLog]:
+    """Install the hook on the API engine when SLOW_QUERY_THRESHOLD_MS > 0"""
+    if settings.SLOW_QUERY_THRESHOLD_MS <= 0:
+        return None
+
+    def shared_redis():
+        from app.core.cache import CacheManager
+        return CacheManager().redis
+
+    return SlowQueryLog(engine, shared_redis).install()
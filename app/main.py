@@ -1,11 +1,15 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from sqlalchemy import text
 from app.api.v1.router import api_router
 from app.config import get_settings
 from app.core.database import engine, Base
+from app.core.load_shedding import PoolOverloaded
+from app.core.metrics import MetricsMiddleware, render_metrics
 from app.models.article import Article  # Load models for Base.metadata
+from app.models.tag import ArticleTag, TermFrequency
 
 from app.core.logger import setup_logging, get_logger
 
@@ -17,11 +21,15 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger.info("Pulse News API Starting up...")
     
-    # This runs on startup
-    async with engine.begin() as conn:
-        # Enable pg_trgm extension for full-text search index
-        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
-        await conn.run_sync(Base.metadata.create_all)
+    # Schema changes belong to Alembic; only an empty database is bootstrapped,
+    # so a new replica costs one catalog lookup instead of a create_all pass
+    if settings.DB_BOOTSTRAP_SCHEMA:
+        async with engine.begin() as conn:
+            if await conn.scalar(text("SELECT to_regclass('articles')")) is None:
+                logger.info("Empty database, creating schema")
+                # Enable pg_trgm extension for full-text search index
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                await conn.run_sync(Base.metadata.create_all)
     yield
 
 settings = get_settings()
@@ -41,9 +49,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(MetricsMiddleware)
+
+@app.exception_handler(PoolOverloaded)
+async def pool_overloaded(request: Request, exc: PoolOverloaded):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service overloaded, retry shortly"},
+        headers={"Retry-After": str(settings.LOAD_SHED_RETRY_AFTER_SECONDS)}
+    )
+
 # Include routers
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to the News Aggregator API", "docs": "/docs"}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from sqlalchemy import Column, Integer, Float, String, DateTime, Text, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -14,6 +14,7 @@ class Article(Base):
     content = Column(Text)
     url = Column(String(2000), unique=True, nullable=False)
     url_hash = Column(String(64), unique=True, index=True)
+    content_fingerprint = Column(String(64))  # Digest of the displayed fields, see ArticleService
     
     # Metadata
     source = Column(String(100), nullable=False, index=True)
@@ -26,6 +27,8 @@ class Article(Base):
     
     # Intelligence Layer
     read_time_minutes = Column(Integer, default=1)
+    story_cluster_id = Column(Integer, index=True)  # Near-duplicate group (id of first article)
+    rank_score = Column(Float)  # Ranked feed score, refreshed by refresh_rank_scores
     
     # Raw data
     raw_data = Column(JSONB)
@@ -38,6 +41,9 @@ class Article(Base):
     __table_args__ = (
         Index('idx_source_published', 'source', 'published_at'),
         Index('idx_category_published', 'category', 'published_at'),
+        Index('idx_rank_score', rank_score.desc().nulls_last(), id.desc()),
+        # Keyset for /articles/changes: (last change, id)
+        Index('idx_article_changes', func.coalesce(updated_at, created_at), id),
         # Note: GIN index for search requires PostgreSQL and pg_trgm extension
         # We'll define it but it might need manual setup in DB for some environments
         Index('idx_article_search', 
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index
+from app.core.database import Base
+
+class ArticleTag(Base):
+    """Inverted index of extracted keywords / entities -> articles"""
+    __tablename__ = "article_tags"
+    
+    tag = Column(String(100), primary_key=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    kind = Column(String(20), nullable=False, default="keyword")  # keyword | entity
+    score = Column(Float, nullable=False, default=0.0)
+    
+    __table_args__ = (
+        Index('idx_article_tags_article', 'article_id'),
+    )
+
+class TermFrequency(Base):
+    """Corpus document frequencies for TF-IDF, updated incrementally at ingest"""
+    __tablename__ = "term_frequencies"
+    
+    # Reserved term holding the total number of documents seen
+    DOCUMENTS = "__documents__"
+    
+    term = Column(String(100), primary_key=True)
+    doc_count = Column(Integer, nullable=False, default=0)
@@ -8,7 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 @click.group()
 def cli():
     """News Aggregator Management CLI"""
-    pass
+    from app.core.logger import setup_logging
+    setup_logging(json_format=False)
 
 @click.command()
 @click.option('--port', default=8000, help='Port to run the API on')
@@ -39,10 +40,118 @@ def fetch():
     results = asyncio.run(_fetch_all_sources_async())
     click.echo(f"Sync complete: {results}")
 
+@click.command(name="reconcile-facets")
+def reconcile_facets():
+    """Rebuild facet counters from the articles table"""
+    import asyncio
+    from app.tasks.maintenance import _reconcile_facets_async
+    click.echo("Rebuilding facet counters...")
+    results = asyncio.run(_reconcile_facets_async())
+    click.echo(f"Reconcile complete: {results}")
+
+@click.command(name="rebuild-similarity-index")
+def rebuild_similarity_index():
+    """Rebuild the related-articles vector index from the database"""
+    import asyncio
+    from app.tasks.maintenance import _rebuild_similarity_index_async
+    click.echo("Rebuilding similarity index...")
+    count = asyncio.run(_rebuild_similarity_index_async())
+    click.echo(f"Indexed {count} articles")
+
+@click.command(name="refresh-rank-scores")
+def refresh_rank_scores():
+    """Recompute ranked feed scores for recent articles"""
+    import asyncio
+    from app.tasks.maintenance import _refresh_rank_scores_async
+    click.echo("Refreshing rank scores...")
+    count = asyncio.run(_refresh_rank_scores_async())
+    click.echo(f"Scored {count} articles")
+
+@click.command(name="rebuild-suggest-index")
+def rebuild_suggest_index():
+    """Rebuild the autocomplete prefix index from the database"""
+    import asyncio
+    from app.tasks.maintenance import _rebuild_suggest_index_async
+    click.echo("Rebuilding suggest index...")
+    results = asyncio.run(_rebuild_suggest_index_async())
+    click.echo(f"Rebuild complete: {results}")
+
+@click.command(name="ingest-writer")
+@click.option('--consumer', default=None, help='Consumer name (default: host-pid)')
+@click.option('--drain', is_flag=True, help='Exit once the ingest stream is empty')
+@click.option('--metrics-port', default=None, type=int, help='Prometheus exporter port (0 disables)')
+def ingest_writer(consumer, drain, metrics_port):
+    """Write queued articles from the ingest stream to the database"""
+    import asyncio
+    from app.config import get_settings
+    from app.tasks.ingest_writer import _run_ingest_writer_async
+    port = get_settings().INGEST_WRITER_METRICS_PORT if metrics_port is None else metrics_port
+    if port:
+        from app.core.metrics import start_exporter
+        start_exporter(port)
+    click.echo("Starting ingest writer...")
+    results = asyncio.run(_run_ingest_writer_async(consumer=consumer, drain=drain))
+    click.echo(f"Ingest writer stopped: {results}")
+
+@click.command()
+@click.argument('paths', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--batch-size', default=None, type=int, help='Records per COPY + merge (default: ARCHIVE_REPLAY_BATCH_SIZE)')
+def replay(paths, batch_size):
+    """Load archived upstream responses (files or directories) into the database"""
+    import asyncio
+    from app.tasks.replay_archive import _replay_archive_async
+    click.echo(f"Replaying archives from {', '.join(paths)}...")
+    results = asyncio.run(_replay_archive_async(list(paths), batch_size=batch_size))
+    click.echo(f"Replay complete: {results}")
+    if results["inserted"]:
+        click.echo("Run reconcile-facets, rebuild-suggest-index, rebuild-similarity-index and refresh-rank-scores next")
+
+@click.command(name="slow-queries")
+@click.option('--limit', default=10, help='Number of query shapes to show')
+@click.option('--order', type=click.Choice(['total', 'max', 'count']), default='total', help='Ranking')
+@click.option('--reset', is_flag=True, help='Forget all captured shapes')
+def slow_queries(limit, order, reset):
+    """Show the slowest captured query shapes and their EXPLAIN plans"""
+    import asyncio
+    from app.core.cache import create_redis_client
+    from app.core import slow_queries as slow_query_log
+
+    async def run():
+        redis_client = create_redis_client(max_connections=1)
+        try:
+            if reset:
+                await slow_query_log.reset(redis_client)
+                return []
+            return await slow_query_log.slowest_shapes(redis_client, limit=limit, order=order)
+        finally:
+            await redis_client.aclose()
+
+    shapes = asyncio.run(run())
+    if reset:
+        click.echo("Slow query log cleared")
+    elif not shapes:
+        click.echo("No slow queries captured")
+    for shape in shapes:
+        click.echo(
+            f"\n[{shape['fingerprint']}] {shape['count']}x  total {shape['total_ms']:.0f}ms  "
+            f"mean {shape['mean_ms']:.1f}ms  max {shape['max_ms']:.1f}ms"
+        )
+        click.echo(f"  params: {shape['params']}")
+        click.echo(f"  {shape['statement']}")
+        if shape['explain']:
+            click.echo("  " + shape['explain'].replace("\n", "\n  "))
+
 cli.add_command(runserver)
 cli.add_command(worker)
 cli.add_command(beat)
 cli.add_command(fetch)
+cli.add_command(reconcile_facets)
+cli.add_command(rebuild_similarity_index)
+cli.add_command(refresh_rank_scores)
+cli.add_command(rebuild_suggest_index)
+cli.add_command(slow_queries)
+cli.add_command(ingest_writer)
+cli.add_command(replay)
 
 if __name__ == '__main__':
     cli()
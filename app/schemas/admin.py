@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, List
+
+class SlowQueryShape(BaseModel):
+    fingerprint: str
+    statement: str
+    params: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    last_seen: Optional[datetime] = None
+    explain: Optional[str] = None
+
+class SlowQueries(BaseModel):
+    threshold_ms: float
+    shapes: List[SlowQueryShape]
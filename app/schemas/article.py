@@ -24,6 +24,7 @@ class ArticleResponse(ArticleBase):
     published_at: datetime
     image_url: Optional[str] = None
     read_time_minutes: Optional[int] = 1
+    story_cluster_id: Optional[int] = None
     
     class Config:
         from_attributes = True
@@ -34,3 +35,8 @@ class PaginatedArticles(BaseModel):
     page: int
     page_size: int
     total_pages: int
+
+class ArticleChanges(BaseModel):
+    articles: List[ArticleResponse]
+    next_token: str  # Pass as `since` to continue; unchanged when nothing is new
+    has_more: bool
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+from typing import Dict
+
+class FacetCounts(BaseModel):
+    sources: Dict[str, int]
+    categories: Dict[str, int]
+    dates: Dict[str, int]
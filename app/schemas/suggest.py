@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import List
+
+class TitleSuggestion(BaseModel):
+    id: int
+    title: str
+
+class Suggestions(BaseModel):
+    keywords: List[str]
+    titles: List[TitleSuggestion]
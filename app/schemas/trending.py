@@ -0,0 +1,31 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, List
+
+class TrendingArticle(BaseModel):
+    id: int
+    title: str
+    url: str
+    source: str
+    category: Optional[str] = None
+    image_url: Optional[str] = None
+    published_at: Optional[datetime] = None
+
+class TrendingStory(BaseModel):
+    cluster_id: int
+    score: float
+    article_count: int
+    source_count: int
+    article: TrendingArticle
+
+class TrendingStories(BaseModel):
+    window_hours: int
+    stories: List[TrendingStory]
+
+class TrendingKeyword(BaseModel):
+    keyword: str
+    score: float
+
+class TrendingKeywords(BaseModel):
+    window_hours: int
+    keywords: List[TrendingKeyword]
@@ -1,13 +1,147 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, and_
+from sqlalchemy import Select, String, any_, bindparam, column, literal_column, select, table, update, or_, and_, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.sql import func
-from typing import List, Optional, Tuple
-from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import base64
+import json
+import logging
 import hashlib
 
+from app.core.logger import get_logger
 from app.models.article import Article
-from app.services.news_sources.base import ArticleData
+from app.models.tag import ArticleTag
 from app.services.intelligence_service import IntelligenceService
+from app.services.ranking_service import rank_score
+
+if TYPE_CHECKING:
+    # Runtime import would pull httpx and ijson into the API process
+    from app.services.news_sources.base import ArticleData, IngestRecord
+
+logger = get_logger(__name__)
+
+# When an article last changed; matches the idx_article_changes expression
+CHANGED_AT = func.coalesce(Article.updated_at, Article.created_at)
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Upstream fields rewritten when an article's content fingerprint changes.
+# Source, category and publication time keep their first-seen values.
+UPDATABLE_FIELDS = ("title", "description", "content", "author", "image_url")
+
+# Columns bulk-loaded by `copy_upsert_records`
+STAGING_TABLE = "article_staging"
+STAGED_COLUMNS = (
+    "url_hash", "content_fingerprint", "title", "description", "content", "url", "source",
+    "author", "category", "published_at", "image_url", "raw_data", "read_time_minutes", "rank_score",
+)
+
+# Category tabs that cover several upstream section names
+CATEGORY_ALIASES = {
+    "sports": ("sports", "sport", "football", "soccer", "tennis", "basketball"),
+    "politics": ("politics", "uk news", "us news", "world news", "society"),
+    "technology": ("technology", "tech"),
+}
+
+@lru_cache(maxsize=256)
+def _search_statements(
+    has_query: bool,
+    has_source: bool,
+    category_group: Optional[str],
+    has_from_date: bool,
+    has_to_date: bool,
+    has_tag: bool,
+    collapse_clusters: bool,
+    sort: str
+) -> Tuple[Select, Select]:
+    """Search statements of one filter shape; values are bound at execution"""
+    conditions = []
+    
+    if has_query:
+        pattern = bindparam("pattern")
+        conditions.append(or_(
+            Article.title.ilike(pattern),
+            Article.description.ilike(pattern)
+        ))
+    
+    if has_source:
+        conditions.append(Article.source == bindparam("source"))
+    
+    if category_group in CATEGORY_ALIASES:
+        conditions.append(or_(*(Article.category.ilike(name) for name in CATEGORY_ALIASES[category_group])))
+    elif category_group:
+        conditions.append(Article.category.ilike(bindparam("category")))
+    
+    if has_from_date:
+        conditions.append(Article.published_at >= bindparam("from_date"))
+    
+    if has_to_date:
+        conditions.append(Article.published_at <= bindparam("to_date"))
+    
+    if has_tag:
+        # Served by the article_tags primary key (tag, article_id)
+        conditions.append(Article.id.in_(
+            select(ArticleTag.article_id).where(ArticleTag.tag == bindparam("tag"))
+        ))
+    
+    if collapse_clusters:
+        # Keep only the newest article of each near-duplicate story cluster
+        cluster_key = func.coalesce(Article.story_cluster_id, Article.id)
+        ranked = select(
+            Article.id,
+            func.row_number().over(
+                partition_by=cluster_key,
+                order_by=Article.published_at.desc()
+            ).label("cluster_rank")
+        )
+        if conditions:
+            ranked = ranked.where(and_(*conditions))
+        ranked = ranked.subquery()
+        conditions = [
+            Article.id.in_(select(ranked.c.id).where(ranked.c.cluster_rank == 1))
+        ]
+    
+    # Count total
+    count_query = select(func.count()).select_from(Article)
+    if conditions:
+        count_query = count_query.where(and_(*conditions))
+    
+    # Get paginated
+    articles_query = select(Article)
+    if conditions:
+        articles_query = articles_query.where(and_(*conditions))
+    
+    if sort == "ranked":
+        # Walks idx_rank_score; the score is materialized on the row
+        order_by = (Article.rank_score.desc().nulls_last(), Article.id.desc())
+    else:
+        order_by = (Article.published_at.desc(),)
+    
+    articles_query = (
+        articles_query
+        .order_by(*order_by)
+        .offset(bindparam("skip"))
+        .limit(bindparam("limit"))
+    )
+    
+    return count_query, articles_query
+
+def encode_change_token(changed_at: datetime, article_id: int) -> str:
+    """Opaque /articles/changes cursor: position after (changed_at, id)"""
+    return base64.urlsafe_b64encode(f"{changed_at.isoformat()}|{article_id}".encode()).decode()
+
+def decode_change_token(token: str) -> Tuple[datetime, int]:
+    """Inverse of `encode_change_token`; raises ValueError on malformed tokens"""
+    try:
+        changed_at, article_id = base64.urlsafe_b64decode(token.encode()).decode().split("|")
+        changed_at = datetime.fromisoformat(changed_at)
+        article_id = int(article_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid change token: {token}") from e
+    if changed_at.tzinfo is None:
+        raise ValueError(f"Invalid change token: {token}")
+    return changed_at, article_id
 
 class ArticleService:
     def __init__(self, db: AsyncSession):
@@ -18,12 +152,23 @@ class ArticleService:
         """Generate SHA256 hash of URL for duplicate detection"""
         return hashlib.sha256(url.encode()).hexdigest()
     
-    async def create_article(self, article_data: ArticleData) -> Optional[Article]:
+    @staticmethod
+    def content_fingerprint(article) -> str:
+        """
+        SHA256 of the fields readers see. Raw upstream payloads and the
+        category (forced per fetch) are left out so they cannot cause rewrites.
+        The content_fingerprint migration backfills the same digest in SQL.
+        """
+        fields = (article.title, article.description, article.content, article.author, article.image_url)
+        return hashlib.sha256("\x1f".join(value or "" for value in fields).encode()).hexdigest()
+    
+    async def create_article(self, article_data: "ArticleData") -> Optional[Article]:
         """
         Create article if it doesn't exist.
-        Returns None if duplicate.
+        Returns None if duplicate; a duplicate whose content changed is updated in place.
         """
         url_hash = self.generate_url_hash(article_data.url)
+        fingerprint = self.content_fingerprint(article_data)
         
         # Check if exists
         result = await self.db.execute(
@@ -32,6 +177,15 @@ class ArticleService:
         existing = result.scalar_one_or_none()
         
         if existing:
+            if existing.content_fingerprint != fingerprint:
+                for field in UPDATABLE_FIELDS:
+                    setattr(existing, field, getattr(article_data, field))
+                existing.raw_data = article_data.raw_data
+                existing.read_time_minutes = IntelligenceService.calculate_read_time(
+                    f"{article_data.description} {article_data.content}"
+                )
+                existing.content_fingerprint = fingerprint
+                await self.db.flush()
             return None
         
         # Intelligence calculations
@@ -51,98 +205,265 @@ class ArticleService:
             published_at=article_data.published_at,
             image_url=article_data.image_url,
             raw_data=article_data.raw_data,
-            read_time_minutes=read_time
+            read_time_minutes=read_time,
+            content_fingerprint=fingerprint
         )
         
         self.db.add(article)
         await self.db.flush()
         return article
     
-    async def search_articles(
+    async def insert_records(self, records: List["IngestRecord"]) -> List[Tuple[int, str]]:
+        """
+        Bulk upsert ingestion records (see `upsert_records`).
+        Returns (id, url_hash) of the rows actually inserted.
+        """
+        inserted, _ = await self.upsert_records(records)
+        return inserted
+    
+    async def upsert_records(
+        self, records: List["IngestRecord"]
+    ) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
+        """
+        Insert new records and rewrite existing ones whose content changed,
+        in a single statement. Returns (inserted, updated) (id, url_hash) pairs.
+        
+        Stored fingerprints are read first, so unchanged duplicates (the
+        usual case) skip read-time computation and are not sent at all. The
+        WHERE on the conflict update repeats the check for rows changed
+        concurrently; a row rewritten there bumps updated_at, which puts it
+        on the /articles/changes feed.
+        """
+        rows = await self._changed_rows(records)
+        if not rows:
+            return [], []
+        return await self._merge(insert(Article).values(rows))
+    
+    async def copy_upsert_records(
+        self, records: List["IngestRecord"]
+    ) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
+        """
+        Bulk-load variant of `upsert_records` for large batches (archive
+        replay): rows are streamed with COPY into a temporary staging table
+        on the session's own asyncpg connection, then merged with one
+        INSERT ... SELECT under the same conflict rules. The staging table
+        is dropped at commit.
+        """
+        rows = await self._changed_rows(records)
+        if not rows:
+            return [], []
+        
+        connection = await self.db.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+        columns = ", ".join(STAGED_COLUMNS)
+        await driver.execute(
+            f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+            f"SELECT {columns} FROM articles WITH NO DATA"
+        )
+        await driver.copy_records_to_table(
+            STAGING_TABLE,
+            columns=list(STAGED_COLUMNS),
+            records=[
+                tuple(json.dumps(row[name], default=str) if name == "raw_data" else row[name] for name in STAGED_COLUMNS)
+                for row in rows
+            ],
+        )
+        staged = table(STAGING_TABLE, *(column(name) for name in STAGED_COLUMNS))
+        return await self._merge(insert(Article).from_select(list(STAGED_COLUMNS), select(staged)))
+    
+    async def _changed_rows(self, records: List["IngestRecord"]) -> List[Dict[str, Any]]:
+        """Article rows for the records that are new or whose content fingerprint changed"""
+        if not records:
+            return []
+        
+        # Last occurrence wins: one statement may not update a row twice
+        by_hash = {self.generate_url_hash(record.url): record for record in records}
+        fingerprints = {url_hash: self.content_fingerprint(record) for url_hash, record in by_hash.items()}
+        result = await self.db.execute(
+            select(Article.url_hash, Article.content_fingerprint)
+            .where(Article.url_hash == any_(bindparam("url_hashes", list(by_hash), type_=ARRAY(String))))
+        )
+        stored = dict(result.all())
+        pending = [
+            (url_hash, record) for url_hash, record in by_hash.items()
+            if url_hash not in stored or stored[url_hash] != fingerprints[url_hash]
+        ]
+        if not pending:
+            return []
+        
+        read_times = await IntelligenceService.calculate_read_time_many(
+            [f"{record.description} {record.content}" for _, record in pending]
+        )
+        
+        rows = []
+        for (url_hash, record), read_time in zip(pending, read_times):
+            row = record.to_row()
+            row["url_hash"] = url_hash
+            row["content_fingerprint"] = fingerprints[url_hash]
+            row["read_time_minutes"] = read_time
+            # Rankable right away; refresh_rank_scores adds cluster size later
+            row["rank_score"] = rank_score(record.source, record.published_at, read_time_minutes=read_time)
+            rows.append(row)
+        return rows
+    
+    async def _merge(self, stmt) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
+        """Run an articles INSERT as an upsert on url_hash; (inserted, updated) pairs"""
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Article.url_hash],
+            set_={
+                **{field: stmt.excluded[field] for field in UPDATABLE_FIELDS},
+                "raw_data": stmt.excluded.raw_data,
+                "read_time_minutes": stmt.excluded.read_time_minutes,
+                "content_fingerprint": stmt.excluded.content_fingerprint,
+                "updated_at": func.now(),
+            },
+            where=Article.content_fingerprint.is_distinct_from(stmt.excluded.content_fingerprint),
+        ).returning(Article.id, Article.url_hash, literal_column("xmax = 0"))
+        result = await self.db.execute(stmt)
+        
+        inserted, updated = [], []
+        for article_id, url_hash, is_insert in result.all():
+            (inserted if is_insert else updated).append((article_id, url_hash))
+        return inserted, updated
+    
+    async def set_story_clusters(self, assignments: Dict[int, int]):
+        """Bulk update story_cluster_id by primary key"""
+        if not assignments:
+            return
+        await self.db.execute(
+            update(Article),
+            [
+                {"id": article_id, "story_cluster_id": cluster_id}
+                for article_id, cluster_id in assignments.items()
+            ]
+        )
+    
+    async def changes_since(
         self,
+        changed_at: datetime = EPOCH,
+        article_id: int = 0,
+        limit: int = 100,
+        safety_lag_seconds: int = 30
+    ) -> List[Tuple[Article, datetime]]:
+        """
+        Articles created or updated after the (changed_at, id) position, in
+        change order, with their change time. A keyset range scan on
+        idx_article_changes, so the cost is proportional to the changes.
+        
+        Rows newer than the safety lag are held back: timestamps are taken at
+        transaction start, so a slow transaction can commit rows older than
+        ones already served and they would be skipped forever.
+        """
+        horizon = datetime.now(timezone.utc) - timedelta(seconds=safety_lag_seconds)
+        result = await self.db.execute(
+            select(Article, CHANGED_AT)
+            .where(
+                tuple_(CHANGED_AT, Article.id) > tuple_(changed_at, article_id),
+                CHANGED_AT <= horizon
+            )
+            .order_by(CHANGED_AT, Article.id)
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+    
+    @staticmethod
+    def search_statements(
         query: Optional[str] = None,
         source: Optional[str] = None,
         category: Optional[str] = None,
         from_date: Optional[datetime] = None,
         to_date: Optional[datetime] = None,
+        tag: Optional[str] = None,
         skip: int = 0,
-        limit: int = 20
-    ) -> Tuple[List[Article], int]:
+        limit: int = 20,
+        collapse_clusters: bool = False,
+        sort: str = "published"
+    ) -> Tuple[Select, Select, Dict[str, Any]]:
         """
-        Search articles with filters.
+        (count, page, parameters) of an article search. The statements come
+        from a per-shape cache and carry bind parameters only, so repeated
+        searches skip statement construction and SQLAlchemy's cache key walk.
         """
-        conditions = []
+        category_group = None
+        if category:
+            category_group = category.lower() if category.lower() in CATEGORY_ALIASES else "other"
+        count_query, articles_query = _search_statements(
+            bool(query), bool(source), category_group, from_date is not None,
+            to_date is not None, bool(tag), collapse_clusters, sort
+        )
         
+        params: Dict[str, Any] = {}
         if query:
-            search_condition = or_(
-                Article.title.ilike(f"%{query}%"),
-                Article.description.ilike(f"%{query}%")
-            )
-            conditions.append(search_condition)
-        
+            params["pattern"] = f"%{query}%"
         if source:
-            conditions.append(Article.source == source)
-        
-        if category:
-            cat_lower = category.lower()
-            if cat_lower == "sports":
-                conditions.append(or_(
-                    Article.category.ilike("sports"),
-                    Article.category.ilike("sport"),
-                    Article.category.ilike("football"),
-                    Article.category.ilike("soccer"),
-                    Article.category.ilike("tennis"),
-                    Article.category.ilike("basketball")
-                ))
-            elif cat_lower == "politics":
-                conditions.append(or_(
-                    Article.category.ilike("politics"),
-                    Article.category.ilike("uk news"),
-                    Article.category.ilike("us news"),
-                    Article.category.ilike("world news"),
-                    Article.category.ilike("society")
-                ))
-            elif cat_lower == "technology":
-                conditions.append(or_(
-                    Article.category.ilike("technology"),
-                    Article.category.ilike("tech")
-                ))
-            else:
-                conditions.append(Article.category.ilike(category))
-        
-        if from_date:
-            conditions.append(Article.published_at >= from_date)
-        
-        if to_date:
-            conditions.append(Article.published_at <= to_date)
-        
-        # Count total
-        count_query = select(func.count()).select_from(Article)
-        if conditions:
-            count_query = count_query.where(and_(*conditions))
+            params["source"] = source
+        if category_group == "other":
+            params["category"] = category
+        if from_date is not None:
+            params["from_date"] = from_date
+        if to_date is not None:
+            params["to_date"] = to_date
+        if tag:
+            params["tag"] = tag.strip().lower()
+        return count_query, articles_query, params
+    
+    @staticmethod
+    def build_search_queries(**filters) -> Tuple[Select, Select]:
+        """
+        (count, page) statements of an article search with the values bound,
+        without executing them. Kept separate so slow filter combinations can
+        be reproduced.
+        """
+        count_query, articles_query, params = ArticleService.search_statements(**filters)
+        page_params = {**params, "skip": filters.get("skip", 0), "limit": filters.get("limit", 20)}
+        return count_query.params(**params), articles_query.params(**page_params)
+    
+    async def search_articles(
+        self,
+        query: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        tag: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 20,
+        collapse_clusters: bool = False,
+        sort: str = "published"
+    ) -> Tuple[List[Article], int]:
+        """
+        Search articles with filters.
+        sort="ranked" orders by the precomputed rank_score instead of recency.
+        """
+        count_query, articles_query, params = self.search_statements(
+            query=query,
+            source=source,
+            category=category,
+            from_date=from_date,
+            to_date=to_date,
+            tag=tag,
+            skip=skip,
+            limit=limit,
+            collapse_clusters=collapse_clusters,
+            sort=sort
+        )
         
-        total_result = await self.db.execute(count_query)
+        total_result = await self.db.execute(count_query, params)
         total = total_result.scalar() or 0
         
-        # Get paginated
-        articles_query = select(Article)
-        if conditions:
-            articles_query = articles_query.where(and_(*conditions))
-        
-        articles_query = (
-            articles_query
-            .order_by(Article.published_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        
-        result = await self.db.execute(articles_query)
+        result = await self.db.execute(articles_query, {**params, "skip": skip, "limit": limit})
         articles = result.scalars().all()
         
-        # Diagnostic Log
-        if articles:
-            sources_found = set(a.source for a in articles)
-            categories_found = set(a.category for a in articles)
-            print(f"DEBUG SEARCH: Found {len(articles)} articles. Sources: {sources_found}, Categories: {categories_found}")
+        # Diagnostic Log (the sets are only built when DEBUG is on)
+        if articles and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Search found %d articles",
+                len(articles),
+                extra={
+                    "total": total,
+                    "sources": sorted({a.source for a in articles}),
+                    "categories": sorted({str(a.category) for a in articles}),
+                }
+            )
         
         return list(articles), total
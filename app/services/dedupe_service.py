@@ -0,0 +1,135 @@
+import hashlib
+import random
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import redis.asyncio as redis
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# MinHash / LSH parameters: 20 bands of 5 rows puts the similarity threshold
+# around 0.55 Jaccard while keeping unrelated pairs (< 0.2) below 1% collisions
+BANDS = 20
+ROWS = 5
+NUM_PERM = BANDS * ROWS
+SHINGLE_SIZE = 2
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)  # Fixed seed: signatures must agree across workers
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_NON_WORD_RE = re.compile(r'[^\w]+')
+# "Headline - BBC News" / "Headline | Reuters" publisher suffixes from aggregators
+_PUBLISHER_SUFFIX_RE = re.compile(r'\s+[-|–]\s+[^-|–]{1,40}$')
+
+
+def normalize(title: str, description: Optional[str] = None) -> List[str]:
+    """Lower-cased word tokens of title + description without markup or publisher suffix"""
+    title = _PUBLISHER_SUFFIX_RE.sub('', title or '')
+    text = f"{title} {_HTML_TAG_RE.sub(' ', description or '')}".lower()
+    return [token for token in _NON_WORD_RE.split(text) if token]
+
+
+def shingles(tokens: Sequence[str], size: int = SHINGLE_SIZE) -> Set[str]:
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def minhash(shingle_set: Set[str]) -> Tuple[int, ...]:
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+        for s in shingle_set
+    ]
+    if not hashes:
+        return ()
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def band_keys(signature: Tuple[int, ...]) -> List[str]:
+    """One LSH bucket key per band; equal keys mean candidate near-duplicates"""
+    if not signature:
+        return []
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(repr(rows).encode(), digest_size=8).hexdigest()
+        keys.append(f"lsh:{band}:{digest}")
+    return keys
+
+
+class StoryClusterService:
+    """
+    Assigns a `story_cluster_id` to newly ingested articles with MinHash LSH.
+
+    Each article's signature is split into bands; each band bucket maps to
+    the cluster of the first article that landed in it. A new article is
+    checked with one MGET of its band buckets, independent of corpus size.
+    Bucket writes are staged until `commit()` so a rolled back batch leaves
+    no clusters pointing at articles that were never stored.
+    """
+
+    TTL = 60 * 60 * 24 * 7  # Stories older than a week no longer attract duplicates
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self._pending: Dict[str, int] = {}
+
+    async def assign_clusters(
+        self,
+        articles: Sequence[Tuple[int, str, Optional[str]]]
+    ) -> Dict[int, int]:
+        """
+        Map each (id, title, description) to a story cluster id.
+        Articles without a near-duplicate start a cluster named after their own id.
+        """
+        keyed = [
+            (article_id, band_keys(minhash(shingles(normalize(title, description)))))
+            for article_id, title, description in articles
+        ]
+        all_keys = list({key for _, keys in keyed for key in keys})
+
+        known: Dict[str, int] = {}
+        if all_keys:
+            try:
+                values = await self.redis.mget(all_keys)
+                known = {key: int(value) for key, value in zip(all_keys, values) if value}
+            except Exception as e:
+                logger.error("Story Cluster Error: %s", e)
+
+        assignments = {}
+        for article_id, keys in keyed:
+            # Earlier articles in this batch count as candidates too
+            candidates = [self._pending.get(key) or known.get(key) for key in keys]
+            candidates = [cluster for cluster in candidates if cluster]
+            cluster_id = min(candidates) if candidates else article_id
+            assignments[article_id] = cluster_id
+            for key in keys:
+                if key not in known:
+                    self._pending.setdefault(key, cluster_id)
+        return assignments
+
+    async def commit(self):
+        """Persist band buckets staged since the last commit"""
+        if not self._pending:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, cluster_id in self._pending.items():
+                    pipe.set(key, cluster_id, ex=self.TTL, nx=True)
+                await pipe.execute()
+        except Exception as e:
+            logger.error("Story Cluster Error: %s", e)
+        self._pending.clear()
+
+    def discard(self):
+        self._pending.clear()
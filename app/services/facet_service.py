@@ -0,0 +1,131 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Sequence
+
+import redis.asyncio as redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from app.models.article import Article
+
+
+class FacetService:
+    """
+    Article counts per source, category and publication day, kept in Redis
+    hashes that ingestion increments as it inserts. Reads are a couple of
+    HGETALL/HMGET calls whose size depends on the number of facet values,
+    never on the size of `articles`. `rebuild` reconciles from Postgres.
+    """
+
+    SOURCE_KEY = "facets:source"
+    CATEGORY_KEY = "facets:category"
+    DATE_KEY = "facets:date"
+    DAY_PREFIX = "facets:day:"  # Per-day hash of "source:<x>" / "category:<y>" fields
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    @staticmethod
+    def _day(published_at: Any) -> str:
+        if isinstance(published_at, str):
+            published_at = datetime.fromisoformat(published_at)
+        if isinstance(published_at, datetime):
+            if published_at.tzinfo:
+                published_at = published_at.astimezone(timezone.utc)
+            return published_at.date().isoformat()
+        return datetime.now(timezone.utc).date().isoformat()
+
+    async def record(self, articles: Sequence[Dict[str, Any]]):
+        """Increment counters for newly inserted articles (`source`, `category`, `published_at`)"""
+        if not articles:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for article in articles:
+                day = self._day(article.get("published_at"))
+                source = article.get("source")
+                category = article.get("category")
+                pipe.hincrby(self.DATE_KEY, day, 1)
+                if source:
+                    pipe.hincrby(self.SOURCE_KEY, source, 1)
+                    pipe.hincrby(f"{self.DAY_PREFIX}{day}", f"source:{source}", 1)
+                if category:
+                    pipe.hincrby(self.CATEGORY_KEY, category, 1)
+                    pipe.hincrby(f"{self.DAY_PREFIX}{day}", f"category:{category}", 1)
+            await pipe.execute()
+
+    async def get(self, days: int = 30, day: Optional[date] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Overall source/category counts plus per-day totals for the last `days`
+        days, or the source/category counts of a single `day`.
+        """
+        if day:
+            fields = await self.redis.hgetall(f"{self.DAY_PREFIX}{day.isoformat()}")
+            facets = {"sources": {}, "categories": {}, "dates": {}}
+            for field, count in fields.items():
+                kind, _, value = field.partition(":")
+                facets["sources" if kind == "source" else "categories"][value] = int(count)
+            facets["dates"][day.isoformat()] = sum(facets["sources"].values())
+            return facets
+
+        today = datetime.now(timezone.utc).date()
+        window = [(today - timedelta(days=offset)).isoformat() for offset in range(days)]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self.SOURCE_KEY)
+            pipe.hgetall(self.CATEGORY_KEY)
+            pipe.hmget(self.DATE_KEY, window)
+            sources, categories, date_counts = await pipe.execute()
+
+        return {
+            "sources": {k: int(v) for k, v in sources.items()},
+            "categories": {k: int(v) for k, v in categories.items()},
+            "dates": {d: int(c) for d, c in zip(window, date_counts) if c},
+        }
+
+    async def rebuild(self, db: AsyncSession) -> Dict[str, int]:
+        """
+        Recount every facet from `articles` and atomically swap the hashes in.
+        Returns how many distinct values were written per facet.
+        """
+        day = func.date(func.timezone("UTC", Article.published_at))
+
+        sources = (await db.execute(
+            select(Article.source, func.count()).group_by(Article.source)
+        )).all()
+        categories = (await db.execute(
+            select(Article.category, func.count())
+            .where(Article.category.is_not(None))
+            .group_by(Article.category)
+        )).all()
+        per_day_sources = (await db.execute(
+            select(day, Article.source, func.count())
+            .where(Article.published_at.is_not(None))
+            .group_by(day, Article.source)
+        )).all()
+        per_day_categories = (await db.execute(
+            select(day, Article.category, func.count())
+            .where(Article.published_at.is_not(None), Article.category.is_not(None))
+            .group_by(day, Article.category)
+        )).all()
+
+        dates: Dict[str, int] = {}
+        days: Dict[str, Dict[str, int]] = {}
+        for d, source, count in per_day_sources:
+            dates[d.isoformat()] = dates.get(d.isoformat(), 0) + count
+            days.setdefault(d.isoformat(), {})[f"source:{source}"] = count
+        for d, category, count in per_day_categories:
+            days.setdefault(d.isoformat(), {})[f"category:{category}"] = count
+
+        stale_days = [key async for key in self.redis.scan_iter(match=f"{self.DAY_PREFIX}*")]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self.SOURCE_KEY, self.CATEGORY_KEY, self.DATE_KEY, *stale_days)
+            if sources:
+                pipe.hset(self.SOURCE_KEY, mapping={s: c for s, c in sources})
+            if categories:
+                pipe.hset(self.CATEGORY_KEY, mapping={c: n for c, n in categories})
+            if dates:
+                pipe.hset(self.DATE_KEY, mapping=dates)
+            for d, mapping in days.items():
+                pipe.hset(f"{self.DAY_PREFIX}{d}", mapping=mapping)
+            await pipe.execute()
+
+        return {"sources": len(sources), "categories": len(categories), "dates": len(dates)}
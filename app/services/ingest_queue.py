@@ -0,0 +1,136 @@
+import asyncio
+import json
+import time
+from dataclasses import fields
+from datetime import datetime
+from typing import List, Sequence, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from app.config import get_settings
+from app.core.logger import get_logger
+from app.core.metrics import INGEST_BACKLOG, INGEST_BACKPRESSURE_SECONDS
+from app.services.news_sources.base import IngestRecord
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+STREAM = "ingest:articles"
+DEAD_STREAM = "ingest:articles:dead"  # Entries no writer could store, with the error
+GROUP = "writers"
+_FIELDS = [f.name for f in fields(IngestRecord)]
+
+
+def encode_record(record: IngestRecord) -> str:
+    values = {name: getattr(record, name) for name in _FIELDS}
+    values["published_at"] = record.published_at.isoformat()
+    return json.dumps(values, default=str)
+
+
+def decode_record(payload: str) -> IngestRecord:
+    values = json.loads(payload)
+    values["published_at"] = datetime.fromisoformat(values["published_at"])
+    return IngestRecord(**values)
+
+
+class IngestQueue:
+    """
+    Write-behind buffer between fetchers and the database writer.
+
+    Fetchers XADD transformed records to a Redis Stream; writers read them
+    through the `writers` consumer group in batches bounded by
+    INGEST_BATCH_SIZE entries or INGEST_BATCH_MAX_WAIT_MS, and XACK + XDEL
+    them only after the batch is committed. Entries of a writer that died
+    mid-batch are claimed by another writer once idle for
+    INGEST_CLAIM_IDLE_SECONDS, so delivery is at-least-once; inserts are
+    idempotent on url_hash. The stream length is the write backlog.
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        # XAUTOCLAIM scans a bounded slice of the pending list per call; resuming
+        # from its cursor keeps entries still owned by live writers at the head
+        # from hiding abandoned ones behind them
+        self._claim_cursor = "0-0"
+
+    async def ensure_group(self):
+        try:
+            await self.redis.xgroup_create(STREAM, GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def backlog(self) -> int:
+        backlog = await self.redis.xlen(STREAM)
+        INGEST_BACKLOG.set(backlog)
+        return backlog
+
+    async def wait_for_room(self):
+        """Backpressure: hold fetchers while the writers are INGEST_MAX_BACKLOG entries behind"""
+        started = time.perf_counter()
+        delay = 0.5
+        while await self.backlog() >= settings.INGEST_MAX_BACKLOG:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 5)
+        waited = time.perf_counter() - started
+        if waited > 0.1:
+            INGEST_BACKPRESSURE_SECONDS.inc(waited)
+            logger.info("Fetcher held %.1fs by the ingest backlog", waited)
+
+    async def push(self, records: Sequence[IngestRecord]):
+        if not records:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for record in records:
+                pipe.xadd(STREAM, {"record": encode_record(record)})
+            await pipe.execute()
+
+    async def read_batch(self, consumer: str) -> List[Tuple[str, str]]:
+        """
+        Up to INGEST_BATCH_SIZE (entry id, payload) pairs: abandoned entries
+        first, then new ones. Blocks up to INGEST_BATCH_MAX_WAIT_MS for the
+        first entry, then at most that long again to fill the batch.
+        """
+        size = settings.INGEST_BATCH_SIZE
+        max_wait = settings.INGEST_BATCH_MAX_WAIT_MS
+        self._claim_cursor, claimed, *_ = await self.redis.xautoclaim(
+            STREAM, GROUP, consumer, settings.INGEST_CLAIM_IDLE_SECONDS * 1000, self._claim_cursor, count=size
+        )
+        entries = [(entry_id, data) for entry_id, data in claimed if data]
+
+        deadline = None
+        while len(entries) < size:
+            block = max_wait
+            if deadline is not None:
+                block = int((deadline - time.monotonic()) * 1000)
+                if block <= 0:
+                    break
+            response = await self.redis.xreadgroup(
+                GROUP, consumer, {STREAM: ">"}, count=size - len(entries), block=block
+            )
+            if not response:
+                break
+            if deadline is None:
+                deadline = time.monotonic() + max_wait / 1000
+            entries.extend(response[0][1])
+        return [(entry_id, data.get("record", "")) for entry_id, data in entries]
+
+    async def ack(self, entry_ids: Sequence[str]):
+        if not entry_ids:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xack(STREAM, GROUP, *entry_ids)
+            pipe.xdel(STREAM, *entry_ids)
+            await pipe.execute()
+
+    async def bury(self, entries: Sequence[Tuple[str, str, str]]):
+        """Move (entry id, payload, error) entries to the dead-letter stream and ack them"""
+        if not entries:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for _, payload, error in entries:
+                pipe.xadd(DEAD_STREAM, {"record": payload, "error": error}, maxlen=10000, approximate=True)
+            pipe.xack(STREAM, GROUP, *(entry_id for entry_id, _, _ in entries))
+            pipe.xdel(STREAM, *(entry_id for entry_id, _, _ in entries))
+            await pipe.execute()
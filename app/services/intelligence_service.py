@@ -1,5 +1,60 @@
+import asyncio
+import multiprocessing
 import re
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+from app.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# Compiled once, shared by every call (and by each process pool worker)
+HTML_TAG_RE = re.compile(r'<[^>]*>')
+WORD_RE = re.compile(r'\w+')
+TRUNCATION_RE = re.compile(r'\[\+(\d+)\s+chars\]')
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def _read_time(text: str) -> int:
+    if not text:
+        return 1
+
+    # 1. Clean HTML tags (important for full-body sources like Guardian)
+    clean_text = HTML_TAG_RE.sub(' ', text)
+
+    # 2. Extract base word count without materializing the word list
+    word_count = sum(1 for _ in WORD_RE.finditer(clean_text))
+
+    # 3. Smart Estimation for truncated content (e.g. NewsAPI "[+2450 chars]")
+    # This looks for the "[+XXXX chars]" pattern at the end of snippets
+    truncation_match = TRUNCATION_RE.search(clean_text)
+    if truncation_match:
+        remaining_chars = int(truncation_match.group(1))
+        # Average English word is ~5 letters + space = 6 chars
+        estimated_extra_words = remaining_chars // 6
+        word_count += estimated_extra_words
+
+    # Average adult reading speed: 200-250 words per minute
+    return max(3, round(word_count / 225))
+
+def _read_times(texts: Sequence[str]) -> List[int]:
+    return [_read_time(text) for text in texts]
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: never fork a process that is running an event loop
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.READ_TIME_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+def _chunks(texts: Sequence[str], parts: int) -> List[Sequence[str]]:
+    size = max(1, -(-len(texts) // parts))
+    return [texts[i:i + size] for i in range(0, len(texts), size)]
 
 class IntelligenceService:
     @staticmethod
@@ -8,27 +63,30 @@ class IntelligenceService:
         Calculate estimated read time in minutes.
         Handles HTML stripping and estimates length for truncated API content.
         """
-        if not text:
-            return 1
-            
-        # 1. Clean HTML tags (important for full-body sources like Guardian)
-        clean_text = re.sub(r'<[^>]*>', ' ', text)
-        
-        # 2. Extract base word count
-        words = re.findall(r'\w+', clean_text)
-        word_count = len(words)
-        
-        # 3. Smart Estimation for truncated content (e.g. NewsAPI "[+2450 chars]")
-        # This looks for the "[+XXXX chars]" pattern at the end of snippets
-        truncation_match = re.search(r'\[\+(\d+)\s+chars\]', clean_text)
-        if truncation_match:
-            remaining_chars = int(truncation_match.group(1))
-            # Average English word is ~5 letters + space = 6 chars
-            estimated_extra_words = remaining_chars // 6
-            word_count += estimated_extra_words
-            
-        # Average adult reading speed: 200-250 words per minute
-        minutes = max(3, round(word_count / 225))
-        return minutes
+        return _read_time(text)
+
+    @staticmethod
+    async def calculate_read_time_many(texts: Sequence[str]) -> List[int]:
+        """
+        Batch version of `calculate_read_time`, same results in the same order.
+        Batches larger than READ_TIME_POOL_MIN_CHARS are split across a
+        process pool so long HTML bodies do not block the event loop.
+        """
+        texts = list(texts)
+        total_chars = sum(len(text) for text in texts if text)
+        if total_chars < settings.READ_TIME_POOL_MIN_CHARS or settings.READ_TIME_POOL_WORKERS < 1:
+            return _read_times(texts)
 
+        loop = asyncio.get_running_loop()
+        try:
+            pool = _get_pool()
+            parts = await asyncio.gather(*[
+                loop.run_in_executor(pool, _read_times, chunk)
+                for chunk in _chunks(texts, settings.READ_TIME_POOL_WORKERS)
+            ])
+        except (OSError, RuntimeError, AssertionError) as e:
+            # e.g. daemonic Celery prefork children cannot start processes
+            logger.warning("Read time pool unavailable, using a thread: %s", e)
+            return await asyncio.to_thread(_read_times, texts)
 
+        return [minutes for part in parts for minutes in part]
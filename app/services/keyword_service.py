@@ -0,0 +1,189 @@
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Integer, String, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.sql import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.tag import ArticleTag, TermFrequency
+from app.services.intelligence_service import HTML_TAG_RE
+
+settings = get_settings()
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had
+has have having he her here hers herself him himself his how i if in into is it its itself just
+me more most my myself no nor not now of off on once only or other our ours ourselves out over own
+said same says she should so some such than that the their theirs them themselves then there these
+they this those through to too under until up very was we were what when where which while who whom
+why will with would you your yours yourself yourselves new one two year years first last get got
+like make made many may might much must news time told us week according people say could
+""".split())
+
+_WORD_RE = re.compile(r"[a-z][a-z'\-]{2,}")
+# Runs of 2-4 capitalized words: "Federal Reserve", "Keir Starmer", "New York City"
+_ENTITY_RE = re.compile(r"\b[A-Z][a-zA-Z'\-]+(?:\s+[A-Z][a-zA-Z'\-]+){1,3}\b")
+
+# Capitalized only because they start a sentence: "In New York" -> "new york"
+_LEADING_NOISE = frozenset("a an the in on at of for and but or as after before with by from to when while if".split())
+
+MAX_TERM_LENGTH = 100
+MAX_CONTENT_CHARS = 20_000  # Keywords come from the lede; long bodies only add noise
+TITLE_WEIGHT = 2  # Title terms count as if they appeared this many times
+ENTITY_WEIGHT = 1.5
+
+
+def tokenize(text: str) -> List[str]:
+    return [
+        token for token in _WORD_RE.findall(text.lower())
+        if token not in STOPWORDS and len(token) <= MAX_TERM_LENGTH
+    ]
+
+
+def entities(text: str) -> List[str]:
+    """Named-entity-like phrases, lower-cased, leading stopwords dropped"""
+    found = []
+    for match in _ENTITY_RE.findall(text):
+        words = match.split()
+        while words and words[0].lower() in _LEADING_NOISE:
+            words = words[1:]
+        if len(words) >= 2:
+            phrase = " ".join(words).lower()
+            if len(phrase) <= MAX_TERM_LENGTH:
+                found.append(phrase)
+    return found
+
+
+def document_terms(title: str, description: Optional[str], content: Optional[str]) -> Counter:
+    """Weighted term counts of one article; entity phrases are kept as single terms"""
+    lede = f"{description or ''} {HTML_TAG_RE.sub(' ', (content or '')[:MAX_CONTENT_CHARS])}"
+    counts = Counter()
+    for token in tokenize(title):
+        counts[token] += TITLE_WEIGHT
+    for token in tokenize(lede):
+        counts[token] += 1
+    for phrase in entities(f"{title}. {description or ''}"):
+        counts[phrase] += ENTITY_WEIGHT
+    return counts
+
+
+def score_batch(
+    docs: Sequence[Counter],
+    corpus_df: Dict[str, int],
+    corpus_docs: int,
+    top_k: int
+) -> Tuple[List[str], np.ndarray, List[List[Tuple[str, float]]]]:
+    """
+    Vectorized TF-IDF over one ingest batch.
+
+    Documents are held as a sparse (docs x vocabulary) CSR matrix, so memory
+    grows with the number of distinct terms per document rather than with
+    docs x vocabulary. Adds the batch document frequencies to the corpus ones
+    and returns (vocabulary, batch df, top_k terms per doc).
+    """
+    vocabulary = sorted({term for doc in docs for term in doc})
+    if not vocabulary:
+        return [], np.zeros(0, dtype=np.int64), [[] for _ in docs]
+    index = {term: i for i, term in enumerate(vocabulary)}
+
+    indptr = np.zeros(len(docs) + 1, dtype=np.int64)
+    np.cumsum([len(doc) for doc in docs], out=indptr[1:])
+    columns = np.fromiter((index[term] for doc in docs for term in doc), dtype=np.int64, count=indptr[-1])
+    counts = np.fromiter((count for doc in docs for count in doc.values()), dtype=np.float32, count=indptr[-1])
+
+    batch_df = np.bincount(columns, minlength=len(vocabulary))
+    df = np.array([corpus_df.get(term, 0) for term in vocabulary], dtype=np.float32) + batch_df
+    total_docs = corpus_docs + len(docs)
+
+    # Sublinear tf, smoothed idf
+    idf = np.log((1 + total_docs) / (1 + df)) + 1
+    scores = np.log1p(counts) * idf[columns]
+
+    results = []
+    for row in range(len(docs)):
+        row_columns = columns[indptr[row]:indptr[row + 1]]
+        row_scores = scores[indptr[row]:indptr[row + 1]]
+        k = min(top_k, len(row_scores))
+        if k == 0:
+            results.append([])
+            continue
+        top = np.argpartition(-row_scores, k - 1)[:k]
+        ranked = sorted(top, key=lambda i: (-row_scores[i], row_columns[i]))
+        results.append([
+            (vocabulary[row_columns[i]], float(row_scores[i]))
+            for i in ranked if row_scores[i] > 0
+        ])
+    return vocabulary, batch_df, results
+
+
+class KeywordService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def tag_articles(
+        self,
+        articles: Sequence[Tuple[int, str, Optional[str], Optional[str]]]
+    ) -> Dict[int, List[str]]:
+        """
+        Extract top keywords and entities for (id, title, description, content)
+        tuples, store them in `article_tags` and fold the batch into the corpus
+        document frequencies. Returns the tags per article id.
+        """
+        if not articles:
+            return {}
+
+        docs = [document_terms(title, description, content) for _, title, description, content in articles]
+        vocabulary = sorted({term for doc in docs for term in doc})
+        if not vocabulary:
+            return {}
+
+        # Array parameters keep this to one bind param however large the vocabulary
+        result = await self.db.execute(
+            select(TermFrequency.term, TermFrequency.doc_count)
+            .where(TermFrequency.term == any_(
+                bindparam("terms", vocabulary + [TermFrequency.DOCUMENTS], type_=ARRAY(String))
+            ))
+        )
+        corpus_df = dict(result.all())
+        corpus_docs = corpus_df.pop(TermFrequency.DOCUMENTS, 0)
+
+        vocabulary, batch_df, top_terms = score_batch(
+            docs, corpus_df, corpus_docs, settings.KEYWORDS_PER_ARTICLE
+        )
+
+        # Sorted terms give concurrent writers a consistent lock order
+        stmt = insert(TermFrequency).from_select(
+            ["term", "doc_count"],
+            select(
+                func.unnest(bindparam("df_terms", [TermFrequency.DOCUMENTS] + vocabulary, type_=ARRAY(String))),
+                func.unnest(bindparam("df_counts", [len(docs)] + batch_df.tolist(), type_=ARRAY(Integer))),
+            )
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TermFrequency.term],
+                set_={"doc_count": TermFrequency.doc_count + stmt.excluded.doc_count}
+            )
+        )
+
+        tags = {}
+        tag_rows = []
+        for (article_id, *_), terms in zip(articles, top_terms):
+            tags[article_id] = [term for term, _ in terms]
+            tag_rows.extend(
+                {
+                    "tag": term,
+                    "article_id": article_id,
+                    "kind": "entity" if " " in term else "keyword",
+                    "score": round(score, 4),
+                }
+                for term, score in terms
+            )
+        if tag_rows:
+            await self.db.execute(insert(ArticleTag).values(tag_rows).on_conflict_do_nothing())
+        return tags
@@ -0,0 +1,125 @@
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set
+
+import redis.asyncio as redis
+
+from app.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+CHANNEL = "articles:live"
+
+
+class LiveFeedPublisher:
+    """
+    Read-model hook that announces newly committed articles on a Redis
+    pub/sub channel. One message per ingest batch keeps publishing O(1)
+    round trips regardless of how many API workers are listening.
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    async def record(self, articles: Sequence[Dict[str, Any]]):
+        if articles:
+            await self.redis.publish(CHANNEL, json.dumps(list(articles)))
+
+
+@dataclass(eq=False)
+class Subscription:
+    """One connected client: its filters and a bounded outbox"""
+    sources: FrozenSet[str] = frozenset()
+    categories: FrozenSet[str] = frozenset()
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(settings.LIVE_FEED_QUEUE_SIZE))
+    dropped: int = 0
+
+    def wants(self, article: Dict[str, Any]) -> bool:
+        if self.sources and article.get("source") not in self.sources:
+            return False
+        if self.categories and (article.get("category") or "").lower() not in self.categories:
+            return False
+        return True
+
+
+class LiveFeedHub:
+    """
+    Per-process fan-out of the live channel.
+
+    A single Redis subscription per API worker is shared by every SSE and
+    WebSocket client; each client only costs an asyncio queue, so idle
+    connections are a few KB each and never hold a Redis connection. The
+    listener starts with the first client and stops after the last leaves.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        self._redis = redis_client
+        self._subscriptions: Set[Subscription] = set()
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def client_count(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, sources: Sequence[str] = (), categories: Sequence[str] = ()) -> Optional[Subscription]:
+        """Register a client, or return None when this worker is at capacity"""
+        if len(self._subscriptions) >= settings.LIVE_FEED_MAX_CLIENTS:
+            return None
+        subscription = Subscription(
+            sources=frozenset(s for s in sources if s),
+            categories=frozenset(c.lower() for c in categories if c),
+        )
+        self._subscriptions.add(subscription)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions.discard(subscription)
+        if not self._subscriptions and self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    def publish_local(self, articles: List[Dict[str, Any]]):
+        """Fan a batch out to matching clients; slow clients lose messages, not the worker"""
+        for subscription in self._subscriptions:
+            for article in articles:
+                if not subscription.wants(article):
+                    continue
+                try:
+                    subscription.queue.put_nowait(article)
+                except asyncio.QueueFull:
+                    subscription.dropped += 1
+
+    async def _listen(self):
+        if self._redis is None:
+            from app.core.cache import CacheManager
+            self._redis = CacheManager().redis
+
+        backoff = 1
+        while self._subscriptions:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(CHANNEL)
+                backoff = 1
+                async for message in pubsub.listen():
+                    try:
+                        articles = json.loads(message["data"])
+                    except (TypeError, ValueError) as e:
+                        logger.warning("Live Feed Error: bad message: %s", e)
+                        continue
+                    self.publish_local(articles)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Live Feed Error: %s. Resubscribing in %ss", e, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
+import time
+import httpx
 from pydantic import BaseModel
 
+from app.core.circuit_breaker import retry_after_from_headers
+from app.core.logger import get_logger
+from app.core.metrics import UPSTREAM_LATENCY, UPSTREAM_RESPONSES
+from app.core.response_archive import ResponseArchive
+from app.core.response_cache import UpstreamResponseCache
+from .streaming import ItemStreamParser
+
+logger = get_logger(__name__)
+
 class ArticleData(BaseModel):
     """Standardized article format from any source"""
     title: str
@@ -16,35 +28,272 @@ class ArticleData(BaseModel):
     image_url: Optional[str] = None
     raw_data: Dict[str, Any]
 
+def _clean_text(value: Any, max_length: Optional[int] = None) -> Optional[str]:
+    """Strip surrounding whitespace, map blank values to None and truncate"""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        value = str(value)
+    value = value.strip()
+    if not value:
+        return None
+    return value[:max_length] if max_length else value
+
+def _parse_timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return datetime.now(timezone.utc)
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+@dataclass(slots=True)
+class IngestRecord:
+    """
+    Lightweight article record for the ingestion hot path.
+    
+    Skips Pydantic validation; use `from_upstream` to build one from untrusted
+    upstream values and `to_article_data` to get the public ArticleData schema.
+    """
+    title: str
+    url: str
+    source: str
+    published_at: datetime
+    description: Optional[str] = None
+    content: Optional[str] = None
+    author: Optional[str] = None
+    category: Optional[str] = None
+    image_url: Optional[str] = None
+    raw_data: Dict[str, Any] = field(default_factory=dict)
+    
+    # Column limits of the articles table
+    MAX_TITLE = 500
+    MAX_URL = 2000
+    MAX_AUTHOR = 500
+    MAX_CATEGORY = 100
+    
+    @classmethod
+    def from_upstream(
+        cls,
+        title: Any,
+        url: Any,
+        source: str,
+        published_at: Any = None,
+        description: Any = None,
+        content: Any = None,
+        author: Any = None,
+        category: Any = None,
+        image_url: Any = None,
+        raw_data: Optional[Dict[str, Any]] = None
+    ) -> "IngestRecord":
+        """Validate and normalize untrusted upstream values. Raises ValueError."""
+        title = _clean_text(title, cls.MAX_TITLE)
+        url = _clean_text(url)
+        if not title or not url:
+            raise ValueError(f"Missing title or URL in {source} article")
+        if len(url) > cls.MAX_URL:
+            raise ValueError(f"URL too long in {source} article")
+        
+        image_url = _clean_text(image_url)
+        if image_url and len(image_url) > cls.MAX_URL:
+            image_url = None
+        
+        return cls(
+            title=title,
+            url=url,
+            source=source,
+            published_at=_parse_timestamp(published_at),
+            description=_clean_text(description),
+            content=_clean_text(content),
+            author=_clean_text(author, cls.MAX_AUTHOR),
+            category=_clean_text(category, cls.MAX_CATEGORY),
+            image_url=image_url,
+            raw_data=raw_data if isinstance(raw_data, dict) else {},
+        )
+    
+    def to_article_data(self) -> ArticleData:
+        return ArticleData(
+            title=self.title,
+            description=self.description,
+            content=self.content,
+            url=self.url,
+            source=self.source,
+            author=self.author,
+            category=self.category,
+            published_at=self.published_at,
+            image_url=self.image_url,
+            raw_data=self.raw_data,
+        )
+    
+    def to_row(self) -> Dict[str, Any]:
+        """Column values for a bulk insert into `articles`"""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "content": self.content,
+            "url": self.url,
+            "source": self.source,
+            "author": self.author,
+            "category": self.category,
+            "published_at": self.published_at,
+            "image_url": self.image_url,
+            "raw_data": self.raw_data,
+        }
+
+class SourceRateLimited(Exception):
+    """Raised when an upstream API throttles us (HTTP 429)"""
+    
+    def __init__(self, source_name: str, retry_after: Optional[float] = None):
+        self.source_name = source_name
+        self.retry_after = retry_after
+        super().__init__(
+            f"{source_name} rate limit hit"
+            + (f", retry after {retry_after:.0f}s" if retry_after is not None else "")
+        )
+
 class NewsSourceBase(ABC):
     """Abstract base class for all news sources"""
     
-    def __init__(self, api_key: str):
+    # Query params that do not identify a request (credentials, rolling windows)
+    VOLATILE_PARAMS: Tuple[str, ...] = ()
+    
+    # ijson prefix of the article array in the upstream payload
+    ITEMS_PATH: str = "item"
+    
+    # Minimal upstream fields kept per article, see streaming.project.
+    # This projection is also what ends up in articles.raw_data.
+    ITEM_FIELDS: Dict[str, Any] = {}
+    
+    def __init__(
+        self,
+        api_key: str,
+        response_cache: Optional[UpstreamResponseCache] = None,
+        archive: Optional[ResponseArchive] = None
+    ):
         self.api_key = api_key
         self.source_name = self.__class__.__name__
+        self.response_cache = response_cache
+        self.archive = archive
+    
+    async def _fetch_items(
+        self, endpoint: str, params: Dict[str, Any], category: Optional[str] = None
+    ) -> Optional[List[Dict]]:
+        """
+        GET `endpoint` and stream-parse the article items out of the body,
+        keeping only ITEM_FIELDS of each one. With an archive configured the
+        raw body is also written to disk as it streams, along with `category`
+        (the argument of fetch_records) for replay.
+        
+        Returns None when the body is unchanged since the previous poll of the
+        same request (HTTP 304 or identical fingerprint), so callers can skip
+        transform and ingest entirely.
+        """
+        cache = self.response_cache
+        identity = {k: v for k, v in params.items() if k not in self.VOLATILE_PARAMS}
+        request_key = UpstreamResponseCache.request_key(endpoint, identity)
+        headers = {}
+        if cache:
+            headers = await cache.conditional_headers(self.source_name, request_key)
+        
+        parser = ItemStreamParser(self.ITEMS_PATH, self.ITEM_FIELDS)
+        writer = None
+        started = time.perf_counter()
+        status = "error"
+        try:
+            async with httpx.AsyncClient() as client:
+                async with client.stream("GET", endpoint, params=params, headers=headers, timeout=30.0) as response:
+                    status = str(response.status_code)
+                    if response.status_code == 429:
+                        raise SourceRateLimited(self.source_name, retry_after_from_headers(response.headers))
+                    if response.status_code != 304:
+                        response.raise_for_status()
+                        if self.archive:
+                            writer = self.archive.open(self.source_name, request_key, endpoint, identity, category)
+                        async for chunk in response.aiter_bytes():
+                            parser.feed(chunk)
+                            if writer:
+                                writer.write(chunk)
+            items = parser.close()
+        except BaseException:
+            if writer:
+                writer.discard()
+            raise
+        finally:
+            UPSTREAM_LATENCY.labels(self.source_name).observe(time.perf_counter() - started)
+            UPSTREAM_RESPONSES.labels(self.source_name, status).inc()
+        
+        unchanged = cache is not None and await cache.is_unchanged(
+            self.source_name, request_key, response, fingerprint=parser.fingerprint
+        )
+        if writer:
+            if unchanged:
+                # Adds nothing over the archive file of the previous poll
+                writer.discard()
+            else:
+                writer.commit()
+        if unchanged:
+            return None
+        return items
     
-    @abstractmethod
     async def fetch_articles(
         self,
         query: Optional[str] = None,
         category: Optional[str] = None,
         from_date: Optional[datetime] = None,
-        page_size: int = 100
+        page_size: Optional[int] = None
     ) -> List[ArticleData]:
         """
         Fetch articles from the news source.
         
         Returns standardized ArticleData objects.
+        Raises SourceRateLimited when the upstream throttles us.
+        """
+        kwargs = {"page_size": page_size} if page_size else {}
+        records = await self.fetch_records(query=query, category=category, from_date=from_date, **kwargs)
+        return [record.to_article_data() for record in records]
+    
+    @abstractmethod
+    async def fetch_records(
+        self,
+        query: Optional[str] = None,
+        category: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        page_size: int = 100
+    ) -> List[IngestRecord]:
+        """
+        Fetch articles as lightweight IngestRecords (ingestion hot path).
+        
+        Items that fail validation are skipped.
+        Raises SourceRateLimited when the upstream throttles us.
         """
         pass
     
     @abstractmethod
-    def _transform_article(self, raw_article: Dict) -> ArticleData:
+    def _transform_record(self, raw_article: Dict) -> IngestRecord:
         """
-        Transform source-specific article format to standardized ArticleData.
+        Transform source-specific article format to an IngestRecord.
+        Raises ValueError for unusable items.
         """
         pass
     
+    def _transform_article(self, raw_article: Dict, *args) -> ArticleData:
+        """
+        Transform source-specific article format to standardized ArticleData.
+        """
+        return self._transform_record(raw_article, *args).to_article_data()
+    
+    def transform_archived(self, items: List[Dict], category: Optional[str] = None) -> List[IngestRecord]:
+        """Records from archived items, as `fetch_records(category=category)` returned them"""
+        return self._transform_items(items)
+    
+    def _transform_items(self, items: List[Dict], *args) -> List[IngestRecord]:
+        records = []
+        for raw in items:
+            try:
+                records.append(self._transform_record(raw, *args))
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.warning("Skipping %s article: %s", self.source_name, e)
+        return records
+    
     @property
     @abstractmethod
     def rate_limit_delay(self) -> float:
@@ -1,27 +1,35 @@
-import httpx
 from typing import List, Optional, Dict
-from datetime import datetime, timezone
-from .base import NewsSourceBase, ArticleData
+from datetime import datetime
+from .base import NewsSourceBase, IngestRecord
 
 class GuardianSource(NewsSourceBase):
     BASE_URL = "https://content.guardianapis.com"
+    VOLATILE_PARAMS = ("api-key",)
+    ITEMS_PATH = "response.results.item"
+    ITEM_FIELDS = {
+        "webTitle": True,
+        "webUrl": True,
+        "webPublicationDate": True,
+        "sectionName": True,
+        "fields": {"trailText": True, "body": True, "byline": True, "thumbnail": True},
+    }
     
     @property
     def rate_limit_delay(self) -> float:
         return 0.5  # 2 requests per second
     
-    async def fetch_articles(
+    async def fetch_records(
         self,
         query: Optional[str] = None,
         category: Optional[str] = None,
         from_date: Optional[datetime] = None,
         page_size: int = 50
-    ) -> List[ArticleData]:
+    ) -> List[IngestRecord]:
         
         params = {
             "api-key": self.api_key,
             "page-size": min(page_size, 50),
-            "show-fields": "all",
+            "show-fields": ",".join(self.ITEM_FIELDS["fields"]),
         }
         
         if query:
@@ -37,39 +45,24 @@ class GuardianSource(NewsSourceBase):
             
         endpoint = f"{self.BASE_URL}/search"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(endpoint, params=params, timeout=30.0)
-            response.raise_for_status()
-            data = response.json()
-            
-        results = data.get("response", {}).get("results", [])
+        results = await self._fetch_items(endpoint, params, category)
+        if results is None:
+            return []  # Unchanged since the last poll
         
-        return [
-            self._transform_article(article) 
-            for article in results
-        ]
+        return self._transform_items(results)
     
-    def _transform_article(self, raw: Dict) -> ArticleData:
-        fields = raw.get("fields", {})
-        
-        # Require title and URL
-        title = raw.get("webTitle")
-        url = raw.get("webUrl")
+    def _transform_record(self, raw: Dict) -> IngestRecord:
+        fields = raw.get("fields") or {}
         
-        if not title or not url:
-            raise ValueError("Missing title or URL in Guardian article")
-
-        return ArticleData(
-            title=title,
+        return IngestRecord.from_upstream(
+            title=raw.get("webTitle"),
             description=fields.get("trailText"),
             content=fields.get("body"),
-            url=url,
+            url=raw.get("webUrl"),
             source="Guardian",
             author=fields.get("byline"),
             category=raw.get("sectionName"),
-            published_at=datetime.fromisoformat(
-                raw.get("webPublicationDate", datetime.now(timezone.utc).isoformat()).replace("Z", "+00:00")
-            ),
+            published_at=raw.get("webPublicationDate"),
             image_url=fields.get("thumbnail"),
             raw_data=raw
         )
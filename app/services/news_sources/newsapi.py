@@ -1,22 +1,34 @@
-import httpx
 from typing import List, Optional, Dict
-from datetime import datetime, timezone
-from .base import NewsSourceBase, ArticleData
+from datetime import datetime
+from .base import NewsSourceBase, IngestRecord
 
 class NewsAPISource(NewsSourceBase):
     BASE_URL = "https://newsapi.org/v2"
+    VOLATILE_PARAMS = ("apiKey", "from")
+    ITEMS_PATH = "articles.item"
+    # NewsAPI has no field selection, so we can only trim after parsing
+    ITEM_FIELDS = {
+        "title": True,
+        "description": True,
+        "content": True,
+        "url": True,
+        "author": True,
+        "publishedAt": True,
+        "urlToImage": True,
+        "source": True,
+    }
     
     @property
     def rate_limit_delay(self) -> float:
         return 3.0  # NewsAPI free tier is very sensitive to bursts
     
-    async def fetch_articles(
+    async def fetch_records(
         self,
         query: Optional[str] = None,
         category: Optional[str] = None,
         from_date: Optional[datetime] = None,
         page_size: int = 100
-    ) -> List[ArticleData]:
+    ) -> List[IngestRecord]:
         
         params = {
             "apiKey": self.api_key,
@@ -36,42 +48,26 @@ class NewsAPISource(NewsSourceBase):
         if from_date:
             params["from"] = from_date.isoformat()
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(endpoint, params=params, timeout=30.0)
-            if response.status_code == 429:
-                print(f"NewsAPI Rate Limit Hit (429). skipping {category or 'General'}")
-                return []
-            response.raise_for_status()
-            data = response.json()
+        items = await self._fetch_items(endpoint, params, category)
+        if items is None:
+            return []  # Unchanged since the last poll
         
-        return [
-            self._transform_article(article, category) 
-            for article in data.get("articles", [])
-        ]
+        return self._transform_items(items, category)
     
-    def _transform_article(self, raw: Dict, category: Optional[str] = None) -> ArticleData:
-        # Require title and URL
-        title = raw.get("title")
-        url = raw.get("url")
-        
-        if not title or not url:
-            # This will be caught by the try-except in the task loop
-            raise ValueError("Missing title or URL in NewsAPI article")
-
-        # Normalize category (Politics -> politics for API vs Display)
-        # But here we want the display version or None
-        
-        return ArticleData(
-            title=title,
+    def transform_archived(self, items: List[Dict], category: Optional[str] = None) -> List[IngestRecord]:
+        return self._transform_items(items, category)
+    
+    def _transform_record(self, raw: Dict, category: Optional[str] = None) -> IngestRecord:
+        # Items without title or URL raise ValueError and are skipped
+        return IngestRecord.from_upstream(
+            title=raw.get("title"),
             description=raw.get("description"),
             content=raw.get("content"),
-            url=url,
+            url=raw.get("url"),
             source="NewsAPI",
             author=raw.get("author"),
             category=category or "General",
-            published_at=datetime.fromisoformat(
-                raw.get("publishedAt", datetime.now(timezone.utc).isoformat()).replace("Z", "+00:00")
-            ),
+            published_at=raw.get("publishedAt"),
             image_url=raw.get("urlToImage"),
             raw_data=raw
         )
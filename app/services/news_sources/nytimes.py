@@ -1,25 +1,38 @@
-import httpx
 from typing import List, Optional, Dict
 from datetime import datetime
-from .base import NewsSourceBase, ArticleData
+from .base import NewsSourceBase, IngestRecord
 
 class NYTimesSource(NewsSourceBase):
     BASE_URL = "https://api.nytimes.com/svc/search/v2"
+    VOLATILE_PARAMS = ("api-key",)
+    ITEMS_PATH = "response.docs.item"
+    ITEM_FIELDS = {
+        "headline": {"main": True},
+        "abstract": True,
+        "snippet": True,
+        "lead_paragraph": True,
+        "web_url": True,
+        "byline": {"original": True},
+        "section_name": True,
+        "pub_date": True,
+        "multimedia": True,
+    }
     
     @property
     def rate_limit_delay(self) -> float:
         return 10.0  # NYT has very strict rate limits
     
-    async def fetch_articles(
+    async def fetch_records(
         self,
         query: Optional[str] = None,
         category: Optional[str] = None,
         from_date: Optional[datetime] = None,
         page_size: int = 10  # NYT returns 10 per page
-    ) -> List[ArticleData]:
+    ) -> List[IngestRecord]:
         
         params = {
             "api-key": self.api_key,
+            "fl": ",".join(self.ITEM_FIELDS),
         }
         
         if query:
@@ -33,30 +46,14 @@ class NYTimesSource(NewsSourceBase):
             
         endpoint = f"{self.BASE_URL}/articlesearch.json"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(endpoint, params=params, timeout=30.0)
-            if response.status_code == 429:
-                print(f"NYT Rate Limit Hit. Waiting...")
-                return []
-            response.raise_for_status()
-            data = response.json()
-            
-        response_data = data.get("response")
-        if not isinstance(response_data, dict):
-            return []
-            
-        docs = response_data.get("docs")
-        if not isinstance(docs, list):
-            return []
+        docs = await self._fetch_items(endpoint, params, category)
+        if docs is None:
+            return []  # Unchanged since the last poll
         
-        return [
-            self._transform_article(doc) 
-            for doc in docs
-            if isinstance(doc, dict)
-        ]
+        return self._transform_items(docs)
     
-    def _transform_article(self, raw: Dict) -> ArticleData:
-        headline = raw.get("headline", {})
+    def _transform_record(self, raw: Dict) -> IngestRecord:
+        headline = raw.get("headline") or {}
         multimedia = raw.get("multimedia", [])
         image_url = None
         
@@ -72,17 +69,15 @@ class NYTimesSource(NewsSourceBase):
             if isinstance(best_image, dict) and "url" in best_image:
                 image_url = f"https://www.nytimes.com/{best_image['url']}"
             
-        return ArticleData(
-            title=headline.get("main", "No Title"),
+        return IngestRecord.from_upstream(
+            title=headline.get("main") or "No Title",
             description=raw.get("abstract") or raw.get("snippet"),
             content=raw.get("lead_paragraph"),
-            url=raw.get("web_url", ""),
+            url=raw.get("web_url"),
             source="NYTimes",
-            author=raw.get("byline", {}).get("original"),
+            author=(raw.get("byline") or {}).get("original"),
             category=raw.get("section_name"),
-            published_at=datetime.fromisoformat(
-                raw.get("pub_date", datetime.utcnow().isoformat()).replace("Z", "+00:00")
-            ),
+            published_at=raw.get("pub_date"),
             image_url=image_url,
             raw_data=raw
         )
@@ -0,0 +1,67 @@
+import hashlib
+from typing import Any, Dict, List
+
+import ijson
+
+
+def project(item: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only the declared fields of an upstream item.
+    `fields` maps a key to True (keep as-is) or to a nested spec for dicts.
+    An empty spec keeps the item untouched.
+    """
+    if not fields:
+        return item
+    kept = {}
+    for key, spec in fields.items():
+        if key not in item:
+            continue
+        value = item[key]
+        if isinstance(spec, dict) and isinstance(value, dict):
+            value = project(value, spec)
+        kept[key] = value
+    return kept
+
+
+class ItemStreamParser:
+    """
+    Incrementally parses a JSON payload fed in chunks, yielding only the
+    items found under `items_path` (an ijson prefix such as
+    "response.results.item") trimmed to `fields`.
+
+    The full document is never materialized: memory is bounded by one
+    chunk plus the projected items. A SHA-256 fingerprint of the raw bytes
+    is computed on the way through for the upstream response cache.
+    """
+
+    def __init__(self, items_path: str, fields: Dict[str, Any]):
+        self.fields = fields
+        self.items: List[Dict[str, Any]] = []
+        self._events = ijson.sendable_list()
+        self._coro = ijson.items_coro(self._events, items_path, use_float=True)
+        self._hash = hashlib.sha256()
+        self._fed = False
+
+    def feed(self, chunk: bytes):
+        self._hash.update(chunk)
+        self._fed = True
+        self._coro.send(chunk)
+        self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        if not self._fed:
+            # Nothing was sent (e.g. 304 Not Modified)
+            return self.items
+        self._coro.close()
+        self._drain()
+        return self.items
+
+    @property
+    def fingerprint(self) -> str:
+        return self._hash.hexdigest()
+
+    def _drain(self):
+        for item in self._events:
+            if isinstance(item, dict):
+                self.items.append(project(item, self.fields))
+        del self._events[:]
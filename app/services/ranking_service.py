@@ -0,0 +1,97 @@
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import Float, case, cast, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from app.config import get_settings
+from app.models.article import Article
+
+settings = get_settings()
+
+# Score of an article from a weight-1.0 source, published now, alone in its
+# cluster and with no read time. Everything else is a multiplier of this.
+BASE_SCORE = 100.0
+MAX_READ_TIME = 10  # Minutes; longer pieces get no extra depth credit
+
+
+def rank_score(
+    source: str,
+    published_at: Optional[datetime],
+    cluster_size: int = 1,
+    read_time_minutes: Optional[int] = None,
+    now: Optional[datetime] = None
+) -> float:
+    """
+    Python twin of `RankingService.score_expression`, used to score rows at
+    insert time so new articles are rankable before the next refresh.
+    """
+    now = now or datetime.now(timezone.utc)
+    age_hours = max(0.0, (now - published_at).total_seconds() / 3600) if published_at else 0.0
+    freshness = 0.5 ** (age_hours / settings.RANK_HALF_LIFE_HOURS)
+    cluster_boost = 1 + settings.RANK_CLUSTER_WEIGHT * math.log(max(cluster_size, 1))
+    depth = 1 + settings.RANK_READ_TIME_WEIGHT * min(read_time_minutes or 0, MAX_READ_TIME) / MAX_READ_TIME
+    weight = settings.RANK_SOURCE_WEIGHTS.get(source, 1.0)
+    return round(BASE_SCORE * weight * freshness * cluster_boost * depth, 6)
+
+
+class RankingService:
+    """
+    Materializes `articles.rank_score` for the ranked feed ordering:
+    freshness decay x source weight x story cluster size x read time.
+    Only articles inside RANK_WINDOW_HOURS are rescored; older ones are
+    zeroed once, so `ORDER BY rank_score DESC` can walk its index.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def score_expression(cluster_size):
+        age_hours = func.greatest(
+            func.extract("epoch", func.now() - Article.published_at) / 3600, 0
+        )
+        freshness = func.power(0.5, age_hours / settings.RANK_HALF_LIFE_HOURS)
+        cluster_boost = 1 + settings.RANK_CLUSTER_WEIGHT * func.ln(func.greatest(cluster_size, 1))
+        depth = 1 + settings.RANK_READ_TIME_WEIGHT * func.least(
+            func.coalesce(Article.read_time_minutes, 0), MAX_READ_TIME
+        ) / float(MAX_READ_TIME)
+        weight = case(
+            *[(Article.source == source, w) for source, w in settings.RANK_SOURCE_WEIGHTS.items()],
+            else_=1.0
+        ) if settings.RANK_SOURCE_WEIGHTS else 1.0
+        return cast(BASE_SCORE * weight * freshness * cluster_boost * depth, Float)
+
+    async def refresh(self) -> int:
+        """Rescore recent articles and zero the ones that left the window"""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.RANK_WINDOW_HOURS)
+        recent = Article.published_at >= cutoff
+
+        # Served by the story_cluster_id index, one probe per clustered row
+        peer = Article.__table__.alias("peer")
+        cluster_sizes = (
+            select(func.count())
+            .where(peer.c.story_cluster_id == Article.story_cluster_id)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(Article)
+            .where(recent)
+            .values(
+                rank_score=self.score_expression(
+                    case((Article.story_cluster_id.is_(None), 1), else_=cluster_sizes)
+                ),
+                # A rescore is not a content change; keep updated_at as it was
+                updated_at=Article.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            update(Article)
+            .where(Article.published_at < cutoff, Article.rank_score > 0)
+            .values(rank_score=0, updated_at=Article.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
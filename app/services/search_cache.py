@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime
+from math import ceil
+from typing import Dict, Iterable, List, Optional
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import get_settings
+from app.core.cache import CacheManager
+from app.core.logger import get_logger
+from app.schemas.article import ArticleResponse, PaginatedArticles
+from app.services.article_service import ArticleService
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+SEARCH_CACHE_TTL = 300  # 5 minutes for search results
+
+
+def search_cache_key(
+    query: Optional[str] = None,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    tag: Optional[str] = None,
+    collapse: bool = False,
+    sort: str = "published",
+    page: int = 1,
+    page_size: int = 20
+) -> str:
+    """Stable cache key of one /articles page"""
+    cache_params = f"{query}:{source}:{category}:{from_date}:{to_date}:{tag}:{collapse}:{sort}:{page}:{page_size}"
+    hash_val = hashlib.md5(cache_params.encode()).hexdigest()
+    return f"articles:search:{hash_val}"
+
+
+async def build_search_page(
+    db: AsyncSession,
+    query: Optional[str] = None,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    tag: Optional[str] = None,
+    collapse: bool = False,
+    sort: str = "published",
+    page: int = 1,
+    page_size: int = 20
+) -> PaginatedArticles:
+    """Run the search behind one /articles page and build its response"""
+    articles, total = await ArticleService(db).search_articles(
+        query=query,
+        source=source,
+        category=category,
+        from_date=from_date,
+        to_date=to_date,
+        tag=tag,
+        skip=(page - 1) * page_size,
+        limit=page_size,
+        collapse_clusters=collapse,
+        sort=sort
+    )
+    return PaginatedArticles(
+        articles=[ArticleResponse.from_orm(a) for a in articles],
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=ceil(total / page_size) if total > 0 else 0
+    )
+
+
+def article_tag(article_id: int) -> str:
+    """Set of the cached search pages that show `article_id`"""
+    return f"cache:article:{article_id}"
+
+
+async def store_search_page(cache: CacheManager, key: str, page: PaginatedArticles):
+    """Cache a search page and tag it with the articles it shows, in one round trip"""
+    try:
+        async with cache.redis.pipeline(transaction=False) as pipe:
+            pipe.setex(key, SEARCH_CACHE_TTL, page.model_dump_json())
+            for article in page.articles:
+                tag = article_tag(article.id)
+                pipe.sadd(tag, key)
+                pipe.expire(tag, SEARCH_CACHE_TTL)
+            await pipe.execute()
+    except Exception as e:
+        logger.error("Cache Set Error: %s", e)
+
+
+async def invalidate_articles(redis_client: redis.Redis, article_ids: Iterable[int]) -> int:
+    """Drop only the cached search pages that show one of `article_ids`; returns how many"""
+    tags = [article_tag(article_id) for article_id in article_ids]
+    if not tags:
+        return 0
+    keys = await redis_client.sunion(tags)
+    if keys:
+        await redis_client.unlink(*keys, *tags)
+    return len(keys)
+
+
+def hot_feeds() -> List[Dict[str, str]]:
+    """The unfiltered homepage plus every category tab and source filter"""
+    return (
+        [{}]
+        + [{"category": category} for category in settings.CACHE_WARMUP_CATEGORIES]
+        + [{"source": source} for source in settings.CACHE_WARMUP_SOURCES]
+    )
+
+
+async def warm_search_cache(
+    session_factory: async_sessionmaker,
+    cache: CacheManager,
+    feeds: Optional[List[Dict[str, str]]] = None,
+    pages: Optional[int] = None,
+    page_size: Optional[int] = None,
+    concurrency: Optional[int] = None
+) -> Dict[str, float]:
+    """
+    Recompute and overwrite the cached first `pages` pages of each hot feed,
+    so the first visitors after an ingest do not pay for cold queries.
+    At most `concurrency` searches run against Postgres at once.
+    """
+    feeds = hot_feeds() if feeds is None else feeds
+    pages = settings.CACHE_WARMUP_PAGES if pages is None else pages
+    page_size = page_size or settings.CACHE_WARMUP_PAGE_SIZE
+    semaphore = asyncio.Semaphore(concurrency or settings.CACHE_WARMUP_CONCURRENCY)
+    started = time.perf_counter()
+
+    async def warm(feed: Dict[str, str], page: int) -> bool:
+        async with semaphore:
+            try:
+                async with session_factory() as db:
+                    response = await build_search_page(db, page=page, page_size=page_size, **feed)
+                key = search_cache_key(page=page, page_size=page_size, **feed)
+                await store_search_page(cache, key, response)
+                return True
+            except Exception as e:
+                logger.warning("Cache warm-up failed for %s page %s: %s", feed, page, e)
+                return False
+
+    results = await asyncio.gather(*[
+        warm(feed, page) for feed in feeds for page in range(1, pages + 1)
+    ])
+    return {"keys": sum(results), "failed": len(results) - sum(results), "seconds": round(time.perf_counter() - started, 3)}
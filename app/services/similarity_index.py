@@ -0,0 +1,213 @@
+import asyncio
+import hashlib
+import os
+import threading
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config import get_settings
+from app.core.logger import get_logger
+from app.services.keyword_service import tokenize
+
+try:
+    import fcntl
+except ImportError:  # Windows: single local worker, no cross-process lock needed
+    fcntl = None
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+TITLE_WEIGHT = 1.0
+TAG_WEIGHT = 2.0  # Extracted keywords/entities already summarize the body
+
+
+def embed(title: str, tags: Sequence[str], dim: int = None) -> np.ndarray:
+    """
+    Signed feature-hashing vector of title tokens and extracted tags,
+    L2-normalized so a dot product is the cosine similarity.
+    """
+    dim = dim or settings.SIMILARITY_DIM
+    vector = np.zeros(dim, dtype=np.float32)
+    features = [(token, TITLE_WEIGHT) for token in tokenize(title or "")]
+    features += [(tag, TAG_WEIGHT) for tag in tags]
+    for feature, weight in features:
+        digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+        vector[digest % dim] += weight if digest >> 63 else -weight
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SimilarityIndex:
+    """
+    Append-only, memory-mapped matrix of article vectors.
+
+    `vectors.f32` holds one row of SIMILARITY_DIM float32 per article and
+    `ids.i64` the matching article ids. Ingestion appends rows after each
+    batch; API workers memory-map both files read-only, so every worker
+    shares the same page cache instead of holding its own copy, and reopen
+    them when the files grow or are replaced by a full rebuild. The API and
+    every process that ingests must therefore share SIMILARITY_INDEX_DIR
+    (one host or one shared volume); otherwise /related stays empty.
+
+    File locking, fsync and scoring block, so async callers go through
+    `record` and `related_async`, which run them in a worker thread.
+    """
+
+    def __init__(self, directory: str = None, dim: int = None):
+        self.directory = directory or settings.SIMILARITY_INDEX_DIR
+        self.dim = dim or settings.SIMILARITY_DIM
+        self.vectors_path = os.path.join(self.directory, "vectors.f32")
+        self.ids_path = os.path.join(self.directory, "ids.i64")
+        self._stamp = None
+        self._ids: Optional[np.ndarray] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._order: Optional[np.ndarray] = None
+        self._sorted_ids: Optional[np.ndarray] = None
+        self._missing_logged = False
+        self._load_lock = threading.Lock()
+
+    # Writing (ingestion)
+
+    async def record(self, articles: Sequence[dict]):
+        """Read-model hook: append vectors for newly inserted articles"""
+        await asyncio.to_thread(self.append, [
+            (article["id"], embed(article["title"], article.get("tags") or [], self.dim))
+            for article in articles
+        ])
+
+    def append(self, rows: Iterable[Tuple[int, np.ndarray]]):
+        rows = list(rows)
+        if not rows:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        ids = np.array([article_id for article_id, _ in rows], dtype=np.int64)
+        vectors = np.stack([vector for _, vector in rows]).astype(np.float32)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}")
+
+        with open(os.path.join(self.directory, ".lock"), "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            # Vectors first: readers size the index by the ids file
+            with open(self.vectors_path, "ab") as f:
+                f.write(vectors.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            with open(self.ids_path, "ab") as f:
+                f.write(ids.tobytes())
+
+    def size(self) -> int:
+        """Complete rows in the live index"""
+        try:
+            return min(os.path.getsize(self.ids_path) // 8, os.path.getsize(self.vectors_path) // (4 * self.dim))
+        except FileNotFoundError:
+            return 0
+
+    def write_all(self, rows: Iterable[Tuple[int, np.ndarray]], since: Optional[int] = None) -> int:
+        """
+        Write a complete index next to the live one and swap it in atomically.
+        Pass `since=size()` taken before reading `rows` from the database:
+        rows appended to the live index after that point are carried over,
+        so articles ingested during the rebuild are not lost. Any that the
+        rebuild also read appear twice, which `related` tolerates.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        count = 0
+        with open(self.vectors_path + ".tmp", "wb") as vf, open(self.ids_path + ".tmp", "wb") as idf:
+            for article_id, vector in rows:
+                vf.write(np.asarray(vector, dtype=np.float32).tobytes())
+                idf.write(np.int64(article_id).tobytes())
+                count += 1
+        with open(os.path.join(self.directory, ".lock"), "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            if since is not None:
+                count += self._carry_over(since)
+            os.replace(self.vectors_path + ".tmp", self.vectors_path)
+            os.replace(self.ids_path + ".tmp", self.ids_path)
+        return count
+
+    def _carry_over(self, since: int) -> int:
+        """Append live rows past `since` to the pending .tmp index; caller holds the lock"""
+        end = self.size()
+        if end <= since:
+            return 0
+        row_bytes = 4 * self.dim
+        with open(self.vectors_path, "rb") as src, open(self.vectors_path + ".tmp", "ab") as dst:
+            src.seek(since * row_bytes)
+            dst.write(src.read((end - since) * row_bytes))
+        with open(self.ids_path, "rb") as src, open(self.ids_path + ".tmp", "ab") as dst:
+            src.seek(since * 8)
+            dst.write(src.read((end - since) * 8))
+        return end - since
+
+    # Reading (API)
+
+    def _load(self) -> bool:
+        try:
+            ids_stat = os.stat(self.ids_path)
+            vectors_stat = os.stat(self.vectors_path)
+        except FileNotFoundError:
+            if not self._missing_logged:
+                self._missing_logged = True
+                logger.warning(
+                    "No similarity index in %s: related articles stay empty until an ingesting "
+                    "process sharing this directory writes it", os.path.abspath(self.directory)
+                )
+            return False
+
+        stamp = (ids_stat.st_ino, ids_stat.st_size, vectors_stat.st_ino)
+        if stamp == self._stamp:
+            return self._ids is not None
+
+        rows = min(ids_stat.st_size // 8, vectors_stat.st_size // (4 * self.dim))
+        if rows == 0:
+            return False
+        self._ids = np.memmap(self.ids_path, dtype=np.int64, mode="r", shape=(rows,))
+        self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim))
+        # Ids are appended in insert order, so they are normally already sorted
+        self._order = None if np.all(np.diff(self._ids) > 0) else np.argsort(self._ids, kind="stable")
+        self._sorted_ids = self._ids if self._order is None else self._ids[self._order]
+        self._stamp = stamp
+        return True
+
+    @staticmethod
+    def _row(sorted_ids: np.ndarray, order: Optional[np.ndarray], article_id: int) -> Optional[int]:
+        position = int(np.searchsorted(sorted_ids, article_id))
+        if position >= len(sorted_ids) or sorted_ids[position] != article_id:
+            return None
+        return position if order is None else int(order[position])
+
+    def related(self, article_id: int, limit: int = 5) -> Optional[List[int]]:
+        """
+        Ids of the `limit` most similar articles among the most recent
+        SIMILARITY_SEARCH_WINDOW rows, best first. None if not indexed.
+        """
+        # Concurrent callers may reload; score against one consistent snapshot
+        with self._load_lock:
+            if not self._load():
+                return None
+            ids, vectors, order, sorted_ids = self._ids, self._vectors, self._order, self._sorted_ids
+        row = self._row(sorted_ids, order, article_id)
+        if row is None:
+            return None
+
+        start = max(0, len(ids) - settings.SIMILARITY_SEARCH_WINDOW)
+        scores = vectors[start:] @ vectors[row]
+
+        # Over-fetch a little: re-indexed articles can appear more than once
+        k = min(limit * 2 + 1, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        related = []
+        for i in top:
+            candidate = int(ids[start + i])
+            if candidate != article_id and scores[i] > 0 and candidate not in related:
+                related.append(candidate)
+        return related[:limit]
+
+    async def related_async(self, article_id: int, limit: int = 5) -> Optional[List[int]]:
+        """`related` off the event loop, for request handlers"""
+        return await asyncio.to_thread(self.related, article_id, limit)
@@ -0,0 +1,180 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+import redis.asyncio as redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from app.config import get_settings
+from app.models.article import Article
+from app.models.tag import ArticleTag
+
+settings = get_settings()
+
+MIN_PREFIX = 2
+TITLE_TTL = settings.SUGGEST_TITLE_DAYS * 86400  # Older stories drop out of title completions
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+
+def normalize(text: str) -> str:
+    return " ".join(_NON_WORD_RE.sub(" ", text.lower()).split())
+
+
+def prefixes(text: str) -> List[str]:
+    """MIN_PREFIX..SUGGEST_MAX_PREFIX character prefixes of `text`"""
+    return [text[:n] for n in range(MIN_PREFIX, min(len(text), settings.SUGGEST_MAX_PREFIX) + 1)]
+
+
+def title_prefixes(title: str) -> Set[str]:
+    """Prefixes of every word, so "reserve" also finds "Federal Reserve holds rates" """
+    return {prefix for word in normalize(title).split() for prefix in prefixes(word)}
+
+
+def _hours(published_at: Any) -> float:
+    if isinstance(published_at, str):
+        published_at = datetime.fromisoformat(published_at)
+    return round(published_at.timestamp() / 3600, 3)
+
+
+class SuggestService:
+    """
+    Autocomplete from a Redis prefix index maintained at ingest time.
+
+    `suggest:kw:{prefix}` ranks extracted keywords/entities by how many
+    articles carry them. `suggest:title:{prefix}` ranks story titles (one per
+    story cluster, keyed by every word prefix) by publication hour plus
+    SUGGEST_CLUSTER_BOOST for each further article covering the story.
+    Every prefix set is trimmed to SUGGEST_MAX_PER_PREFIX members, so a
+    lookup is one ZREVRANGE on a small set and never touches Postgres.
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    async def record(self, articles: Sequence[Dict[str, Any]]):
+        """Read-model hook: index titles and tags of newly inserted articles"""
+        if not articles:
+            return
+        touched: Set[str] = set()
+        heads = [a for a in articles if a["id"] == a["story_cluster_id"]]
+        followers = [a for a in articles if a["id"] != a["story_cluster_id"]]
+
+        head_titles = {a["id"]: f"{a['id']}|{a['title']}" for a in heads}
+        if followers:
+            cluster_ids = sorted({a["story_cluster_id"] for a in followers})
+            titles = await self.redis.mget([f"suggest:head:{cid}" for cid in cluster_ids])
+            head_titles.update({cid: title for cid, title in zip(cluster_ids, titles) if title})
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for article in heads:
+                member = f"{article['id']}|{article['title']}"
+                pipe.set(f"suggest:head:{article['id']}", member, ex=TITLE_TTL)
+                score = _hours(article["published_at"])
+                for prefix in title_prefixes(article["title"]):
+                    key = f"suggest:title:{prefix}"
+                    pipe.zadd(key, {member: score})
+                    touched.add(key)
+
+            for article in followers:
+                member = head_titles.get(article["story_cluster_id"])
+                if not member:
+                    continue
+                for prefix in title_prefixes(member.split("|", 1)[1]):
+                    key = f"suggest:title:{prefix}"
+                    # xx: only stories still in the index gain weight
+                    pipe.zadd(key, {member: settings.SUGGEST_CLUSTER_BOOST}, xx=True, incr=True)
+
+            for article in articles:
+                for tag in article.get("tags") or []:
+                    for prefix in prefixes(tag):
+                        key = f"suggest:kw:{prefix}"
+                        pipe.zincrby(key, 1, tag)
+                        touched.add(key)
+
+            self._trim(pipe, touched)
+            await pipe.execute()
+
+    @staticmethod
+    def _trim(pipe, keys: Iterable[str]):
+        expired = _hours(datetime.now(timezone.utc)) - TITLE_TTL / 3600
+        for key in keys:
+            if key.startswith("suggest:title:"):
+                pipe.zremrangebyscore(key, "-inf", expired)
+            pipe.zremrangebyrank(key, 0, -(settings.SUGGEST_MAX_PER_PREFIX + 1))
+
+    async def suggest(self, q: str, limit: int = 8) -> Dict[str, List]:
+        """Keyword and title completions for a partially typed query"""
+        query = normalize(q)
+        if len(query) < MIN_PREFIX:
+            return {"keywords": [], "titles": []}
+        words = query.split()
+        # The last word is the one being typed; earlier words filter the candidates
+        lookup = words[-1] if len(words[-1]) >= MIN_PREFIX else words[-2]
+        title_key = f"suggest:title:{lookup[:settings.SUGGEST_MAX_PREFIX]}"
+        keyword_key = f"suggest:kw:{query[:settings.SUGGEST_MAX_PREFIX]}"
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zrevrange(keyword_key, 0, settings.SUGGEST_MAX_PER_PREFIX - 1)
+            pipe.zrevrange(title_key, 0, settings.SUGGEST_MAX_PER_PREFIX - 1)
+            keywords, titles = await pipe.execute()
+
+        return {
+            "keywords": [kw for kw in keywords if kw.startswith(query)][:limit],
+            "titles": self._match_titles(titles, words)[:limit],
+        }
+
+    @staticmethod
+    def _match_titles(members: Sequence[str], words: List[str]) -> List[Dict[str, Any]]:
+        matches = []
+        for member in members:
+            article_id, title = member.split("|", 1)
+            title_words = normalize(title).split()
+            if all(
+                any(tw.startswith(w) if i == len(words) - 1 else tw == w for tw in title_words)
+                for i, w in enumerate(words)
+            ):
+                matches.append({"id": int(article_id), "title": title})
+        return matches
+
+    async def rebuild(self, db: AsyncSession) -> Dict[str, int]:
+        """Rebuild the index from recent cluster heads and all tag counts"""
+        since = datetime.now(timezone.utc) - timedelta(seconds=TITLE_TTL)
+        cluster_size = (
+            select(Article.story_cluster_id, func.count().label("size"))
+            .where(Article.published_at >= since)
+            .group_by(Article.story_cluster_id)
+            .subquery()
+        )
+        heads = await db.execute(
+            select(Article.id, Article.title, Article.published_at, cluster_size.c.size)
+            .join(cluster_size, cluster_size.c.story_cluster_id == Article.id)
+        )
+        tags = (await db.execute(select(ArticleTag.tag, func.count()).group_by(ArticleTag.tag))).all()
+
+        title_sets: Dict[str, Dict[str, float]] = {}
+        head_keys: List[Tuple[str, str]] = []
+        for article_id, title, published_at, size in heads.all():
+            member = f"{article_id}|{title}"
+            head_keys.append((f"suggest:head:{article_id}", member))
+            score = _hours(published_at) + settings.SUGGEST_CLUSTER_BOOST * (size - 1)
+            for prefix in title_prefixes(title):
+                title_sets.setdefault(f"suggest:title:{prefix}", {})[member] = score
+
+        keyword_sets: Dict[str, Dict[str, float]] = {}
+        for tag, count in tags:
+            for prefix in prefixes(tag):
+                keyword_sets.setdefault(f"suggest:kw:{prefix}", {})[tag] = count
+
+        stale = [key async for key in self.redis.scan_iter(match="suggest:*", count=1000)]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if stale:
+                pipe.unlink(*stale)
+            for key, member in head_keys:
+                pipe.set(key, member, ex=TITLE_TTL)
+            for key, members in {**title_sets, **keyword_sets}.items():
+                top = sorted(members.items(), key=lambda item: -item[1])[:settings.SUGGEST_MAX_PER_PREFIX]
+                pipe.zadd(key, dict(top))
+            await pipe.execute()
+        return {"titles": len(head_keys), "keywords": len(tags), "prefixes": len(title_sets) + len(keyword_sets)}
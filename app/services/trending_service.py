@@ -0,0 +1,135 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import redis.asyncio as redis
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class TrendingService:
+    """
+    Story-cluster and keyword velocity maintained incrementally in Redis
+    sorted sets.
+
+    Ingestion bumps per-hour buckets (articles per cluster and newly seen
+    sources per cluster) and then folds the last TRENDING_WINDOW_HOURS
+    buckets into a ready-to-read ranking with a per-hour decay. Reads are
+    a ZREVRANGE plus O(k) lookups and never touch Postgres. The
+    `refresh_trending` beat task re-folds the ranking periodically so it
+    keeps decaying while ingestion is idle.
+    """
+
+    RANKING_KEY = "trending:clusters"
+    KEYWORD_RANKING_KEY = "trending:keywords"
+    ARTICLE_COUNTS_KEY = "trending:article_counts"
+    SOURCE_COUNTS_KEY = "trending:source_counts"
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+        self.window_hours = settings.TRENDING_WINDOW_HOURS
+        self.ttl = self.window_hours * 3600 + 3600
+
+    @staticmethod
+    def _hour(moment: datetime) -> str:
+        return moment.strftime("%Y%m%d%H")
+
+    def _window(self, now: datetime) -> List[str]:
+        return [self._hour(now - timedelta(hours=age)) for age in range(self.window_hours)]
+
+    async def record(self, articles: Sequence[Dict[str, Any]], now: Optional[datetime] = None):
+        """
+        Count newly inserted articles and refresh the ranking. Each item needs
+        `id`, `story_cluster_id` and `source`, plus the summary fields shown
+        by /trending and optionally the extracted `tags`.
+        """
+        if not articles:
+            return
+        now = now or datetime.now(timezone.utc)
+        hour = self._hour(now)
+        articles_key = f"trending:articles:{hour}"
+        sources_key = f"trending:sources:{hour}"
+        keywords_key = f"trending:keywords:{hour}"
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for article in articles:
+                cluster_sources = f"trending:cluster_sources:{article['story_cluster_id']}"
+                pipe.sadd(cluster_sources, article["source"])
+                pipe.expire(cluster_sources, self.ttl)
+            added = (await pipe.execute())[::2]
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for article, new_source in zip(articles, added):
+                cluster_id = article["story_cluster_id"]
+                pipe.zincrby(articles_key, 1, cluster_id)
+                for tag in article.get("tags") or []:
+                    pipe.zincrby(keywords_key, 1, tag)
+                if new_source:
+                    pipe.zincrby(sources_key, 1, cluster_id)
+                # First article seen represents the cluster
+                pipe.set(
+                    f"trending:head:{cluster_id}",
+                    json.dumps(article, default=str),
+                    ex=self.ttl,
+                    nx=True
+                )
+            pipe.expire(articles_key, self.ttl)
+            pipe.expire(sources_key, self.ttl)
+            pipe.expire(keywords_key, self.ttl)
+            await pipe.execute()
+
+        await self.refresh(now)
+
+    async def refresh(self, now: Optional[datetime] = None):
+        """Recompute the precomputed ranking from the hourly buckets"""
+        window = self._window(now or datetime.now(timezone.utc))
+        weights = {}
+        keyword_weights = {}
+        for age, hour in enumerate(window):
+            decay = settings.TRENDING_HOURLY_DECAY ** age
+            weights[f"trending:articles:{hour}"] = decay
+            weights[f"trending:sources:{hour}"] = decay * settings.TRENDING_SOURCE_WEIGHT
+            keyword_weights[f"trending:keywords:{hour}"] = decay
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zunionstore(self.RANKING_KEY, weights)
+            pipe.zunionstore(self.KEYWORD_RANKING_KEY, keyword_weights)
+            pipe.zunionstore(self.ARTICLE_COUNTS_KEY, [f"trending:articles:{h}" for h in window])
+            pipe.zunionstore(self.SOURCE_COUNTS_KEY, [f"trending:sources:{h}" for h in window])
+            for key in (self.RANKING_KEY, self.KEYWORD_RANKING_KEY, self.ARTICLE_COUNTS_KEY, self.SOURCE_COUNTS_KEY):
+                pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def top(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top `limit` clusters with their counts and representative article"""
+        ranked = await self.redis.zrevrange(self.RANKING_KEY, 0, limit - 1, withscores=True)
+        if not ranked:
+            return []
+        cluster_ids = [cluster_id for cluster_id, _ in ranked]
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zmscore(self.ARTICLE_COUNTS_KEY, cluster_ids)
+            pipe.zmscore(self.SOURCE_COUNTS_KEY, cluster_ids)
+            pipe.mget([f"trending:head:{cluster_id}" for cluster_id in cluster_ids])
+            article_counts, source_counts, heads = await pipe.execute()
+
+        stories = []
+        for (cluster_id, score), articles, sources, head in zip(
+            ranked, article_counts, source_counts, heads
+        ):
+            if not head:
+                continue
+            stories.append({
+                "cluster_id": int(cluster_id),
+                "score": round(score, 3),
+                "article_count": int(articles or 0),
+                "source_count": int(sources or 0),
+                "article": json.loads(head),
+            })
+        return stories
+
+    async def top_keywords(self, limit: int = 20) -> List[Dict[str, Any]]:
+        ranked = await self.redis.zrevrange(self.KEYWORD_RANKING_KEY, 0, limit - 1, withscores=True)
+        return [{"keyword": keyword, "score": round(score, 3)} for keyword, score in ranked]
@@ -1,5 +1,6 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import setup_logging, worker_init, worker_process_init
 from app.config import get_settings
 
 settings = get_settings()
@@ -8,7 +9,7 @@ celery_app = Celery(
     "news_aggregator",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["app.tasks.fetch_articles"]
+    include=["app.tasks.fetch_articles", "app.tasks.maintenance"]
 )
 
 celery_app.conf.update(
@@ -29,6 +30,37 @@ celery_app.conf.beat_schedule = {
         "task": "fetch_all_sources",
         "schedule": timedelta(minutes=settings.FETCH_INTERVAL_MINUTES),
     },
+    "refresh-rank-scores": {
+        "task": "refresh_rank_scores",
+        "schedule": timedelta(minutes=settings.RANK_REFRESH_MINUTES),
+    },
+    "refresh-trending": {
+        "task": "refresh_trending",
+        "schedule": timedelta(minutes=settings.TRENDING_REFRESH_MINUTES),
+    },
+    "nightly-facet-reconcile": {
+        "task": "reconcile_facets",
+        "schedule": crontab(hour=3, minute=0),
+    },
 }
 
+@setup_logging.connect
+def configure_logging(**kwargs):
+    # Replaces Celery's own logging setup with the queue-based JSON pipeline
+    from app.core.logger import setup_logging as setup_app_logging
+    setup_app_logging()
+
+@worker_process_init.connect
+def restart_log_listener(**kwargs):
+    # Threads do not survive fork: prefork children need their own listener
+    from app.core.logger import setup_logging as setup_app_logging
+    setup_app_logging()
+
+@worker_init.connect
+def start_metrics_exporter(**kwargs):
+    # Prefork pools need PROMETHEUS_MULTIPROC_DIR so child metrics are visible
+    if settings.METRICS_WORKER_PORT:
+        from app.core.metrics import start_exporter
+        start_exporter(settings.METRICS_WORKER_PORT)
+
 # The 'include' parameter above handles task discovery
@@ -1,10 +1,27 @@
 import asyncio
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import List
 
 from app.tasks import celery_app
 from app.core.database import AsyncSessionLocal
+from app.core.cache import CacheManager, create_redis_client
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.metrics import INGESTED_ARTICLES
+from app.core.rate_limit import SYNC_PENDING_KEY
+from app.core.response_archive import ResponseArchive
+from app.core.response_cache import UpstreamResponseCache
 from app.services.article_service import ArticleService
+from app.services.dedupe_service import StoryClusterService
+from app.services.facet_service import FacetService
+from app.services.ingest_queue import IngestQueue
+from app.services.keyword_service import KeywordService
+from app.services.live_feed import LiveFeedPublisher
+from app.services.search_cache import invalidate_articles, warm_search_cache
+from app.services.similarity_index import SimilarityIndex
+from app.services.suggest_service import SuggestService
+from app.services.trending_service import TrendingService
+from app.services.news_sources.base import SourceRateLimited
 from app.services.news_sources.newsapi import NewsAPISource
 from app.services.news_sources.guardian import GuardianSource
 from app.services.news_sources.nytimes import NYTimesSource
@@ -14,6 +31,9 @@ from app.core.logger import get_logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Standard category names forced onto every fetched record
+CATEGORIES = ["Technology", "Business", "Science", "Sports", "Politics"]
+
 @celery_app.task(name="fetch_all_sources", bind=True, max_retries=3)
 def fetch_all_sources(self):
     """
@@ -25,80 +45,241 @@ def fetch_all_sources(self):
     except Exception as exc:
         raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
 
+def _summary(article_id: int, cluster_id: int, tags: List[str], record) -> dict:
+    """Compact description of a freshly inserted article for the Redis read models"""
+    return {
+        "id": article_id,
+        "story_cluster_id": cluster_id,
+        "title": record.title,
+        "url": record.url,
+        "source": record.source,
+        "category": record.category,
+        "image_url": record.image_url,
+        "published_at": record.published_at.isoformat(),
+        "tags": tags,
+    }
+
+def _read_models(redis_client) -> list:
+    """Redis read models updated from every committed batch"""
+    return [
+        TrendingService(redis_client),
+        FacetService(redis_client),
+        SimilarityIndex(),
+        SuggestService(redis_client),
+        LiveFeedPublisher(redis_client),
+    ]
+
+async def _after_commit(read_models: list, new_articles: List[dict]):
+    """
+    Update read models derived from newly committed articles.
+    Failures here must never undo or block ingestion.
+    """
+    if not new_articles:
+        return
+    for read_model in read_models:
+        try:
+            await read_model.record(new_articles)
+        except Exception as e:
+            logger.error("%s update failed: %s", read_model.__class__.__name__, e)
+
+async def _store_records(
+    db, records: list, story_clusters: StoryClusterService, redis_client, bulk: bool = False
+) -> List[dict]:
+    """
+    Insert a batch of records with their story clusters and tags, update
+    articles whose upstream content changed, commit, and return summaries
+    of the newly inserted articles. `bulk` loads the batch with COPY (see
+    ArticleService.copy_upsert_records). Rolling back and discarding
+    pending cluster state on failure is left to the caller.
+    """
+    article_service = ArticleService(db)
+    if bulk:
+        inserted, updated = await article_service.copy_upsert_records(records)
+    else:
+        inserted, updated = await article_service.upsert_records(records)
+    
+    by_hash = {ArticleService.generate_url_hash(r.url): r for r in records}
+    inserted_by_source = Counter(by_hash[url_hash].source for _, url_hash in inserted)
+    updated_by_source = Counter(by_hash[url_hash].source for _, url_hash in updated)
+    for source, count in Counter(r.source for r in records).items():
+        INGESTED_ARTICLES.labels(source, "inserted").inc(inserted_by_source[source])
+        INGESTED_ARTICLES.labels(source, "updated").inc(updated_by_source[source])
+        INGESTED_ARTICLES.labels(source, "duplicate").inc(
+            count - inserted_by_source[source] - updated_by_source[source]
+        )
+    
+    # Group near-duplicates of the same story across sources
+    clusters = await story_clusters.assign_clusters([
+        (article_id, by_hash[url_hash].title, by_hash[url_hash].description)
+        for article_id, url_hash in inserted
+    ])
+    await article_service.set_story_clusters(clusters)
+    
+    # Tagged in ingest-sized chunks: a replay batch is far larger, and scoring
+    # memory grows with the chunk's documents and vocabulary
+    keywords = KeywordService(db)
+    tags = {}
+    for start in range(0, len(inserted), settings.INGEST_BATCH_SIZE):
+        tags.update(await keywords.tag_articles([
+            (article_id, by_hash[url_hash].title, by_hash[url_hash].description, by_hash[url_hash].content)
+            for article_id, url_hash in inserted[start:start + settings.INGEST_BATCH_SIZE]
+        ]))
+    
+    await db.commit()
+    await story_clusters.commit()
+    
+    if updated:
+        # Cached pages showing the old text expire early instead of after their TTL
+        try:
+            await invalidate_articles(redis_client, [article_id for article_id, _ in updated])
+        except Exception as e:
+            logger.error("Search cache invalidation failed: %s", e)
+    
+    return [
+        _summary(article_id, clusters[article_id], tags.get(article_id, []), by_hash[url_hash])
+        for article_id, url_hash in inserted
+    ]
+
 async def _fetch_all_sources_async():
     """Actual async fetching logic"""
     from app.core.database import create_db_engine, AsyncSession, async_sessionmaker
     
     # Create a task-specific engine to avoid "Event loop is closed" errors
-    task_engine = create_db_engine(settings.DATABASE_URL, pool_size=2, max_overflow=0)
+    task_engine = create_db_engine(
+        settings.DATABASE_URL, pool_size=max(2, settings.CACHE_WARMUP_CONCURRENCY), max_overflow=0
+    )
     TaskSessionLocal = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
     
+    # Breaker and response fingerprints live in Redis so every worker agrees
+    redis_client = create_redis_client(max_connections=max(2, settings.CACHE_WARMUP_CONCURRENCY))
+    breaker = CircuitBreaker(redis_client)
+    response_cache = UpstreamResponseCache(redis_client)
+    archive = None
+    if settings.UPSTREAM_ARCHIVE_DIR:
+        archive = ResponseArchive(settings.UPSTREAM_ARCHIVE_DIR, settings.UPSTREAM_ARCHIVE_COMPRESSLEVEL)
+    story_clusters = StoryClusterService(redis_client)
+    # Picked up: the next POST /sync may queue another run
+    try:
+        await redis_client.delete(SYNC_PENDING_KEY)
+    except Exception as e:
+        logger.warning("Could not release the sync claim: %s", e)
+    read_models = _read_models(redis_client)
+    
     # Initialize sources
     sources = []
     if settings.NEWSAPI_KEY:
-        sources.append(NewsAPISource(settings.NEWSAPI_KEY))
+        sources.append(NewsAPISource(settings.NEWSAPI_KEY, response_cache, archive))
     if settings.GUARDIAN_API_KEY:
-        sources.append(GuardianSource(settings.GUARDIAN_API_KEY))
+        sources.append(GuardianSource(settings.GUARDIAN_API_KEY, response_cache, archive))
     if settings.NYTIMES_API_KEY:
-        sources.append(NYTimesSource(settings.NYTIMES_API_KEY))
+        sources.append(NYTimesSource(settings.NYTIMES_API_KEY, response_cache, archive))
     
     if not sources:
-        print("No news API keys configured. Skipping fetch.")
+        logger.warning("No news API keys configured. Skipping fetch.")
+        await redis_client.aclose()
         await task_engine.dispose()
         return "No sources configured"
     
     # Fetch from last 24 hours
     from_date = datetime.now(timezone.utc) - timedelta(days=1)
     
-    categories = ["Technology", "Business", "Science", "Sports", "Politics"]
+    categories = CATEGORIES
     results = {}
     
+    ingest_queue = None
+    if settings.INGEST_WRITE_BEHIND:
+        ingest_queue = IngestQueue(redis_client)
+        await ingest_queue.ensure_group()
+    
     async with TaskSessionLocal() as db:
-        article_service = ArticleService(db)
-        
         for source in sources:
             source_count = 0
             results[source.source_name] = 0
             
-            for category in categories:
+            for index, category in enumerate(categories):
+                open_for = await breaker.open_for(source.source_name)
+                if open_for:
+                    skipped = categories[index:]
+                    logger.warning(
+                        "Circuit open for %s (%.0fs left). Deferring %s",
+                        source.source_name, open_for, ", ".join(skipped)
+                    )
+                    break
+                
                 try:
-                    print(f"Fetching {category} from {source.source_name}...")
+                    logger.info("Fetching %s from %s...", category, source.source_name)
                     
-                    articles = await source.fetch_articles(
+                    records = await source.fetch_records(
                         category=category.lower() if source.source_name == "NewsAPI" else category,
                         from_date=from_date,
                         page_size=20 # Reduced per category to stay within limits
                     )
                     
-                    new_count = 0
-                    for article_data in articles:
-                        try:
-                            # Always force the category to our standard names for consistent filtering
-                            article_data.category = category.strip()
-                                
-                            article = await article_service.create_article(article_data)
-                            if article:
-                                new_count += 1
-                        except Exception as e:
-                            print(f"Skipping article due to error: {e}")
-                            continue
+                    # Always force the category to our standard names for consistent filtering
+                    for record in records:
+                        record.category = category.strip()
                     
-                    await db.commit()
-                    source_count += new_count
-                    print(f"Added {new_count} new {category} articles from {source.source_name}")
+                    if ingest_queue:
+                        # Write-behind: the ingest writers insert, cluster and tag
+                        await ingest_queue.wait_for_room()
+                        await ingest_queue.push(records)
+                        await response_cache.commit()
+                        await breaker.record_success(source.source_name)
+                        source_count += len(records)
+                        logger.info(
+                            "Queued %d %s articles from %s", len(records), category, source.source_name,
+                            extra={"source": source.source_name, "category": category, "queued": len(records)}
+                        )
+                    else:
+                        new_articles = await _store_records(db, records, story_clusters, redis_client)
+                        await response_cache.commit()
+                        await _after_commit(read_models, new_articles)
+                        await breaker.record_success(source.source_name)
+                        new_count = len(new_articles)
+                        source_count += new_count
+                        logger.info(
+                            "Added %d new %s articles from %s", new_count, category, source.source_name,
+                            extra={"source": source.source_name, "category": category, "inserted": new_count, "duplicates": len(records) - new_count}
+                        )
                     
                     # Small delay between categories for the same source
                     await asyncio.sleep(source.rate_limit_delay)
                     
+                except SourceRateLimited as e:
+                    logger.warning("%s. Deferring remaining categories", e)
+                    await breaker.record_failure(source.source_name, rate_limited=True, retry_after=e.retry_after)
+                    await db.rollback()
+                    response_cache.discard()
+                    story_clusters.discard()
+                    break
+                    
                 except Exception as e:
-                    print(f"Error fetching {category} from {source.source_name}: {e}")
+                    logger.error("Error fetching %s from %s: %s", category, source.source_name, e)
                     await db.rollback()
+                    response_cache.discard()
+                    story_clusters.discard()
+                    if await breaker.record_failure(source.source_name):
+                        break
                     continue
             
             results[source.source_name] = source_count
-            print(f"Total added from {source.source_name}: {source_count}")
+            unchanged, requests = response_cache.skip_rate(source.source_name)
+            logger.info(
+                "Total added from %s: %d (%d/%d upstream responses unchanged and skipped)",
+                source.source_name, source_count, unchanged, requests
+            )
+    
+    # Pre-compute the hot /articles pages now rather than on the first visit
+    # (the ingest writers do it after draining in write-behind mode)
+    if any(results.values()) and settings.CACHE_WARMUP_PAGES > 0 and not ingest_queue:
+        warmup = await warm_search_cache(TaskSessionLocal, CacheManager(redis_client))
+        logger.info(
+            "Cache warm-up: %d keys written in %ss (%d failed)",
+            warmup["keys"], warmup["seconds"], warmup["failed"], extra=warmup
+        )
     
     # Crucial: Close everything
+    await redis_client.aclose()
     await task_engine.dispose()
                 
     return results
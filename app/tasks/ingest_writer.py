@@ -0,0 +1,120 @@
+import asyncio
+import os
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import InterfaceError, OperationalError
+
+from app.core.cache import CacheManager, create_redis_client
+from app.core.metrics import INGEST_BATCH_DURATION, INGEST_BATCH_SIZE
+from app.services.dedupe_service import StoryClusterService
+from app.services.ingest_queue import IngestQueue, decode_record
+from app.services.search_cache import warm_search_cache
+from app.tasks.fetch_articles import _after_commit, _read_models, _store_records
+from app.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+# The database itself is unreachable: keep the batch pending and retry it later
+_CONNECTION_ERRORS = (OperationalError, InterfaceError, OSError)
+
+async def _store_individually(session_factory, entries: List[Tuple[str, str, object]], story_clusters, redis_client):
+    """Isolate the record that broke a batch; returns (new articles, dead entries)"""
+    new_articles, dead = [], []
+    for entry_id, payload, record in entries:
+        try:
+            async with session_factory() as db:
+                new_articles.extend(await _store_records(db, [record], story_clusters, redis_client))
+        except _CONNECTION_ERRORS:
+            story_clusters.discard()
+            raise
+        except Exception as e:
+            story_clusters.discard()
+            dead.append((entry_id, payload, str(e)))
+    return new_articles, dead
+
+async def _run_ingest_writer_async(consumer: Optional[str] = None, drain: bool = False) -> Dict[str, int]:
+    """
+    Drain the ingest stream into Postgres until stopped (or, with `drain`,
+    until it is empty). Several writers may run at once under different
+    consumer names; each batch is committed before it is acknowledged.
+    """
+    from app.core.database import create_db_engine, AsyncSession, async_sessionmaker
+
+    consumer = consumer or f"{socket.gethostname()}-{os.getpid()}"
+    task_engine = create_db_engine(
+        settings.DATABASE_URL, pool_size=max(2, settings.CACHE_WARMUP_CONCURRENCY), max_overflow=0
+    )
+    TaskSessionLocal = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
+    redis_client = create_redis_client(max_connections=max(2, settings.CACHE_WARMUP_CONCURRENCY))
+    queue = IngestQueue(redis_client)
+    story_clusters = StoryClusterService(redis_client)
+    read_models = _read_models(redis_client)
+
+    totals = {"batches": 0, "records": 0, "inserted": 0, "dead": 0}
+    inserted_since_warmup = 0
+    logger.info("Ingest writer %s started", consumer)
+    try:
+        await queue.ensure_group()
+        while True:
+            batch = await queue.read_batch(consumer)
+            if not batch:
+                # Caught up: pre-compute the hot pages once per burst of inserts
+                if inserted_since_warmup and settings.CACHE_WARMUP_PAGES > 0:
+                    await warm_search_cache(TaskSessionLocal, CacheManager(redis_client))
+                    inserted_since_warmup = 0
+                if drain:
+                    break
+                continue
+
+            entries, dead = [], []
+            for entry_id, payload in batch:
+                try:
+                    entries.append((entry_id, payload, decode_record(payload)))
+                except (ValueError, TypeError, KeyError) as e:
+                    dead.append((entry_id, payload, f"undecodable: {e}"))
+
+            started = time.perf_counter()
+            try:
+                try:
+                    async with TaskSessionLocal() as db:
+                        new_articles = await _store_records(db, [record for _, _, record in entries], story_clusters, redis_client)
+                except _CONNECTION_ERRORS:
+                    raise
+                except Exception as e:
+                    story_clusters.discard()
+                    logger.warning("Ingest batch of %d failed (%s); storing records one by one", len(entries), e)
+                    new_articles, failed = await _store_individually(TaskSessionLocal, entries, story_clusters, redis_client)
+                    dead.extend(failed)
+            except _CONNECTION_ERRORS as e:
+                story_clusters.discard()
+                logger.error("Ingest writer cannot reach the database: %s. Retrying in 5s", e)
+                await asyncio.sleep(5)
+                continue
+
+            dead_ids = {entry_id for entry_id, _, _ in dead}
+            await queue.ack([entry_id for entry_id, _, _ in entries if entry_id not in dead_ids])
+            if dead:
+                logger.error("Moved %d ingest entries to the dead-letter stream", len(dead))
+                await queue.bury(dead)
+
+            INGEST_BATCH_SIZE.observe(len(batch))
+            INGEST_BATCH_DURATION.observe(time.perf_counter() - started)
+            await _after_commit(read_models, new_articles)
+
+            totals["batches"] += 1
+            totals["records"] += len(batch)
+            totals["inserted"] += len(new_articles)
+            totals["dead"] += len(dead)
+            inserted_since_warmup += len(new_articles)
+            logger.info(
+                "Wrote ingest batch: %d new of %d (%d behind)", len(new_articles), len(batch), await queue.backlog(),
+                extra={"consumer": consumer, "records": len(batch), "inserted": len(new_articles), "dead": len(dead)}
+            )
+    finally:
+        await redis_client.aclose()
+        await task_engine.dispose()
+    return totals
@@ -0,0 +1,134 @@
+import asyncio
+
+from app.tasks import celery_app
+from app.core.cache import create_redis_client
+from app.services.facet_service import FacetService
+from app.services.ranking_service import RankingService
+from app.services.similarity_index import SimilarityIndex, embed
+from app.services.suggest_service import SuggestService
+from app.services.trending_service import TrendingService
+from app.config import get_settings
+from app.core.logger import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+@celery_app.task(name="reconcile_facets")
+def reconcile_facets():
+    """
+    Rebuild the facet counters from the articles table.
+    """
+    return asyncio.run(_reconcile_facets_async())
+
+async def _reconcile_facets_async():
+    from app.core.database import create_db_engine, AsyncSession, async_sessionmaker
+    
+    task_engine = create_db_engine(settings.DATABASE_URL, pool_size=1, max_overflow=0)
+    TaskSessionLocal = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
+    redis_client = create_redis_client(max_connections=2)
+    
+    try:
+        async with TaskSessionLocal() as db:
+            result = await FacetService(redis_client).rebuild(db)
+        logger.info("Facets reconciled: %s", result)
+        return result
+    finally:
+        await redis_client.aclose()
+        await task_engine.dispose()
+
+@celery_app.task(name="rebuild_similarity_index")
+def rebuild_similarity_index():
+    """
+    Rebuild the related-articles vector index from the database.
+    """
+    return asyncio.run(_rebuild_similarity_index_async())
+
+async def _rebuild_similarity_index_async():
+    from sqlalchemy import select
+    from sqlalchemy.sql import func
+    from app.core.database import create_db_engine, AsyncSession, async_sessionmaker
+    from app.models.article import Article
+    from app.models.tag import ArticleTag
+    
+    task_engine = create_db_engine(settings.DATABASE_URL, pool_size=1, max_overflow=0)
+    TaskSessionLocal = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
+    
+    query = (
+        select(Article.id, Article.title, func.array_remove(func.array_agg(ArticleTag.tag), None))
+        .outerjoin(ArticleTag, ArticleTag.article_id == Article.id)
+        .group_by(Article.id)
+        .order_by(Article.id)
+    )
+    
+    index = SimilarityIndex()
+    # Rows ingestion appends from here on are carried into the new index
+    since = index.size()
+    try:
+        async with TaskSessionLocal() as db:
+            rows = []
+            async for article_id, title, tags in await db.stream(query):
+                rows.append((article_id, embed(title, tags or [])))
+        count = await asyncio.to_thread(index.write_all, rows, since=since)
+        logger.info("Similarity index rebuilt with %d articles", count)
+        return count
+    finally:
+        await task_engine.dispose()
+
+@celery_app.task(name="refresh_rank_scores")
+def refresh_rank_scores():
+    """
+    Recompute rank_score for recent articles (ranked feed ordering).
+    """
+    return asyncio.run(_refresh_rank_scores_async())
+
+async def _refresh_rank_scores_async():
+    from app.core.database import create_db_engine, AsyncSession, async_sessionmaker
+    
+    task_engine = create_db_engine(settings.DATABASE_URL, pool_size=1, max_overflow=0)
+    TaskSessionLocal = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
+    
+    try:
+        async with TaskSessionLocal() as db:
+            count = await RankingService(db).refresh()
+            await db.commit()
+        logger.info("Rank scores refreshed for %d articles", count)
+        return count
+    finally:
+        await task_engine.dispose()
+
+@celery_app.task(name="refresh_trending")
+def refresh_trending():
+    """
+    Re-fold the trending ranking so scores decay while nothing is ingested.
+    """
+    return asyncio.run(_refresh_trending_async())
+
+async def _refresh_trending_async():
+    redis_client = create_redis_client(max_connections=1)
+    try:
+        await TrendingService(redis_client).refresh()
+    finally:
+        await redis_client.aclose()
+
+@celery_app.task(name="rebuild_suggest_index")
+def rebuild_suggest_index():
+    """
+    Rebuild the autocomplete prefix index from the database.
+    """
+    return asyncio.run(_rebuild_suggest_index_async())
+
+async def _rebuild_suggest_index_async():
+    from app.core.database import create_db_engine, AsyncSession, async_sessionmaker
+    
+    task_engine = create_db_engine(settings.DATABASE_URL, pool_size=1, max_overflow=0)
+    TaskSessionLocal = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
+    redis_client = create_redis_client(max_connections=2)
+    
+    try:
+        async with TaskSessionLocal() as db:
+            result = await SuggestService(redis_client).rebuild(db)
+        logger.info("Suggest index rebuilt: %s", result)
+        return result
+    finally:
+        await redis_client.aclose()
+        await task_engine.dispose()
@@ -0,0 +1,103 @@
+"""
+Per-request logging cost on the calling (event loop) thread: the old
+unbuffered print() diagnostics vs. the queue-based logging pipeline, with
+the diagnostics at DEBUG (production default, filtered) and enabled.
+
+Output goes to a pipe drained by a background thread, like stdout under a
+process manager or container runtime.
+
+    python benchmarks/bench_logging.py [--requests 20000]
+"""
+import argparse
+import io
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SOURCES = ["Guardian", "NYTimes", "NewsAPI"]
+CATEGORIES = ["Technology", "Business", "Science", "Sports", "Politics"]
+
+
+class Row:
+    def __init__(self, i):
+        self.source = SOURCES[i % 3]
+        self.category = CATEGORIES[i % 5]
+
+
+def pipe_stream():
+    """Unbuffered writer into an OS pipe, drained by a reader thread"""
+    read_fd, write_fd = os.pipe()
+
+    def drain():
+        with os.fdopen(read_fd, "rb") as reader:
+            while reader.read(65536):
+                pass
+
+    threading.Thread(target=drain, daemon=True).start()
+    return io.TextIOWrapper(os.fdopen(write_fd, "wb", buffering=0), write_through=True)
+
+
+def with_print(stream, articles, key):
+    # Old diagnostics: search_articles + CacheManager.set
+    sources_found = set(a.source for a in articles)
+    categories_found = set(a.category for a in articles)
+    print(f"DEBUG SEARCH: Found {len(articles)} articles. Sources: {sources_found}, Categories: {categories_found}", file=stream)
+    print(f"DEBUG: Cached key {key} for 300s", file=stream)
+
+
+def with_logging(search_logger, cache_logger, articles, key):
+    if articles and search_logger.isEnabledFor(logging.DEBUG):
+        search_logger.debug(
+            "Search found %d articles",
+            len(articles),
+            extra={
+                "total": 500,
+                "sources": sorted({a.source for a in articles}),
+                "categories": sorted({str(a.category) for a in articles}),
+            }
+        )
+    cache_logger.debug("Cached key %s for %ss", key, 300)
+
+
+def timed(label, requests, fn):
+    start = time.perf_counter()
+    for i in range(requests):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed / requests * 1e6:8.2f} us/request")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    from app.core.logger import get_logger, setup_logging, stop_logging
+
+    articles = [Row(i) for i in range(12)]
+    key = "articles:search:0123456789abcdef0123456789abcdef"
+    stream = pipe_stream()
+
+    timed("print() (before)", args.requests, lambda i: with_print(stream, articles, key))
+
+    search_logger = get_logger("app.services.article_service")
+    cache_logger = get_logger("app.core.cache")
+
+    setup_logging(level="INFO", levels={}, sampling={}, json_format=True, stream=stream)
+    timed("queue logging, DEBUG filtered", args.requests, lambda i: with_logging(search_logger, cache_logger, articles, key))
+
+    setup_logging(level="DEBUG", levels={}, sampling={}, json_format=True, stream=stream)
+    timed("queue logging, DEBUG enabled", args.requests, lambda i: with_logging(search_logger, cache_logger, articles, key))
+
+    setup_logging(level="DEBUG", levels={}, sampling={"app": 0.01}, json_format=True, stream=stream)
+    timed("queue logging, DEBUG sampled 1%", args.requests, lambda i: with_logging(search_logger, cache_logger, articles, key))
+
+    stop_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Search requests per second through the SQLAlchemy layer: statements rebuilt
+on every call and committed sessions (before) vs. per-shape cached
+statements in read-only, never-committed sessions (after).
+
+Runs against in-memory SQLite so it needs no server and isolates the
+Python-side cost; the Postgres-side savings (reused prepared statements,
+no COMMIT round trip) come on top in production.
+
+    python benchmarks/bench_search.py [--requests 5000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+SOURCES = ["Guardian", "NYTimes", "NewsAPI"]
+CATEGORIES = ["Technology", "Business", "Science", "Sports", "Politics"]
+
+# The feeds the API mostly serves: homepage, category tabs, source filters, a few searches
+SEARCHES = (
+    [{}]
+    + [{"category": c} for c in CATEGORIES]
+    + [{"source": s} for s in SOURCES]
+    + [{"query": q} for q in ("economy", "election", "climate")]
+    + [{"category": "Sports", "sort": "ranked"}, {"collapse_clusters": True}]
+)
+
+
+def sqlite_engine(rows: int):
+    engine = create_engine("sqlite://")
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        # Plain DDL: the model's JSONB and GIN index are Postgres-only
+        conn.execute(text(
+            "CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT, description TEXT, content TEXT, "
+            "url TEXT, url_hash TEXT, source TEXT, author TEXT, category TEXT, published_at TIMESTAMP, "
+            "image_url TEXT, read_time_minutes INTEGER, story_cluster_id INTEGER, rank_score FLOAT, "
+            "raw_data TEXT, created_at TIMESTAMP, updated_at TIMESTAMP)"
+        ))
+        conn.execute(text("CREATE TABLE article_tags (tag TEXT, article_id INTEGER, PRIMARY KEY (tag, article_id))"))
+        conn.execute(
+            text(
+                "INSERT INTO articles (id, title, description, url, source, category, published_at, "
+                "read_time_minutes, story_cluster_id, rank_score, created_at) VALUES "
+                "(:id, :title, :description, :url, :source, :category, :published_at, 3, :id, :rank, :published_at)"
+            ),
+            [
+                {
+                    "id": i,
+                    "title": f"Story {i} about the economy and the election",
+                    "description": "A short summary of the story",
+                    "url": f"https://example.com/{i}",
+                    "source": SOURCES[i % 3],
+                    "category": CATEGORIES[i % 5],
+                    "published_at": now - timedelta(minutes=i),
+                    "rank": 100.0 / (i + 1),
+                }
+                for i in range(1, rows + 1)
+            ],
+        )
+    return engine
+
+
+def search_before(session: Session, filters: dict):
+    from app.services.article_service import _search_statements, ArticleService
+
+    # The pre-cache behaviour: fresh statement objects (and cache keys) per call
+    _, _, params = ArticleService.search_statements(**filters)
+    count_query, articles_query = _search_statements.__wrapped__(
+        "pattern" in params, "source" in params, _category_group(filters),
+        "from_date" in params, "to_date" in params, "tag" in params,
+        filters.get("collapse_clusters", False), filters.get("sort", "published"),
+    )
+    total = session.execute(count_query, params).scalar()
+    articles = session.execute(articles_query, {**params, "skip": 0, "limit": 20}).scalars().all()
+    session.commit()
+    return total, articles
+
+
+def search_after(session: Session, filters: dict):
+    from app.services.article_service import ArticleService
+
+    count_query, articles_query, params = ArticleService.search_statements(**filters)
+    total = session.execute(count_query, params).scalar()
+    articles = session.execute(articles_query, {**params, "skip": 0, "limit": 20}).scalars().all()
+    return total, articles
+
+
+def _category_group(filters: dict):
+    from app.services.article_service import CATEGORY_ALIASES
+
+    category = filters.get("category")
+    if not category:
+        return None
+    return category.lower() if category.lower() in CATEGORY_ALIASES else "other"
+
+
+def timed(label: str, requests: int, engine, search, **session_kw):
+    # Warm SQLAlchemy's compiled cache the same way for both variants
+    with Session(engine, **session_kw) as session:
+        for filters in SEARCHES:
+            search(session, filters)
+
+    started = time.perf_counter()
+    for i in range(requests):
+        # One session per request, as the API dependencies do
+        with Session(engine, **session_kw) as session:
+            search(session, SEARCHES[i % len(SEARCHES)])
+    elapsed = time.perf_counter() - started
+    print(f"{label:<40} {requests / elapsed:8.0f} searches/s  {elapsed / requests * 1e6:7.0f} µs/search")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=100)  # Small, so the SQLAlchemy layer dominates
+    args = parser.parse_args()
+
+    engine = sqlite_engine(args.rows)
+    timed("rebuilt statements, commit (before)", args.requests, engine, search_before)
+    timed("cached statements, read-only (after)", args.requests, engine, search_after, autoflush=False)
+
+
+if __name__ == "__main__":
+    main()
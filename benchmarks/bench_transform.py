@@ -0,0 +1,98 @@
+"""
+Per-article transform cost: upstream item -> ArticleData (Pydantic) -> Article
+ORM object, as GuardianSource._transform_article did before IngestRecord
+(reproduced inline below), vs. upstream item -> IngestRecord -> insert-ready
+row dict.
+
+    python benchmarks/bench_transform.py [--items 20000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.news_sources.base import ArticleData  # noqa: E402
+
+
+def guardian_item(i: int) -> dict:
+    return {
+        "webTitle": f"Story number {i} about the economy",
+        "webUrl": f"https://www.theguardian.com/business/2026/jan/01/story-{i}",
+        "webPublicationDate": "2026-01-01T10:00:00Z",
+        "sectionName": "Business",
+        "fields": {
+            "trailText": "A short summary of the story",
+            "body": "<p>Body text</p>" * 20,
+            "byline": "A Reporter",
+            "thumbnail": "https://media.guim.co.uk/thumb.jpg",
+        },
+    }
+
+
+def baseline_transform(raw: dict):
+    """GuardianSource._transform_article before IngestRecord existed"""
+    fields = raw.get("fields", {})
+    title = raw.get("webTitle")
+    url = raw.get("webUrl")
+    if not title or not url:
+        raise ValueError("Missing title or URL in Guardian article")
+
+    return ArticleData(
+        title=title,
+        description=fields.get("trailText"),
+        content=fields.get("body"),
+        url=url,
+        source="Guardian",
+        author=fields.get("byline"),
+        category=raw.get("sectionName"),
+        published_at=datetime.fromisoformat(
+            raw.get("webPublicationDate", datetime.now(timezone.utc).isoformat()).replace("Z", "+00:00")
+        ),
+        image_url=fields.get("thumbnail"),
+        raw_data=raw
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=20000)
+    args = parser.parse_args()
+
+    from app.models.article import Article
+    from app.services.news_sources.guardian import GuardianSource
+
+    source = GuardianSource("bench")
+    items = [guardian_item(i) for i in range(args.items)]
+
+    def before():
+        for raw in items:
+            data = baseline_transform(raw)
+            Article(
+                title=data.title,
+                description=data.description,
+                content=data.content,
+                url=data.url,
+                source=data.source,
+                author=data.author,
+                category=data.category,
+                published_at=data.published_at,
+                image_url=data.image_url,
+                raw_data=data.raw_data,
+            )
+
+    def after():
+        for record in source._transform_items(items):
+            record.to_row()
+
+    for name, fn in (("ArticleData + ORM", before), ("IngestRecord + row", after)):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>20}: {elapsed / args.items * 1e6:7.2f} us/article")
+
+
+if __name__ == "__main__":
+    main()
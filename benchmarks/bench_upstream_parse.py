@@ -0,0 +1,99 @@
+"""
+Peak memory and parse time of upstream payloads: whole-document
+`json.loads` (what `response.json()` did) vs. the streaming, field-selective
+ItemStreamParser used by the sources.
+
+    python benchmarks/bench_upstream_parse.py                    # synthetic Guardian payload
+    python benchmarks/bench_upstream_parse.py --payload dump.json --source guardian
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.news_sources.streaming import ItemStreamParser, project
+
+CHUNK_SIZE = 64 * 1024
+
+
+def synthetic_guardian_payload(items: int = 50, body_kb: int = 60) -> bytes:
+    """A `show-fields=all` style Guardian search response"""
+    paragraph = "<p>" + ("Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20) + "</p>"
+    body = paragraph * max(1, body_kb * 1024 // len(paragraph))
+    results = [
+        {
+            "id": f"world/2026/jan/01/story-{i}",
+            "sectionName": "World news",
+            "webPublicationDate": "2026-01-01T10:00:00Z",
+            "webTitle": f"Story {i}",
+            "webUrl": f"https://www.theguardian.com/world/story-{i}",
+            "fields": {
+                "headline": f"Story {i}",
+                "trailText": "A short summary",
+                "byline": "A Reporter",
+                "thumbnail": "https://media.guim.co.uk/thumb.jpg",
+                "main": body[: len(body) // 4],
+                "body": body,
+                "bodyText": body.replace("<p>", "").replace("</p>", "\n"),
+                "wordcount": "2000",
+            },
+        }
+        for i in range(items)
+    ]
+    return json.dumps({"response": {"status": "ok", "results": results}}).encode()
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    from app.services.news_sources.guardian import GuardianSource
+    from app.services.news_sources.newsapi import NewsAPISource
+    from app.services.news_sources.nytimes import NYTimesSource
+
+    sources = {"guardian": GuardianSource, "newsapi": NewsAPISource, "nytimes": NYTimesSource}
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payload", help="Recorded upstream response body (JSON)")
+    parser.add_argument("--source", choices=sources, default="guardian")
+    args = parser.parse_args()
+
+    source = sources[args.source]
+    if args.payload:
+        with open(args.payload, "rb") as f:
+            payload = f.read()
+    else:
+        payload = synthetic_guardian_payload()
+
+    def whole_document():
+        data = json.loads(payload)
+        node = data
+        for key in source.ITEMS_PATH.split(".")[:-1]:
+            node = node.get(key, {})
+        return [project(item, source.ITEM_FIELDS) for item in node]
+
+    def streaming():
+        stream = ItemStreamParser(source.ITEMS_PATH, source.ITEM_FIELDS)
+        for offset in range(0, len(payload), CHUNK_SIZE):
+            stream.feed(payload[offset:offset + CHUNK_SIZE])
+        return stream.close()
+
+    print(f"payload: {len(payload) / 1024 / 1024:.1f} MiB ({args.source})")
+    for name, fn in (("json.loads", whole_document), ("streaming", streaming)):
+        items, elapsed, peak = measure(fn)
+        print(f"{name:>12}: {len(items)} items  {elapsed * 1000:8.1f} ms  peak {peak / 1024 / 1024:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
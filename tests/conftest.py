@@ -0,0 +1,285 @@
+import fnmatch
+import time
+
+import pytest
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on `execute()`, like redis-py"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        method = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            self._calls.append((method, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        calls, self._calls = self._calls, []
+        return [await method(*args, **kwargs) for method, args, kwargs in calls]
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the subset of redis.asyncio (decode_responses=True)
+    the services use. Expiry is tracked against `self.clock()`, which tests
+    may replace.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.clock = time.time
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def aclose(self):
+        pass
+
+    def _live(self, key):
+        deadline = self.expiry.get(key)
+        if deadline is not None and deadline <= self.clock():
+            self.data.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.data
+
+    def _get(self, key, default):
+        if not self._live(key):
+            self.data[key] = default
+        return self.data[key]
+
+    # Keys
+
+    async def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            if self._live(key):
+                removed += 1
+            self.data.pop(key, None)
+            self.expiry.pop(key, None)
+        return removed
+
+    unlink = delete
+
+    async def exists(self, *keys):
+        return sum(1 for key in keys if self._live(key))
+
+    async def expire(self, key, seconds):
+        if not self._live(key):
+            return False
+        self.expiry[key] = self.clock() + seconds
+        return True
+
+    async def pttl(self, key):
+        if not self._live(key):
+            return -2
+        deadline = self.expiry.get(key)
+        return -1 if deadline is None else int((deadline - self.clock()) * 1000)
+
+    async def scan_iter(self, match="*"):
+        for key in list(self.data):
+            if self._live(key) and fnmatch.fnmatchcase(key, match):
+                yield key
+
+    # Strings
+
+    async def get(self, key):
+        return self.data[key] if self._live(key) else None
+
+    async def mget(self, keys):
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and self._live(key):
+            return None
+        self.data[key] = str(value)
+        self.expiry.pop(key, None)
+        if ex is not None:
+            self.expiry[key] = self.clock() + ex
+        if px is not None:
+            self.expiry[key] = self.clock() + px / 1000
+        return True
+
+    async def setex(self, key, seconds, value):
+        return await self.set(key, value, ex=seconds)
+
+    async def incr(self, key):
+        value = int(self.data[key]) + 1 if self._live(key) else 1
+        self.data[key] = str(value)
+        return value
+
+    # Hashes
+
+    async def hget(self, key, field):
+        return self.data[key].get(field) if self._live(key) else None
+
+    async def hmget(self, key, *fields):
+        if len(fields) == 1 and isinstance(fields[0], (list, tuple)):
+            fields = fields[0]
+        values = self.data[key] if self._live(key) else {}
+        return [values.get(field) for field in fields]
+
+    async def hgetall(self, key):
+        return dict(self.data[key]) if self._live(key) else {}
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        values = self._get(key, {})
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        added = sum(1 for name in items if name not in values)
+        values.update({name: str(v) for name, v in items.items()})
+        return added
+
+    async def hincrby(self, key, field, amount=1):
+        values = self._get(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+        return int(values[field])
+
+
+    # Sets
+
+    async def sadd(self, key, *members):
+        values = self._get(key, set())
+        added = sum(1 for member in map(str, members) if member not in values)
+        values.update(map(str, members))
+        return added
+
+    async def smembers(self, key):
+        return set(self.data[key]) if self._live(key) else set()
+
+    async def sunion(self, keys):
+        return set().union(*[await self.smembers(key) for key in keys])
+
+    # Sorted sets
+
+    async def zadd(self, key, mapping):
+        values = self._get(key, {})
+        added = sum(1 for member in mapping if str(member) not in values)
+        values.update({str(member): float(score) for member, score in mapping.items()})
+        return added
+
+    async def zincrby(self, key, amount, member):
+        values = self._get(key, {})
+        values[str(member)] = values.get(str(member), 0.0) + amount
+        return values[str(member)]
+
+    async def zunionstore(self, dest, keys):
+        weights = keys if isinstance(keys, dict) else dict.fromkeys(keys, 1)
+        union = {}
+        for key, weight in weights.items():
+            for member, score in (self.data[key] if self._live(key) else {}).items():
+                union[member] = union.get(member, 0.0) + score * weight
+        await self.delete(dest)
+        if union:
+            self.data[dest] = union
+        return len(union)
+
+    async def zrevrange(self, key, start, end, withscores=False):
+        values = self.data[key] if self._live(key) else {}
+        ranked = sorted(values.items(), key=lambda item: (-item[1], item[0]))
+        ranked = ranked[start:None if end == -1 else end + 1]
+        return ranked if withscores else [member for member, _ in ranked]
+
+    async def zscore(self, key, member):
+        return (self.data[key] if self._live(key) else {}).get(str(member))
+
+    async def zmscore(self, key, members):
+        return [await self.zscore(key, member) for member in members]
+
+
+    # Streams: entries keyed "<n>-0", one pending list per consumer group
+
+    def _stream(self, name):
+        return self._get(name, {"entries": {}, "groups": {}, "seq": 0})
+
+    async def xgroup_create(self, name, group, id="$", mkstream=False):
+        from redis.exceptions import ResponseError
+        stream = self._stream(name)
+        if group in stream["groups"]:
+            raise ResponseError("BUSYGROUP Consumer Group name already exists")
+        last = stream["seq"] if id == "$" else int(id.split("-")[0])
+        stream["groups"][group] = {"last": last, "pending": {}}
+        return True
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        stream = self._stream(name)
+        stream["seq"] += 1
+        entry_id = f"{stream['seq']}-0"
+        stream["entries"][entry_id] = {k: str(v) for k, v in fields.items()}
+        return entry_id
+
+    async def xlen(self, name):
+        return len(self.data[name]["entries"]) if self._live(name) else 0
+
+    async def xrange(self, name):
+        return list(self.data[name]["entries"].items()) if self._live(name) else []
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        # Never blocks: an empty read stands in for the block timeout
+        response = []
+        for name in streams:
+            stream = self._stream(name)
+            state = stream["groups"][group]
+            entries = [
+                (entry_id, fields) for entry_id, fields in stream["entries"].items()
+                if int(entry_id.split("-")[0]) > state["last"]
+            ][:count]
+            for entry_id, _ in entries:
+                state["pending"][entry_id] = [consumer, self.clock()]
+                state["last"] = int(entry_id.split("-")[0])
+            if entries:
+                response.append([name, entries])
+        return response
+
+    async def xautoclaim(self, name, group, consumer, min_idle_time, start_id="0-0", count=100):
+        # Like Redis 7: scans at most count * 10 pending entries from `start_id`
+        # and returns where the next call should resume ("0-0" after the end)
+        stream = self._stream(name)
+        pending = stream["groups"][group]["pending"]
+        start = int(start_id.split("-")[0])
+        ids = sorted((entry_id for entry_id in pending if int(entry_id.split("-")[0]) >= start),
+                     key=lambda entry_id: int(entry_id.split("-")[0]))
+        claimed, deleted, scanned = [], [], 0
+        for entry_id in ids:
+            if len(claimed) >= count or scanned >= count * 10:
+                return [entry_id, claimed, deleted]
+            scanned += 1
+            if (self.clock() - pending[entry_id][1]) * 1000 < min_idle_time:
+                continue
+            if entry_id not in stream["entries"]:
+                del pending[entry_id]
+                deleted.append(entry_id)
+                continue
+            pending[entry_id] = [consumer, self.clock()]
+            claimed.append((entry_id, stream["entries"][entry_id]))
+        return ["0-0", claimed, deleted]
+
+    def pending(self, name, group):
+        """Pending entry ids of a consumer group and the consumer holding each"""
+        return {entry_id: owner for entry_id, (owner, _) in self._stream(name)["groups"][group]["pending"].items()}
+
+    async def xack(self, name, group, *entry_ids):
+        pending = self._stream(name)["groups"][group]["pending"]
+        return sum(1 for entry_id in entry_ids if pending.pop(entry_id, None))
+
+    async def xdel(self, name, *entry_ids):
+        entries = self._stream(name)["entries"]
+        return sum(1 for entry_id in entry_ids if entries.pop(entry_id, None) is not None)
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
@@ -38,3 +38,39 @@ async def test_article_service_create(mock_db_session):
     assert article is not None
     assert article.title == "Test Article"
     mock_db_session.add.assert_called_once()
+
+def test_change_token_round_trip():
+    from datetime import timezone
+    from app.services.article_service import decode_change_token, encode_change_token
+
+    changed_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    assert decode_change_token(encode_change_token(changed_at, 42)) == (changed_at, 42)
+
+    for bad in ["not-a-token", encode_change_token(changed_at, 1)[:-4], "MjAyNnwx"]:
+        with pytest.raises(ValueError):
+            decode_change_token(bad)
+
+def test_search_statements_are_cached_per_filter_shape():
+    first = ArticleService.search_statements(query="fed", category="Sports", skip=0, limit=20)
+    second = ArticleService.search_statements(query="rates", category="sports", skip=40, limit=20)
+    assert first[0] is second[0] and first[1] is second[1]
+    assert second[2] == {"pattern": "%rates%"}
+
+    other = ArticleService.search_statements(category="Business", tag=" AI ")
+    assert other[1] is not first[1]
+    assert other[2] == {"category": "Business", "tag": "ai"}
+
+def test_content_fingerprint_tracks_reader_visible_fields():
+    def article(**overrides):
+        values = dict(
+            title="Rates held", description="The Fed paused", content="Full text", url="https://example.com/fed",
+            source="NewsAPI", published_at=datetime(2026, 1, 1), raw_data={"etag": "a"}, category="Business"
+        )
+        values.update(overrides)
+        return ArticleData(**values)
+
+    original = ArticleService.content_fingerprint(article())
+    assert ArticleService.content_fingerprint(article(raw_data={"etag": "b"}, category="Politics")) == original
+    assert ArticleService.content_fingerprint(article(content="Full text, corrected")) != original
+    # Field boundaries count: text moving between fields is a change
+    assert ArticleService.content_fingerprint(article(title="Rates heldThe Fed paused", description="")) != original
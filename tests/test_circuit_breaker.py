@@ -0,0 +1,89 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from app.core.circuit_breaker import retry_after_from_headers
+
+
+def test_retry_after_seconds():
+    assert retry_after_from_headers({"retry-after": "120"}) == 120.0
+
+
+def test_retry_after_http_date():
+    delay = retry_after_from_headers({"retry-after": formatdate(time.time() + 60, usegmt=True)})
+    assert 55 <= delay <= 60
+
+
+def test_ratelimit_reset_epoch_and_delta():
+    assert 25 <= retry_after_from_headers({"x-ratelimit-reset": str(int(time.time()) + 30)}) <= 30
+    assert retry_after_from_headers({"x-ratelimit-reset": "45"}) == 45.0
+
+
+def test_no_hint():
+    assert retry_after_from_headers({}) is None
+    assert retry_after_from_headers({"retry-after": "soon"}) is None
+
+
+def breaker(redis_client, **overrides):
+    from app.core.circuit_breaker import CircuitBreaker
+    options = dict(failure_threshold=3, cooldown=60, max_cooldown=600, max_retry_after=90000)
+    options.update(overrides)
+    return CircuitBreaker(redis_client, **options)
+
+
+@pytest.mark.asyncio
+async def test_opens_at_failure_threshold(fake_redis):
+    circuit = breaker(fake_redis)
+    assert [await circuit.record_failure("Guardian") for _ in range(3)] == [False, False, True]
+    assert 59 <= await circuit.open_for("Guardian") <= 60
+    assert not await circuit.is_open("NYTimes")
+
+
+@pytest.mark.asyncio
+async def test_cooldown_doubles_per_trip_up_to_max(fake_redis):
+    circuit = breaker(fake_redis, failure_threshold=1)
+    delays = []
+    for _ in range(6):
+        await circuit.record_failure("Guardian")
+        delays.append(round(await circuit.open_for("Guardian")))
+        await fake_redis.delete("circuit:Guardian:open")  # Cooldown elapsed
+    assert delays == [60, 120, 240, 480, 600, 600]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_trips_at_once_for_retry_after(fake_redis):
+    circuit = breaker(fake_redis)
+    assert await circuit.record_failure("NewsAPI", rate_limited=True, retry_after=30)
+    assert 29 <= await circuit.open_for("NewsAPI") <= 30
+
+    # A daily quota reset is honoured beyond max_cooldown
+    assert await circuit.record_failure("NewsAPI", rate_limited=True, retry_after=20 * 3600)
+    assert await circuit.open_for("NewsAPI") > 19 * 3600
+
+    # Without a hint, 429 falls back to the doubling cooldown
+    await fake_redis.delete("circuit:NewsAPI:open", "circuit:NewsAPI:trips")
+    assert await circuit.record_failure("NewsAPI", rate_limited=True)
+    assert 59 <= await circuit.open_for("NewsAPI") <= 60
+
+
+@pytest.mark.asyncio
+async def test_success_resets_failures_and_trips(fake_redis):
+    circuit = breaker(fake_redis)
+    await circuit.record_failure("Guardian")
+    await circuit.record_failure("Guardian")
+    await circuit.record_success("Guardian")
+    assert not await circuit.record_failure("Guardian")
+
+    circuit = breaker(fake_redis, failure_threshold=1)
+    await circuit.record_failure("Guardian")
+    await circuit.record_failure("Guardian")
+    await fake_redis.delete("circuit:Guardian:open")
+    await circuit.record_success("Guardian")
+    await circuit.record_failure("Guardian")
+    assert 59 <= await circuit.open_for("Guardian") <= 60
+
+
+def test_explicit_zero_is_not_replaced_by_the_default():
+    circuit = breaker(None, failure_threshold=0, cooldown=0)
+    assert circuit.failure_threshold == 0 and circuit.cooldown == 0
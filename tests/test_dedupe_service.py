@@ -0,0 +1,47 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.dedupe_service import StoryClusterService, band_keys, minhash, normalize, shingles
+
+
+def keys(title, description=None):
+    return set(band_keys(minhash(shingles(normalize(title, description)))))
+
+
+def test_normalize_strips_markup_and_publisher_suffix():
+    assert normalize("Markets rally as inflation cools - BBC News", "<p>Stocks <b>rose</b></p>") == [
+        "markets", "rally", "as", "inflation", "cools", "stocks", "rose"
+    ]
+
+
+def test_near_duplicates_share_a_band():
+    a = keys(
+        "Central bank raises interest rates to 5.5% amid inflation fears - Reuters",
+        "The central bank raised interest rates by a quarter point on Wednesday, citing persistent inflation.",
+    )
+    b = keys(
+        "Central bank raises interest rates to 5.5% amid inflation fears",
+        "The central bank raised interest rates by a quarter point on Wednesday citing persistent inflation pressures.",
+    )
+    assert a & b
+
+
+def test_unrelated_stories_do_not_collide():
+    a = keys("Central bank raises interest rates amid inflation fears", "Rates rose a quarter point.")
+    b = keys("Local team wins championship after dramatic overtime", "Fans celebrated late into the night.")
+    assert not a & b
+
+
+@pytest.mark.asyncio
+async def test_assign_clusters_within_batch():
+    redis_client = AsyncMock()
+    redis_client.mget.side_effect = lambda keys: [None] * len(keys)
+    service = StoryClusterService(redis_client)
+
+    assignments = await service.assign_clusters([
+        (10, "Volcano erupts in Iceland forcing evacuations", "Thousands were evacuated overnight."),
+        (11, "Volcano erupts in Iceland forcing evacuations - AP", "Thousands were evacuated overnight."),
+        (12, "New smartphone unveiled at tech conference", None),
+    ])
+    assert assignments == {10: 10, 11: 10, 12: 12}
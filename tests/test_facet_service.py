@@ -0,0 +1,73 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app.services.facet_service import FacetService
+
+TODAY = datetime.now(timezone.utc).date()
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Answers the rebuild queries in the order FacetService issues them"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+
+    async def execute(self, statement):
+        return FakeResult(self.results.pop(0))
+
+
+def article(source, category, published_at=None):
+    return {"source": source, "category": category, "published_at": published_at or datetime.now(timezone.utc)}
+
+
+@pytest.mark.asyncio
+async def test_record_increments_overall_and_daily_counts(fake_redis):
+    facets = FacetService(fake_redis)
+    await facets.record([
+        article("Guardian", "Sports"),
+        article("Guardian", "Business"),
+        article("NYTimes", "Sports", "2026-01-02T23:30:00-05:00"),
+        article("NYTimes", None),
+    ])
+
+    counts = await facets.get()
+    assert counts["sources"] == {"Guardian": 2, "NYTimes": 2}
+    assert counts["categories"] == {"Sports": 2, "Business": 1}
+    assert counts["dates"] == {TODAY.isoformat(): 3}
+
+    # Days are bucketed in UTC
+    day = await facets.get(day=date(2026, 1, 3))
+    assert day == {"sources": {"NYTimes": 1}, "categories": {"Sports": 1}, "dates": {"2026-01-03": 1}}
+
+
+@pytest.mark.asyncio
+async def test_rebuild_replaces_drifted_counts(fake_redis):
+    facets = FacetService(fake_redis)
+    await facets.record([article("Guardian", "Sports"), article("Gone", "Obsolete", "2020-01-01T00:00:00+00:00")])
+
+    db = FakeSession(
+        [("Guardian", 5), ("NYTimes", 1)],
+        [("Sports", 4)],
+        [(TODAY, "Guardian", 5), (TODAY, "NYTimes", 1)],
+        [(TODAY, "Sports", 4)],
+    )
+    assert await facets.rebuild(db) == {"sources": 2, "categories": 1, "dates": 1}
+
+    counts = await facets.get()
+    assert counts == {
+        "sources": {"Guardian": 5, "NYTimes": 1},
+        "categories": {"Sports": 4},
+        "dates": {TODAY.isoformat(): 6},
+    }
+    # Per-day hashes of days no longer in the table are dropped
+    assert await facets.get(day=date(2020, 1, 1)) == {"sources": {}, "categories": {}, "dates": {"2020-01-01": 0}}
+    assert (await facets.get(day=TODAY))["sources"] == {"Guardian": 5, "NYTimes": 1}
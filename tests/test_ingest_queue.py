@@ -0,0 +1,166 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.config import get_settings
+from app.core import database
+from app.services import ingest_queue
+from app.services.ingest_queue import DEAD_STREAM, GROUP, STREAM, IngestQueue, decode_record, encode_record
+from app.services.news_sources.base import IngestRecord
+from app.tasks import ingest_writer
+
+settings = get_settings()
+
+
+def test_stream_payload_round_trips_records():
+    record = IngestRecord.from_upstream(
+        title="Fed holds rates",
+        url="https://example.com/fed",
+        source="Guardian",
+        published_at="2026-03-01T12:30:00Z",
+        description="Summary",
+        category="Business",
+        raw_data={"id": "business/2026/mar/01/fed", "tags": ["economy"]},
+    )
+    decoded = decode_record(encode_record(record))
+    assert decoded == record
+    assert decoded.published_at == datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+def record(title):
+    return IngestRecord.from_upstream(
+        title=title,
+        url=f"https://example.com/{title}",
+        source="Guardian",
+        published_at="2026-03-01T12:30:00Z",
+    )
+
+
+@pytest.fixture
+def queue(fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "INGEST_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "INGEST_BATCH_MAX_WAIT_MS", 10)
+    return IngestQueue(fake_redis)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_bounded_and_acked_entries_leave_the_stream(queue, fake_redis):
+    await queue.ensure_group()
+    await queue.ensure_group()  # BUSYGROUP is ignored
+    await queue.push([record("a"), record("b"), record("c")])
+    assert await queue.backlog() == 3
+
+    batch = await queue.read_batch("writer-1")
+    assert [decode_record(payload).title for _, payload in batch] == ["a", "b"]
+    assert set(fake_redis.pending(STREAM, GROUP)) == {entry_id for entry_id, _ in batch}
+
+    await queue.ack([entry_id for entry_id, _ in batch])
+    assert fake_redis.pending(STREAM, GROUP) == {}
+    assert await queue.backlog() == 1
+    assert [decode_record(payload).title for _, payload in await queue.read_batch("writer-1")] == ["c"]
+
+
+@pytest.mark.asyncio
+async def test_entries_of_a_stalled_writer_are_redelivered(queue, fake_redis):
+    now = [1000.0]
+    fake_redis.clock = lambda: now[0]
+    await queue.ensure_group()
+    await queue.push([record("a"), record("b")])
+
+    # writer-1 takes the batch and dies before acknowledging it
+    batch = await queue.read_batch("writer-1")
+    assert await queue.read_batch("writer-2") == []
+
+    now[0] += settings.INGEST_CLAIM_IDLE_SECONDS
+    assert await queue.read_batch("writer-2") == batch
+    assert set(fake_redis.pending(STREAM, GROUP).values()) == {"writer-2"}
+
+    # Entries deleted meanwhile are dropped from the pending list, not redelivered
+    await fake_redis.xdel(STREAM, batch[0][0])
+    now[0] += settings.INGEST_CLAIM_IDLE_SECONDS
+    assert await queue.read_batch("writer-3") == batch[1:]
+    await queue.ack([batch[1][0]])
+
+    # writer-4 dies holding 23 entries; live writer-5 has since taken over all
+    # but the last, so that one sits behind more than one XAUTOCLAIM scans
+    await queue.push([record(f"r{i}") for i in range(23)])
+    await fake_redis.xreadgroup(GROUP, "writer-4", {STREAM: ">"}, count=23)
+    now[0] += settings.INGEST_CLAIM_IDLE_SECONDS
+    await fake_redis.xautoclaim(STREAM, GROUP, "writer-5", 0, "0-0", count=22)
+
+    writer = IngestQueue(fake_redis)
+    assert await writer.read_batch("writer-6") == []
+    # The next scan resumes behind writer-5's entries
+    assert [decode_record(payload).title for _, payload in await writer.read_batch("writer-6")] == ["r22"]
+    assert writer._claim_cursor == "0-0"
+
+
+@pytest.mark.asyncio
+async def test_fetchers_wait_while_the_backlog_is_full(queue, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "INGEST_MAX_BACKLOG", 2)
+    await queue.ensure_group()
+    await queue.push([record("a"), record("b"), record("c")])
+    delays = []
+
+    async def writer_catches_up(delay):
+        # One entry is written per pause
+        delays.append(delay)
+        entry_id, _ = (await queue.read_batch("writer-1"))[0]
+        await queue.ack([entry_id])
+
+    monkeypatch.setattr(ingest_queue.asyncio, "sleep", writer_catches_up)
+    await queue.wait_for_room()
+    assert delays == [0.5, 1.0]
+    assert await queue.backlog() == 1
+    assert REGISTRY.get_sample_value("ingest_stream_backlog") == 1
+
+
+@pytest.mark.asyncio
+async def test_writer_buries_poison_record_and_acks_the_rest(queue, fake_redis, monkeypatch):
+    stored, committed = [], []
+
+    async def store_records(db, records, story_clusters, redis_client):
+        if any(r.title == "poison" for r in records):
+            raise ValueError("value too long for type character varying(500)")
+        stored.extend(r.title for r in records)
+        return [{"title": r.title} for r in records]
+
+    async def after_commit(read_models, new_articles):
+        committed.extend(article["title"] for article in new_articles)
+
+    @asynccontextmanager
+    async def session():
+        yield None
+
+    class Engine:
+        async def dispose(self):
+            pass
+
+    monkeypatch.setattr(database, "create_db_engine", lambda *args, **kwargs: Engine())
+    monkeypatch.setattr(database, "async_sessionmaker", lambda *args, **kwargs: session)
+    monkeypatch.setattr(ingest_writer, "create_redis_client", lambda **kwargs: fake_redis)
+    monkeypatch.setattr(ingest_writer, "_read_models", lambda redis_client: None)
+    monkeypatch.setattr(ingest_writer, "_store_records", store_records)
+    monkeypatch.setattr(ingest_writer, "_after_commit", after_commit)
+    monkeypatch.setattr(settings, "CACHE_WARMUP_PAGES", 0)
+
+    await queue.ensure_group()
+    await queue.push([record("a"), record("poison")])
+    await fake_redis.xadd(STREAM, {"record": "{not json"})
+    await queue.push([record("b")])
+
+    totals = await ingest_writer._run_ingest_writer_async("writer-1", drain=True)
+    assert totals == {"batches": 2, "records": 4, "inserted": 2, "dead": 2}
+    # The failed batch fell back to one record per transaction
+    assert stored == ["a", "b"]
+    assert committed == ["a", "b"]
+
+    assert await queue.backlog() == 0
+    assert fake_redis.pending(STREAM, GROUP) == {}
+    dead = [fields for _, fields in await fake_redis.xrange(DEAD_STREAM)]
+    assert decode_record(dead[0]["record"]).title == "poison"
+    assert dead[0]["error"] == "value too long for type character varying(500)"
+    assert dead[1]["record"] == "{not json"
+    assert dead[1]["error"].startswith("undecodable: ")
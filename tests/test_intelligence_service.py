@@ -0,0 +1,54 @@
+import re
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from app.services.intelligence_service import IntelligenceService
+
+
+def reference_read_time(text: str) -> int:
+    """The original per-article implementation, kept as the oracle"""
+    if not text:
+        return 1
+    clean_text = re.sub(r'<[^>]*>', ' ', text)
+    words = re.findall(r'\w+', clean_text)
+    word_count = len(words)
+    truncation_match = re.search(r'\[\+(\d+)\s+chars\]', clean_text)
+    if truncation_match:
+        word_count += int(truncation_match.group(1)) // 6
+    return max(3, round(word_count / 225))
+
+
+article_text = st.one_of(
+    st.none(),
+    st.text(),
+    st.lists(
+        st.sampled_from(["word", "<p>", "</p>", "<a href='x'>", " ", "\n", "é", "[+2450 chars]", "[+", "chars]", "<", ">"]),
+        max_size=400,
+    ).map("".join),
+)
+
+
+@given(article_text)
+def test_read_time_matches_reference(text):
+    assert IntelligenceService.calculate_read_time(text) == reference_read_time(text)
+
+
+@pytest.mark.asyncio
+@settings(max_examples=50, deadline=None)
+@given(st.lists(article_text, max_size=30))
+async def test_read_time_many_matches_reference(texts):
+    assert await IntelligenceService.calculate_read_time_many(texts) == [
+        reference_read_time(text) for text in texts
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_time_many_process_pool(monkeypatch):
+    from app.services import intelligence_service
+
+    monkeypatch.setattr(intelligence_service.settings, "READ_TIME_POOL_MIN_CHARS", 0)
+    texts = ["<p>" + "word " * n + "</p>" for n in range(0, 5000, 250)] + [None, "[+900 chars]"]
+    assert await IntelligenceService.calculate_read_time_many(texts) == [
+        reference_read_time(text) for text in texts
+    ]
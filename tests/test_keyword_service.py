@@ -0,0 +1,39 @@
+import math
+from collections import Counter
+
+import pytest
+
+from app.services.keyword_service import document_terms, entities, score_batch
+
+
+def test_entities_drop_sentence_start_noise():
+    assert entities("In New York City, Federal Reserve chair Jerome Powell spoke.") == [
+        "new york city", "federal reserve", "jerome powell"
+    ]
+
+
+def test_score_batch_prefers_rare_terms():
+    docs = [
+        document_terms("Volcano erupts near Reykjavik", "Lava reached the town", None),
+        document_terms("Markets rally in Reykjavik", "Stocks rose sharply", None),
+    ]
+    corpus_df = {"erupts": 900, "near": 5000, "reykjavik": 300, "markets": 4000, "rally": 800}
+    vocabulary, batch_df, top = score_batch(docs, corpus_df, 10000, top_k=3)
+
+    assert batch_df[vocabulary.index("reykjavik")] == 2
+    assert top[0][0][0] == "volcano"
+    assert "markets" not in [term for term, _ in top[1]]
+
+
+def test_score_batch_only_ranks_each_documents_own_terms():
+    docs = [Counter({"volcano": 2, "lava": 1}), Counter({"markets": 1}), Counter()]
+    vocabulary, batch_df, top = score_batch(docs, {"lava": 99}, 100, top_k=5)
+
+    assert vocabulary == ["lava", "markets", "volcano"]
+    assert batch_df.tolist() == [1, 1, 1]
+    idf = math.log(104 / 2) + 1
+    assert [term for term, _ in top[0]] == ["volcano", "lava"]
+    assert top[0][0][1] == pytest.approx(math.log1p(2) * idf, rel=1e-5)
+    assert top[0][1][1] == pytest.approx(math.log1p(1) * (math.log(104 / 101) + 1), rel=1e-5)
+    assert [term for term, _ in top[1]] == ["markets"]
+    assert top[2] == []
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints import live
+from app.config import get_settings
+from app.services.live_feed import LiveFeedHub, Subscription
+
+settings = get_settings()
+
+GUARDIAN_TECH = {"id": 1, "source": "Guardian", "category": "Technology"}
+NYT_SCIENCE = {"id": 2, "source": "NYTimes", "category": "Science"}
+
+
+def test_subscription_filters():
+    assert Subscription().wants(GUARDIAN_TECH)
+    assert Subscription(sources=frozenset({"Guardian"})).wants(GUARDIAN_TECH)
+    assert not Subscription(sources=frozenset({"Guardian"})).wants(NYT_SCIENCE)
+    assert Subscription(categories=frozenset({"science"})).wants(NYT_SCIENCE)
+    assert not Subscription(categories=frozenset({"science"})).wants(GUARDIAN_TECH)
+
+
+def test_fan_out_only_delivers_matching_articles():
+    hub = LiveFeedHub()
+    everything = Subscription()
+    science = Subscription(categories=frozenset({"science"}))
+    hub._subscriptions.update({everything, science})
+
+    hub.publish_local([GUARDIAN_TECH, NYT_SCIENCE])
+
+    assert everything.queue.qsize() == 2
+    assert science.queue.get_nowait() == NYT_SCIENCE
+    assert science.queue.empty()
+
+
+def test_slow_clients_drop_instead_of_blocking():
+    hub = LiveFeedHub()
+    slow = Subscription()
+    hub._subscriptions.add(slow)
+
+    hub.publish_local([dict(GUARDIAN_TECH, id=i) for i in range(slow.queue.maxsize + 5)])
+
+    assert slow.queue.full()
+    assert slow.dropped == 5
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    hub = LiveFeedHub()
+
+    async def listen():
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(hub, "_listen", listen)
+    monkeypatch.setattr(live, "hub", hub)
+    return hub
+
+
+@pytest.mark.asyncio
+async def test_sse_client_leaving_before_the_stream_starts_holds_no_slot(hub):
+    response = await live.live_feed(source=["Guardian"], category=None)
+    await response.body_iterator.aclose()
+    assert hub.client_count == 0
+
+
+@pytest.mark.asyncio
+async def test_sse_client_is_subscribed_while_streaming(hub, monkeypatch):
+    response = await live.live_feed(source=["Guardian"], category=None)
+    assert (await response.body_iterator.__anext__()).startswith("retry: ")
+    assert hub.client_count == 1
+
+    monkeypatch.setattr(settings, "LIVE_FEED_MAX_CLIENTS", 1)
+    with pytest.raises(HTTPException) as exc:
+        await live.live_feed(source=None, category=None)
+    assert exc.value.status_code == 503
+
+    await response.body_iterator.aclose()
+    assert hub.client_count == 0
@@ -0,0 +1,61 @@
+import io
+import json
+import logging
+
+import pytest
+
+from app.core.logger import get_logger, setup_logging, stop_logging
+
+
+@pytest.fixture
+def log_output():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    stream = io.StringIO()
+    yield stream
+    stop_logging()
+    root.handlers, root.level = handlers, level
+
+
+def _lines(stream):
+    stop_logging()  # Drains the queue
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_are_written_as_json_with_extras(log_output):
+    setup_logging(level="INFO", levels={}, sampling={}, json_format=True, stream=log_output)
+    get_logger("app.test").info("Added %d articles", 3, extra={"source": "Guardian"})
+    get_logger("app.test").debug("filtered out")
+
+    [entry] = _lines(log_output)
+    assert entry["message"] == "Added 3 articles"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.test"
+    assert entry["source"] == "Guardian"
+
+
+def test_per_logger_levels_and_sampling(log_output):
+    setup_logging(
+        level="INFO",
+        levels={"app.verbose": "DEBUG"},
+        sampling={"app.sampled": 0.0},
+        json_format=True,
+        stream=log_output,
+    )
+    get_logger("app.verbose.module").debug("kept: level override")
+    get_logger("app.sampled.module").info("dropped: sampled out")
+    get_logger("app.sampled.module").error("kept: errors are never sampled")
+
+    messages = [entry["message"] for entry in _lines(log_output)]
+    assert messages == ["kept: level override", "kept: errors are never sampled"]
+    assert not get_logger("app.sampled.module").isEnabledFor(logging.INFO)
+
+
+def test_stop_logging_restores_logging_globals(log_output):
+    before = (logging._srcfile, logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+    setup_logging(level="INFO", levels={}, sampling={}, json_format=True, stream=log_output)
+    setup_logging(level="INFO", levels={}, sampling={}, json_format=True, stream=log_output)
+    assert (logging._srcfile, logging.logThreads) == (None, False)
+
+    stop_logging()
+    assert (logging._srcfile, logging.logThreads, logging.logProcesses, logging.logMultiprocessing) == before
@@ -0,0 +1,41 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import MetricsMiddleware, cache_tier, instrument_engine
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_cache_tier_has_bounded_cardinality():
+    assert cache_tier("articles:search:0123abcd") == "articles:search"
+    assert cache_tier("plain") == "plain"
+
+
+def test_request_latency_is_labelled_by_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    before = _sample("http_request_duration_seconds_count", method="GET", route="/items/{item_id}", status="200")
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    assert _sample("http_request_duration_seconds_count", method="GET", route="/items/{item_id}", status="200") == before + 2
+    assert _sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404") >= 1
+
+
+def test_engine_events_time_statements():
+    engine = instrument_engine(create_engine("sqlite://"))
+    before = _sample("db_query_duration_seconds_count", statement="select")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert _sample("db_query_duration_seconds_count", statement="select") == before + 1
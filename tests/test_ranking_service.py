@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+
+from app.services.ranking_service import rank_score
+
+NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def test_fresher_articles_score_higher():
+    fresh = rank_score("Guardian", NOW - timedelta(hours=1), now=NOW)
+    stale = rank_score("Guardian", NOW - timedelta(hours=30), now=NOW)
+    assert fresh > stale > 0
+
+
+def test_score_halves_every_half_life():
+    from app.config import get_settings
+    half_life = get_settings().RANK_HALF_LIFE_HOURS
+    new = rank_score("Other", NOW, now=NOW)
+    old = rank_score("Other", NOW - timedelta(hours=half_life), now=NOW)
+    assert abs(old - new / 2) < 1e-6
+
+
+def test_cluster_size_and_read_time_boost():
+    base = rank_score("Other", NOW, now=NOW)
+    assert rank_score("Other", NOW, cluster_size=4, now=NOW) > base
+    assert rank_score("Other", NOW, read_time_minutes=8, now=NOW) > base
+    # Read time credit is capped
+    assert rank_score("Other", NOW, read_time_minutes=10, now=NOW) == rank_score("Other", NOW, read_time_minutes=60, now=NOW)
+
+
+def test_source_weights_apply():
+    assert rank_score("NYTimes", NOW, now=NOW) > rank_score("NewsAPI", NOW, now=NOW)
+
+
+def test_future_and_missing_dates_do_not_explode():
+    assert rank_score("Other", NOW + timedelta(hours=2), now=NOW) == rank_score("Other", NOW, now=NOW)
+    assert rank_score("Other", None, now=NOW) > 0
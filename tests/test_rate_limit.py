@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.core import rate_limit as rate_limit_module
+from app.core.load_shedding import PoolOverloaded, SheddingQueuePool
+from app.core.rate_limit import SYNC_PENDING_KEY, rate_limit
+
+
+def test_rate_limit_rejects_with_retry_after(monkeypatch):
+    calls = []
+
+    async def allow(self, key, per_minute, burst):
+        calls.append((key, per_minute, burst))
+        return len(calls) <= 2, 1.2
+
+    monkeypatch.setattr(rate_limit_module.RateLimiter, "__init__", lambda self, redis_client: None)
+    monkeypatch.setattr(rate_limit_module.RateLimiter, "allow", allow)
+
+    router = APIRouter(dependencies=[Depends(rate_limit)])
+
+    @router.get("/api/v1/articles/{article_id}")
+    async def article(article_id: int):
+        return {"id": article_id}
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    assert [client.get(f"/api/v1/articles/{i}").status_code for i in range(3)] == [200, 200, 429]
+    assert client.get("/api/v1/articles/9").headers["retry-after"] == "2"
+    # One bucket per route template and client, not per URL
+    assert {key for key, _, _ in calls} == {"ratelimit:/api/v1/articles/{article_id}:testclient"}
+
+
+def test_saturated_pool_sheds_instead_of_queueing():
+    pool = SheddingQueuePool(lambda: None, pool_size=1, max_overflow=0)
+    assert not pool.overloaded()
+
+    # Every connection is out and recent checkouts waited far too long
+    pool._overflow = 0
+    pool.wait_average = 5.0
+    pool._waited_at = time.monotonic()
+    assert pool.overloaded()
+    with pytest.raises(PoolOverloaded):
+        pool._do_get()
+
+    # Shedding stops once no slow checkout happened within the window
+    pool._waited_at = time.monotonic() - 3600
+    assert not pool.overloaded()
+
+
+class _Cache:
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+
+@pytest.mark.asyncio
+async def test_failed_sync_publish_releases_the_claim(fake_redis, monkeypatch):
+    from app.api.v1.endpoints.articles import trigger_sync
+    from app.tasks import celery_app
+    sent = []
+
+    def broker_down(name):
+        raise ConnectionError("broker unreachable")
+
+    monkeypatch.setattr(celery_app, "send_task", broker_down)
+    with pytest.raises(HTTPException) as exc:
+        await trigger_sync(_Cache(fake_redis))
+    assert exc.value.status_code == 503
+    assert not await fake_redis.exists(SYNC_PENDING_KEY)
+
+    monkeypatch.setattr(celery_app, "send_task", sent.append)
+    assert (await trigger_sync(_Cache(fake_redis)))["message"] == "Synchronization triggered"
+    assert (await trigger_sync(_Cache(fake_redis)))["message"] == "Synchronization already pending"
+    assert sent == ["fetch_all_sources"]
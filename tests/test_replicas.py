@@ -0,0 +1,66 @@
+import asyncio
+
+from sqlalchemy.engine import make_url
+
+from app.core.replicas import ReplicaRouter
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def __aenter__(self):
+        if self.engine.down:
+            raise OSError("connection refused")
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def scalar(self, query):
+        return self.engine.lag
+
+
+class FakeEngine:
+    def __init__(self, lag=0.0, down=False):
+        self.lag = lag
+        self.down = down
+        self.url = make_url("postgresql+asyncpg://news@replica/news")
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+def test_reads_round_robin_across_replicas_and_skip_failed_probes():
+    async def run():
+        primary, first, second, broken = FakeEngine(), FakeEngine(), FakeEngine(), FakeEngine(down=True)
+        router = ReplicaRouter(primary, [first, second, broken])
+        await router.check()
+        picked = [router.engine_for_read() for _ in range(4)]
+        assert set(picked) == {first, second}
+        assert picked[0] is not picked[1]
+
+        first.down = second.down = True
+        await router.check()
+        assert router.engine_for_read() is primary
+
+    asyncio.run(run())
+
+
+def test_lag_aware_reads_fall_back_to_primary():
+    async def run():
+        primary, replica = FakeEngine(), FakeEngine(lag=12.0)
+        router = ReplicaRouter(primary, [replica])
+        await router.check()
+        assert router.engine_for_read(max_lag=60) is replica
+        assert router.engine_for_read(max_lag=5) is primary
+
+        router.mark_down(replica)
+        assert router.engine_for_read(max_lag=60) is primary
+
+    asyncio.run(run())
+
+
+def test_without_replicas_everything_reads_the_primary():
+    primary = FakeEngine()
+    assert ReplicaRouter(primary, []).engine_for_read() is primary
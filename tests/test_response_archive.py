@@ -0,0 +1,107 @@
+import gzip
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.config import get_settings
+from app.core import database
+from app.core.response_archive import ResponseArchive, archive_files
+from app.services.article_service import ArticleService
+from app.tasks import fetch_articles, replay_archive
+from app.tasks.replay_archive import _UNREADABLE, _replay_file
+
+settings = get_settings()
+
+PAYLOAD = json.dumps({
+    "response": {
+        "results": [
+            {
+                "webTitle": f"Story {i}",
+                "webUrl": f"https://example.com/{i}",
+                "webPublicationDate": "2026-01-01T10:00:00Z",
+                "sectionName": "Sport",
+                "fields": {"body": "<p>text</p>", "trailText": "t"},
+            }
+            for i in range(3)
+        ],
+    }
+}).encode()
+
+
+def test_archived_response_replays_like_a_live_fetch(tmp_path):
+    archive = ResponseArchive(str(tmp_path))
+    writer = archive.open("GuardianSource", "a" * 40, "https://content.guardianapis.com/search", {"section": "sport"}, "Sports")
+    for start in range(0, len(PAYLOAD), 100):
+        writer.write(PAYLOAD[start:start + 100])
+    path = writer.commit()
+
+    dropped = archive.open("GuardianSource", "b" * 40, "https://content.guardianapis.com/search", {}, "Sports")
+    dropped.write(PAYLOAD)
+    dropped.discard()
+
+    assert archive_files([str(tmp_path)]) == [path]
+    records = _replay_file(path)
+    assert [r.url for r in records] == [f"https://example.com/{i}" for i in range(3)]
+    # Standard category of the fetch task, not the upstream section
+    assert {r.category for r in records} == {"Sports"}
+
+
+def test_truncated_archive_is_unreadable(tmp_path):
+    path = tmp_path / "GuardianSource" / "cut.json.gz"
+    path.parent.mkdir()
+    path.write_bytes(gzip.compress(json.dumps({"source": "GuardianSource"}).encode() + b"\n" + PAYLOAD)[:-40])
+    with pytest.raises(_UNREADABLE):
+        _replay_file(path)
+
+
+@pytest.mark.asyncio
+async def test_replay_batch_is_tagged_in_ingest_sized_chunks(tmp_path, fake_redis, monkeypatch):
+    archive = ResponseArchive(str(tmp_path))
+    for page in range(3):
+        writer = archive.open("GuardianSource", str(page) * 40, "https://content.guardianapis.com/search", {"page": page}, "Sports")
+        writer.write(PAYLOAD.replace(b"example.com/", f"example.com/{page}-".encode()))
+        writer.commit()
+
+    merged, tagged = [], []
+
+    class Articles(ArticleService):
+        async def copy_upsert_records(self, records):
+            merged.append(len(records))
+            return [(i, self.generate_url_hash(r.url)) for i, r in enumerate(records, 1)], []
+
+        async def set_story_clusters(self, assignments):
+            pass
+
+    class Keywords:
+        def __init__(self, db):
+            pass
+
+        async def tag_articles(self, articles):
+            tagged.append(len(articles))
+            return {article_id: [title] for article_id, title, _, _ in articles}
+
+    class Session:
+        async def commit(self):
+            pass
+
+    @asynccontextmanager
+    async def session():
+        yield Session()
+
+    class Engine:
+        async def dispose(self):
+            pass
+
+    monkeypatch.setattr(database, "create_db_engine", lambda *args, **kwargs: Engine())
+    monkeypatch.setattr(database, "async_sessionmaker", lambda *args, **kwargs: session)
+    monkeypatch.setattr(replay_archive, "create_redis_client", lambda **kwargs: fake_redis)
+    monkeypatch.setattr(fetch_articles, "ArticleService", Articles)
+    monkeypatch.setattr(fetch_articles, "KeywordService", Keywords)
+    monkeypatch.setattr(settings, "INGEST_BATCH_SIZE", 4)
+
+    totals = await replay_archive._replay_archive_async([str(tmp_path)], batch_size=9)
+    assert (totals["records"], totals["inserted"]) == (9, 9)
+    # One COPY + merge for the whole batch, tagging bounded by the ingest batch size
+    assert merged == [9]
+    assert tagged == [4, 4, 1]
@@ -0,0 +1,80 @@
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.response_cache import UpstreamResponseCache
+
+ENDPOINT = "https://content.guardianapis.com/search"
+
+
+def _skipped(source):
+    return REGISTRY.get_sample_value("upstream_unchanged_total", {"source": source}) or 0
+
+
+def response(status=200, body=b'{"response": {"results": []}}', **headers):
+    return httpx.Response(status, headers=headers, content=body)
+
+
+@pytest.mark.asyncio
+async def test_conditional_headers_sent_once_validators_are_stored(fake_redis):
+    cache = UpstreamResponseCache(fake_redis)
+    key = cache.request_key(ENDPOINT, {"section": "sport"})
+    assert await cache.conditional_headers("Guardian", key) == {}
+
+    first = response(etag='"v1"', **{"last-modified": "Wed, 01 Jan 2026 10:00:00 GMT"})
+    assert not await cache.is_unchanged("Guardian", key, first)
+    await cache.commit()
+
+    assert await cache.conditional_headers("Guardian", key) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2026 10:00:00 GMT",
+    }
+
+
+@pytest.mark.asyncio
+async def test_not_modified_or_same_body_skips_the_run(fake_redis):
+    cache = UpstreamResponseCache(fake_redis)
+    key = cache.request_key(ENDPOINT, {"section": "sport"})
+    skipped = _skipped("Guardian")
+
+    assert not await cache.is_unchanged("Guardian", key, response())
+    await cache.commit()
+
+    assert await cache.is_unchanged("Guardian", key, response(304, b""))
+    assert await cache.is_unchanged("Guardian", key, response())
+    assert not await cache.is_unchanged("Guardian", key, response(body=b'{"response": {"results": [1]}}'))
+
+    assert cache.skip_rate("Guardian") == (2, 4)
+    assert _skipped("Guardian") - skipped == 2
+    assert await fake_redis.hgetall("upstream:stats:Guardian") == {"requests": "4", "unchanged": "2"}
+
+
+@pytest.mark.asyncio
+async def test_commit_persists_staged_validators(fake_redis):
+    cache = UpstreamResponseCache(fake_redis)
+    key = cache.request_key(ENDPOINT, {"section": "sport"})
+    await cache.is_unchanged("Guardian", key, response(etag='"v1"'))
+    assert await fake_redis.hget(f"upstream:fp:Guardian:{key}", "etag") is None
+
+    await cache.commit()
+    stored = await fake_redis.hgetall(f"upstream:fp:Guardian:{key}")
+    assert stored["etag"] == '"v1"'
+    assert stored["fingerprint"]
+    assert 0 < await fake_redis.pttl(f"upstream:fp:Guardian:{key}") <= cache.TTL * 1000
+
+
+@pytest.mark.asyncio
+async def test_discard_keeps_previous_validators_after_failed_store(fake_redis):
+    cache = UpstreamResponseCache(fake_redis)
+    key = cache.request_key(ENDPOINT, {"section": "sport"})
+    await cache.is_unchanged("Guardian", key, response(etag='"v1"'))
+    await cache.commit()
+
+    # New body fetched, but storing its articles failed
+    assert not await cache.is_unchanged("Guardian", key, response(body=b"{}", etag='"v2"'))
+    cache.discard()
+    await cache.commit()
+
+    assert await cache.conditional_headers("Guardian", key) == {"If-None-Match": '"v1"'}
+    # The same new body is processed again on the next poll
+    assert not await cache.is_unchanged("Guardian", key, response(body=b"{}", etag='"v2"'))
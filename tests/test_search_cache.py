@@ -0,0 +1,90 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.schemas.article import PaginatedArticles
+from app.services import search_cache
+from app.services.search_cache import hot_feeds, search_cache_key, warm_search_cache
+
+
+class FakePipeline:
+    def __init__(self, cache):
+        self.cache = cache
+        self.tags = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.cache.values[key] = json.loads(value)
+
+    def sadd(self, tag, key):
+        self.cache.tags.setdefault(tag, set()).add(key)
+
+    def expire(self, key, ttl):
+        pass
+
+    async def execute(self):
+        pass
+
+
+class FakeCache:
+    def __init__(self):
+        self.values = {}
+        self.tags = {}
+        self.redis = self
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def test_cache_key_depends_on_every_parameter():
+    base = search_cache_key(category="Science", page=1, page_size=12)
+    assert base == search_cache_key(category="Science", page=1, page_size=12)
+    assert base != search_cache_key(category="Science", page=2, page_size=12)
+    assert base != search_cache_key(category="Science", page=1, page_size=12, sort="ranked")
+    assert base.startswith("articles:search:")
+
+
+def test_hot_feeds_cover_homepage_categories_and_sources():
+    feeds = hot_feeds()
+    assert {} in feeds
+    assert {"category": "Technology"} in feeds
+    assert {"source": "Guardian"} in feeds
+
+
+@pytest.mark.asyncio
+async def test_warm_up_writes_the_keys_the_endpoint_reads(monkeypatch):
+    running = 0
+    peak = 0
+
+    async def fake_build(db, page=1, page_size=20, **feed):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if feed.get("source") == "Broken":
+            raise RuntimeError("boom")
+        return PaginatedArticles(articles=[], total=0, page=page, page_size=page_size, total_pages=0)
+
+    @asynccontextmanager
+    async def session_factory():
+        yield None
+
+    monkeypatch.setattr(search_cache, "build_search_page", fake_build)
+    cache = FakeCache()
+    feeds = [{}, {"category": "Science"}, {"source": "Guardian"}, {"source": "Broken"}]
+
+    result = await warm_search_cache(session_factory, cache, feeds=feeds, pages=2, page_size=12, concurrency=2)
+
+    assert result["keys"] == 6
+    assert result["failed"] == 2
+    assert peak <= 2
+    assert search_cache_key(category="Science", page=2, page_size=12) in cache.values
+    assert search_cache_key(page=1, page_size=12) in cache.values
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from app.services.similarity_index import SimilarityIndex, embed
+
+
+@pytest.mark.asyncio
+async def test_related_articles_ranked_by_similarity(tmp_path):
+    index = SimilarityIndex(directory=str(tmp_path), dim=128)
+    await index.record([
+        {"id": 1, "title": "Central bank raises interest rates", "tags": ["inflation", "federal reserve"]},
+        {"id": 2, "title": "Football club signs new striker", "tags": ["transfer", "premier league"]},
+    ])
+    await index.record([
+        {"id": 3, "title": "Interest rates rise again as inflation persists", "tags": ["inflation", "federal reserve"]},
+    ])
+
+    assert index.related(1, limit=2)[0] == 3
+    assert 1 not in index.related(1, limit=5)
+    assert index.related(99) is None
+
+
+def test_rebuild_replaces_index(tmp_path):
+    index = SimilarityIndex(directory=str(tmp_path), dim=64)
+    index.append([(1, embed("Volcano erupts", ["iceland"], dim=64))])
+    assert index.related(1) == []
+
+    index.write_all([
+        (5, embed("Volcano erupts", ["iceland"], dim=64)),
+        (6, embed("Eruption in Iceland", ["iceland", "volcano"], dim=64)),
+    ])
+    assert index.related(1) is None
+    assert index.related(5) == [6]
+
+
+def test_rebuild_keeps_rows_appended_while_it_ran(tmp_path):
+    index = SimilarityIndex(directory=str(tmp_path), dim=64)
+    index.append([(1, embed("Volcano erupts", ["iceland"], dim=64))])
+    since = index.size()
+
+    # Ingested after the rebuild read the database
+    index.append([(7, embed("Eruption in Iceland", ["iceland", "volcano"], dim=64))])
+
+    assert index.write_all([(1, embed("Volcano erupts", ["iceland"], dim=64))], since=since) == 2
+    assert index.size() == 2
+    assert index.related(1) == [7]
+
+
+@pytest.mark.asyncio
+async def test_locked_writes_and_scoring_run_off_the_event_loop(tmp_path, monkeypatch):
+    index = SimilarityIndex(directory=str(tmp_path), dim=64)
+    threads = []
+
+    def tracked(method):
+        def wrapper(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return method(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(index, "append", tracked(index.append))
+    monkeypatch.setattr(index, "related", tracked(index.related))
+
+    await index.record([
+        {"id": 1, "title": "Volcano erupts", "tags": ["iceland"]},
+        {"id": 2, "title": "Eruption in Iceland", "tags": ["iceland", "volcano"]},
+    ])
+    assert await index.related_async(1) == [2]
+    assert threads and threading.main_thread() not in threads
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from app.core.slow_queries import capture_slow_queries, params_shape, statement_shape
+from app.services.article_service import ArticleService
+
+
+def test_statement_shape_collapses_whitespace():
+    assert statement_shape("SELECT a\n  FROM t\n WHERE x = $1 ") == "SELECT a FROM t WHERE x = $1"
+
+
+def test_params_shape_keeps_types_not_values():
+    shape = params_shape(("%biden%", "Guardian", 40, 12, 0, datetime(2026, 1, 1), ["a", "b"], None))
+    assert shape == "like:%..%, str, int~1e1, int~1e1, int:0, datetime, array[2], null"
+    assert params_shape({"q": "%x%", "offset": 2400}) == "q=like:%..%, offset=int~1e3"
+
+
+def test_search_query_builder_is_separate_from_execution():
+    count_query, articles_query = ArticleService.build_search_queries(
+        query="fed", category="Sports", skip=40, limit=20, sort="ranked"
+    )
+    sql = str(articles_query)
+    assert "ORDER BY articles.rank_score DESC NULLS LAST" in sql
+    assert "count(*)" in str(count_query)
+
+
+def test_capture_is_opt_in():
+    from app.config import Settings
+    defaults = Settings.model_fields
+    assert defaults["SLOW_QUERY_THRESHOLD_MS"].default == 0
+    assert defaults["SLOW_QUERY_EXPLAIN_ANALYZE"].default is False
+    assert capture_slow_queries(object()) is None
@@ -0,0 +1,27 @@
+import json
+import subprocess
+import sys
+
+# Worker-only dependencies; importing any of them from the API is a cold-start regression
+WORKER_ONLY = ("celery", "kombu", "httpx", "ijson", "numpy", "app.tasks", "app.services.news_sources")
+
+
+def _import_profile(module: str):
+    """Import `module` in a fresh interpreter; return (seconds, loaded module names)"""
+    script = (
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(json.dumps([time.perf_counter() - started, sorted(sys.modules)]))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    seconds, modules = json.loads(out.strip().splitlines()[-1])
+    return seconds, set(modules)
+
+
+def test_api_import_skips_worker_dependencies():
+    seconds, modules = _import_profile("app.main")
+    leaked = sorted(m for m in modules if any(m == w or m.startswith(w + ".") for w in WORKER_ONLY))
+    assert not leaked, f"app.main imported worker-only modules: {leaked}"
+    # Generous ceiling for slow CI machines; the module check above is the precise guard
+    assert seconds < 10
@@ -0,0 +1,45 @@
+import hashlib
+import json
+
+from app.services.news_sources.guardian import GuardianSource
+from app.services.news_sources.streaming import ItemStreamParser, project
+
+PAYLOAD = json.dumps({
+    "response": {
+        "status": "ok",
+        "results": [
+            {
+                "webTitle": f"Story {i}",
+                "webUrl": f"https://example.com/{i}",
+                "webPublicationDate": "2026-01-01T10:00:00Z",
+                "sectionName": "World news",
+                "fields": {"body": "<p>text</p>" * 50, "bodyText": "text" * 50, "trailText": "t", "score": 1.5},
+            }
+            for i in range(5)
+        ],
+    }
+}).encode()
+
+
+def test_project_keeps_declared_fields_only():
+    item = {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
+    assert project(item, {"a": True, "b": {"c": True}}) == {"a": 1, "b": {"c": 2}}
+    assert project(item, {}) == item
+
+
+def test_stream_parser_matches_whole_document_parse():
+    expected = [
+        project(item, GuardianSource.ITEM_FIELDS)
+        for item in json.loads(PAYLOAD)["response"]["results"]
+    ]
+    for chunk_size in (1, 7, 64, len(PAYLOAD)):
+        parser = ItemStreamParser(GuardianSource.ITEMS_PATH, GuardianSource.ITEM_FIELDS)
+        for offset in range(0, len(PAYLOAD), chunk_size):
+            parser.feed(PAYLOAD[offset:offset + chunk_size])
+        assert parser.close() == expected
+        assert parser.fingerprint == hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def test_stream_parser_empty_body():
+    parser = ItemStreamParser(GuardianSource.ITEMS_PATH, GuardianSource.ITEM_FIELDS)
+    assert parser.close() == []
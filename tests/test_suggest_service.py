@@ -0,0 +1,26 @@
+from app.services.suggest_service import SuggestService, normalize, prefixes, title_prefixes
+
+
+def test_normalize_strips_punctuation_and_case():
+    assert normalize("  U.K.'s  Budget: What's Next? ") == "u k s budget what s next"
+
+
+def test_prefixes_are_bounded():
+    assert prefixes("a") == []
+    assert prefixes("fed") == ["fe", "fed"]
+    assert max(len(p) for p in prefixes("internationalization")) == 12
+
+
+def test_title_prefixes_cover_every_word():
+    keys = title_prefixes("Federal Reserve holds")
+    assert {"fe", "federal", "re", "reserve", "ho"} <= keys
+
+
+def test_match_titles_treats_last_word_as_prefix():
+    members = ["1|Federal Reserve holds rates", "2|Reserve Bank of India", "3|Federal budget"]
+    matches = SuggestService._match_titles(members, ["federal", "re"])
+    assert [m["id"] for m in matches] == [1]
+    assert SuggestService._match_titles(members, ["res"]) == [
+        {"id": 1, "title": "Federal Reserve holds rates"},
+        {"id": 2, "title": "Reserve Bank of India"},
+    ]
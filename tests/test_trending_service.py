@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import get_settings
+from app.services.trending_service import TrendingService
+
+settings = get_settings()
+
+NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def article(article_id, cluster_id, source, tags=()):
+    return {
+        "id": article_id,
+        "story_cluster_id": cluster_id,
+        "source": source,
+        "title": f"Story {article_id}",
+        "tags": list(tags),
+    }
+
+
+@pytest.mark.asyncio
+async def test_top_ranks_clusters_by_articles_and_distinct_sources(fake_redis):
+    trending = TrendingService(fake_redis)
+    await trending.record([
+        article(1, 1, "Guardian", ["rates"]),
+        article(2, 1, "Guardian", ["rates"]),
+        article(3, 1, "Guardian"),
+        article(4, 4, "Guardian", ["election"]),
+        article(5, 4, "NYTimes"),
+    ], now=NOW)
+
+    stories = await trending.top(limit=5)
+    assert [story["cluster_id"] for story in stories] == [4, 1]
+    assert stories[0]["score"] == round(2 + 2 * settings.TRENDING_SOURCE_WEIGHT, 3)
+    assert (stories[0]["article_count"], stories[0]["source_count"]) == (2, 2)
+    assert (stories[1]["article_count"], stories[1]["source_count"]) == (3, 1)
+    # The first article recorded represents its cluster
+    assert stories[0]["article"]["id"] == 4
+    assert await trending.top(limit=1) == stories[:1]
+
+    keywords = await trending.top_keywords()
+    assert keywords == [{"keyword": "rates", "score": 2.0}, {"keyword": "election", "score": 1.0}]
+
+
+@pytest.mark.asyncio
+async def test_scores_decay_per_hour_and_leave_the_window(fake_redis):
+    trending = TrendingService(fake_redis)
+    await trending.record([article(1, 1, "Guardian")], now=NOW)
+    fresh = (await trending.top())[0]["score"]
+
+    await trending.refresh(NOW + timedelta(hours=2))
+    decayed = (await trending.top())[0]["score"]
+    assert decayed == round(fresh * settings.TRENDING_HOURLY_DECAY ** 2, 3)
+
+    # Newer stories outrank older ones with the same coverage
+    await trending.record([article(2, 2, "Guardian")], now=NOW + timedelta(hours=2))
+    assert [story["cluster_id"] for story in await trending.top()] == [2, 1]
+
+    await trending.refresh(NOW + timedelta(hours=settings.TRENDING_WINDOW_HOURS))
+    assert [story["cluster_id"] for story in await trending.top()] == [2]